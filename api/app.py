@@ -3,7 +3,7 @@
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
-from api.db.mongo import mongo
+from api.db.mongo import async_mongo
 from api.routers.root           import router as root_router
 from api.routers.health         import router as health_router
 from api.routers.quiz import router as quiz_router
@@ -19,12 +19,12 @@ app = FastAPI(
 )
 
 @app.on_event("startup")
-def startup_db():
-    mongo.connect()
+async def startup_db():
+    await async_mongo.connect()
 
 @app.on_event("shutdown")
-def shutdown_db():
-    mongo.disconnect()
+async def shutdown_db():
+    await async_mongo.disconnect()
 
 @app.get("/", tags=["Root"])
 def read_root():
@@ -1,19 +1,72 @@
 # api/db/mongo.py
 
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient, ASCENDING, ReturnDocument
 from pymongo.errors import PyMongoError
 from bson import ObjectId
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from uuid import uuid4
 
+# (campo, direção) no formato aceito pelo pymongo
+SortSpec = Sequence[Tuple[str, int]]
+
+# Pool e timeouts padrão (em ms). Podem ser sobrescritos por instância.
+DEFAULT_POOL_OPTIONS: Dict[str, Any] = {
+    "maxPoolSize": 50,
+    "minPoolSize": 0,
+    "maxIdleTimeMS": 60_000,
+    "waitQueueTimeoutMS": 5_000,
+    "serverSelectionTimeoutMS": 3_000,
+    "connectTimeoutMS": 3_000,
+    "socketTimeoutMS": 5_000,
+}
+
+
+def _conflicting_indexes(existing: Dict[str, Dict[str, Any]],
+                         keys: List[Tuple[str, int]],
+                         options: Dict[str, Any]) -> List[str]:
+    """
+    Índices existentes que fariam create_index(keys, **options) falhar:
+    o mesmo nome com outras chaves/unique (ex.: player_1 sem unique) ou as
+    mesmas chaves com outro nome. Precisam ser removidos antes de recriar.
+    """
+    wanted_keys = [(field, int(direction)) for field, direction in keys]
+    conflicts = []
+    for name, info in existing.items():
+        if name == "_id_":
+            continue
+        same_keys = [(field, int(direction)) for field, direction in info["key"]] == wanted_keys
+        if name == options["name"]:
+            if not same_keys or bool(info.get("unique")) != bool(options.get("unique")):
+                conflicts.append(name)
+        elif same_keys:
+            conflicts.append(name)
+    return conflicts
+
+
 class MongoConnector:
     """
     Gerencia conexão, CRUD básico e conversão de ObjectId.
     """
 
-    def __init__(self, uri: str, db_name: str):
+    # Índices garantidos em connect(): coleção -> [(chaves, opções)]
+    INDEXES: Dict[str, List[Tuple[List[Tuple[str, int]], Dict[str, Any]]]] = {
+        "quiz": [
+            ([("phase", ASCENDING)], {"name": "phase_1"}),
+        ],
+        "sessions": [
+            # mesmo nome do índice criado antes sem unique: ensure_indexes recria
+            ([("player", ASCENDING)], {"name": "player_1", "unique": True}),
+        ],
+    }
+
+    def __init__(self, uri: str, db_name: str, **pool_options: Any):
+        """
+        pool_options sobrescreve DEFAULT_POOL_OPTIONS
+        (ex.: maxPoolSize=100, socketTimeoutMS=2000).
+        """
         self.uri = uri
         self.db_name = db_name
+        self.pool_options: Dict[str, Any] = {**DEFAULT_POOL_OPTIONS, **pool_options}
         self.client: Optional[MongoClient] = None
         self.db = None
 
@@ -22,14 +75,35 @@ class MongoConnector:
         Abre conexão com o MongoDB e testa com ping.
         """
         try:
-            self.client = MongoClient(self.uri)
+            self.client = MongoClient(self.uri, **self.pool_options)
             self.client.admin.command("ping")
             self.db = self.client[self.db_name]
             print(f"✅ MongoDB conectado em {self.uri}/{self.db_name}")
-            return True
         except PyMongoError as e:
             print(f"❌ Erro ao conectar no MongoDB: {e}")
             return False
+        # falha aqui não é de conexão: sem o índice único /launch duplica sessões
+        self.ensure_indexes()
+        return True
+
+    def ensure_indexes(self) -> None:
+        """
+        Cria (se ainda não existirem) os índices declarados em INDEXES.
+        create_index é idempotente, então pode rodar a cada connect().
+        Índices conflitantes (mesmo nome com outras opções, ou mesmas chaves
+        com outro nome) são removidos e recriados. Erros são propagados.
+        """
+        for collection, indexes in self.INDEXES.items():
+            for keys, options in indexes:
+                try:
+                    existing = self.db[collection].index_information()
+                    for name in _conflicting_indexes(existing, keys, options):
+                        print(f"🧬 Recriando índice {name} em {collection} como {options['name']}")
+                        self.db[collection].drop_index(name)
+                    self.db[collection].create_index(keys, **options)
+                except PyMongoError as e:
+                    print(f"❌ Falha ao criar índice {options.get('name', keys)} em {collection}: {e}")
+                    raise
 
     def disconnect(self) -> None:
         """
@@ -62,36 +136,88 @@ class MongoConnector:
         except PyMongoError as e:
             return {"success": False, "id": None, "error": str(e)}
 
+    def _cursor(self,
+                collection: str,
+                query: Optional[Dict[str, Any]],
+                projection: Optional[Dict[str, Any]],
+                sort: Optional[SortSpec],
+                limit: int,
+                batch_size: int):
+        """
+        Monta o cursor com projeção, ordenação, limite e batch_size.
+        limit=0 / batch_size=0 mantêm o padrão do driver.
+        """
+        cursor = self.db[collection].find(query or {}, projection)
+        if sort:
+            cursor = cursor.sort(list(sort))
+        if limit:
+            cursor = cursor.limit(limit)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
+
+    @staticmethod
+    def _normalize_id(doc: Dict[str, Any]) -> Dict[str, Any]:
+        if "_id" in doc:
+            doc["_id"] = str(doc["_id"])
+        return doc
+
     def find(self,
              collection: str,
-             query: Dict[str, Any] = {}
+             query: Optional[Dict[str, Any]] = None,
+             *,
+             projection: Optional[Dict[str, Any]] = None,
+             sort: Optional[SortSpec] = None,
+             limit: int = 0,
+             batch_size: int = 0
     ) -> Dict[str, Any]:
         """
         Busca múltiplos documentos. Converte ObjectId para str.
+        projection/sort/limit/batch_size são repassados ao cursor.
         Retorna {'success': bool, 'data': List[Dict], 'error': str | None}.
         """
         try:
-            cursor = self.db[collection].find(query)
-            docs: List[Dict[str, Any]] = []
-            for doc in cursor:
-                doc["_id"] = str(doc["_id"])
-                docs.append(doc)
+            cursor = self._cursor(collection, query, projection, sort, limit, batch_size)
+            docs: List[Dict[str, Any]] = [self._normalize_id(doc) for doc in cursor]
             return {"success": True, "data": docs}
         except PyMongoError as e:
             return {"success": False, "data": [], "error": str(e)}
 
+    def iter_find(self,
+                  collection: str,
+                  query: Optional[Dict[str, Any]] = None,
+                  *,
+                  projection: Optional[Dict[str, Any]] = None,
+                  sort: Optional[SortSpec] = None,
+                  limit: int = 0,
+                  batch_size: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Versão em streaming de find(): entrega um documento por vez,
+        buscando do servidor em lotes de batch_size, sem montar a lista inteira.
+        Erros do driver são propagados (PyMongoError) para o chamador tratar.
+        """
+        cursor = self._cursor(collection, query, projection, sort, limit, batch_size)
+        try:
+            for doc in cursor:
+                yield self._normalize_id(doc)
+        finally:
+            cursor.close()
+
     def find_one(self,
                  collection: str,
-                 query: Dict[str, Any]
+                 query: Dict[str, Any],
+                 *,
+                 projection: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Busca um único documento. Converte ObjectId para str.
         Retorna {'success': bool, 'data': Dict | None, 'error': str | None}.
         """
         try:
-            doc = self.db[collection].find_one(query)
+            doc = self.db[collection].find_one(query, projection)
             if doc:
-                doc["_id"] = str(doc["_id"])
+                self._normalize_id(doc)
             return {"success": True, "data": doc}
         except PyMongoError as e:
             return {"success": False, "data": None, "error": str(e)}
@@ -119,6 +245,55 @@ class MongoConnector:
         except PyMongoError as e:
             return {"success": False, "matched_count": 0, "modified_count": 0, "error": str(e)}
 
+    def find_one_and_update(self,
+                            collection: str,
+                            query: Dict[str, Any],
+                            update: Union[Dict[str, Any], List[Dict[str, Any]]],
+                            *,
+                            projection: Optional[Dict[str, Any]] = None,
+                            upsert: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Atualização atômica com operadores ($inc, $set, ...) ou pipeline,
+        retornando o documento JÁ atualizado. Converte ObjectId para str.
+        Retorna {'success': bool, 'data': Dict | None, 'error': str | None}.
+        """
+        try:
+            doc = self.db[collection].find_one_and_update(
+                query, update,
+                projection=projection,
+                upsert=upsert,
+                return_document=ReturnDocument.AFTER,
+            )
+            if doc:
+                self._normalize_id(doc)
+            return {"success": True, "data": doc}
+        except PyMongoError as e:
+            return {"success": False, "data": None, "error": str(e)}
+
+    def bulk_write(self,
+                   collection: str,
+                   operations: List[Any],
+                   *,
+                   ordered: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Envia várias operações (UpdateOne, ReplaceOne, ...) numa só ida ao servidor.
+        Retorna {'success': bool, 'matched_count': int, 'modified_count': int,
+                 'upserted_count': int, 'error': str | None}.
+        """
+        try:
+            result = self.db[collection].bulk_write(operations, ordered=ordered)
+            return {
+                "success": True,
+                "matched_count": result.matched_count,
+                "modified_count": result.modified_count,
+                "upserted_count": result.upserted_count,
+            }
+        except PyMongoError as e:
+            return {"success": False, "matched_count": 0, "modified_count": 0,
+                    "upserted_count": 0, "error": str(e)}
+
     def delete(self,
                collection: str,
                query: Dict[str, Any]
@@ -134,5 +309,188 @@ class MongoConnector:
             return {"success": False, "deleted_count": 0, "error": str(e)}
 
 
-# Instância global
+class AsyncMongoConnector(MongoConnector):
+    """
+    Variante assíncrona do MongoConnector sobre o AsyncMongoClient nativo
+    do pymongo. Mesma interface e mesmos dicionários de retorno, mas os
+    métodos são corrotinas: as rotas async não ocupam uma thread do
+    threadpool enquanto esperam o banco.
+    """
+
+    def __init__(self, uri: str, db_name: str, **pool_options: Any):
+        super().__init__(uri, db_name, **pool_options)
+        self.client: Optional[AsyncMongoClient] = None
+
+    async def connect(self) -> bool:
+        """
+        Abre conexão com o MongoDB e testa com ping.
+        Deve ser chamado dentro do event loop que vai usar o cliente.
+        """
+        try:
+            self.client = AsyncMongoClient(self.uri, **self.pool_options)
+            await self.client.admin.command("ping")
+            self.db = self.client[self.db_name]
+            print(f"✅ MongoDB (async) conectado em {self.uri}/{self.db_name}")
+        except PyMongoError as e:
+            print(f"❌ Erro ao conectar no MongoDB (async): {e}")
+            return False
+        await self.ensure_indexes()
+        return True
+
+    async def ensure_indexes(self) -> None:
+        for collection, indexes in self.INDEXES.items():
+            for keys, options in indexes:
+                try:
+                    existing = await self.db[collection].index_information()
+                    for name in _conflicting_indexes(existing, keys, options):
+                        print(f"🧬 Recriando índice {name} em {collection} como {options['name']}")
+                        await self.db[collection].drop_index(name)
+                    await self.db[collection].create_index(keys, **options)
+                except PyMongoError as e:
+                    print(f"❌ Falha ao criar índice {options.get('name', keys)} em {collection}: {e}")
+                    raise
+
+    async def disconnect(self) -> None:
+        if self.client:
+            await self.client.close()
+            print("🔌 MongoDB (async) desconectado")
+
+    async def insert(self,
+                     collection: str,
+                     data: Dict[str, Any],
+                     *,
+                     use_uuid: bool = False
+    ) -> Dict[str, Any]:
+        if use_uuid:
+            data["_id"] = uuid4().hex
+
+        try:
+            result = await self.db[collection].insert_one(data)
+            oid = result.inserted_id
+            return {
+                "success": True,
+                "id": str(oid) if isinstance(oid, ObjectId) else oid
+            }
+        except PyMongoError as e:
+            return {"success": False, "id": None, "error": str(e)}
+
+    async def find(self,
+                   collection: str,
+                   query: Optional[Dict[str, Any]] = None,
+                   *,
+                   projection: Optional[Dict[str, Any]] = None,
+                   sort: Optional[SortSpec] = None,
+                   limit: int = 0,
+                   batch_size: int = 0
+    ) -> Dict[str, Any]:
+        try:
+            cursor = self._cursor(collection, query, projection, sort, limit, batch_size)
+            docs: List[Dict[str, Any]] = [self._normalize_id(doc) async for doc in cursor]
+            return {"success": True, "data": docs}
+        except PyMongoError as e:
+            return {"success": False, "data": [], "error": str(e)}
+
+    async def iter_find(self,
+                        collection: str,
+                        query: Optional[Dict[str, Any]] = None,
+                        *,
+                        projection: Optional[Dict[str, Any]] = None,
+                        sort: Optional[SortSpec] = None,
+                        limit: int = 0,
+                        batch_size: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        cursor = self._cursor(collection, query, projection, sort, limit, batch_size)
+        try:
+            async for doc in cursor:
+                yield self._normalize_id(doc)
+        finally:
+            await cursor.close()
+
+    async def find_one(self,
+                       collection: str,
+                       query: Dict[str, Any],
+                       *,
+                       projection: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        try:
+            doc = await self.db[collection].find_one(query, projection)
+            if doc:
+                self._normalize_id(doc)
+            return {"success": True, "data": doc}
+        except PyMongoError as e:
+            return {"success": False, "data": None, "error": str(e)}
+
+    async def update(self,
+                     collection: str,
+                     query: Dict[str, Any],
+                     update_data: Dict[str, Any],
+                     *,
+                     upsert: bool = False
+    ) -> Dict[str, Any]:
+        try:
+            result = await self.db[collection].update_one(
+                query, {"$set": update_data}, upsert=upsert
+            )
+            return {
+                "success": True,
+                "matched_count": result.matched_count,
+                "modified_count": result.modified_count
+            }
+        except PyMongoError as e:
+            return {"success": False, "matched_count": 0, "modified_count": 0, "error": str(e)}
+
+    async def find_one_and_update(self,
+                                  collection: str,
+                                  query: Dict[str, Any],
+                                  update: Union[Dict[str, Any], List[Dict[str, Any]]],
+                                  *,
+                                  projection: Optional[Dict[str, Any]] = None,
+                                  upsert: bool = False
+    ) -> Dict[str, Any]:
+        try:
+            doc = await self.db[collection].find_one_and_update(
+                query, update,
+                projection=projection,
+                upsert=upsert,
+                return_document=ReturnDocument.AFTER,
+            )
+            if doc:
+                self._normalize_id(doc)
+            return {"success": True, "data": doc}
+        except PyMongoError as e:
+            return {"success": False, "data": None, "error": str(e)}
+
+    async def bulk_write(self,
+                         collection: str,
+                         operations: List[Any],
+                         *,
+                         ordered: bool = False
+    ) -> Dict[str, Any]:
+        try:
+            result = await self.db[collection].bulk_write(operations, ordered=ordered)
+            return {
+                "success": True,
+                "matched_count": result.matched_count,
+                "modified_count": result.modified_count,
+                "upserted_count": result.upserted_count,
+            }
+        except PyMongoError as e:
+            return {"success": False, "matched_count": 0, "modified_count": 0,
+                    "upserted_count": 0, "error": str(e)}
+
+    async def delete(self,
+                     collection: str,
+                     query: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        try:
+            result = await self.db[collection].delete_one(query)
+            return {"success": True, "deleted_count": result.deleted_count}
+        except PyMongoError as e:
+            return {"success": False, "deleted_count": 0, "error": str(e)}
+
+
+# Instância global (seed, scripts e código síncrono)
 mongo = MongoConnector("mongodb://localhost:27017", "rpg_emily")
+
+# Instância global usada pelas rotas async da API
+async_mongo = AsyncMongoConnector("mongodb://localhost:27017", "rpg_emily")
@@ -3,9 +3,12 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import Dict, List
 from bson import ObjectId
+from pymongo import UpdateOne
 
-from api.db.mongo import mongo
+from api.db.mongo import async_mongo
+from api.services.xp_service import batch_update_pipeline, score_update_pipeline
 
 router = APIRouter(tags=["Game"])
 
@@ -19,6 +22,7 @@ class LaunchInput(BaseModel):
 class LaunchResponse(BaseModel):
     session_id: str = Field(..., description="ID da sessão (UUID ou ObjectId em string)")
     xp: int         = Field(..., description="XP atual da sessão")
+    level: int      = Field(1, description="Nível atual da sessão")
     max_xp: int     = Field(..., description="XP necessário para o próximo nível")
 
 class ScoreInput(BaseModel):
@@ -27,7 +31,24 @@ class ScoreInput(BaseModel):
 
 class ScoreResponse(BaseModel):
     session_id: str  = Field(..., description="ID da sessão atualizada")
-    new_xp: int      = Field(..., description="XP após a atualização")
+    new_xp: int      = Field(..., description="XP dentro do nível após a atualização")
+    level: int       = Field(..., description="Nível após a atualização")
+    max_xp: int      = Field(..., description="XP necessário para o próximo nível")
+    message: str     = Field(..., description="Mensagem de confirmação")
+
+class XPEvent(BaseModel):
+    session_id: str  = Field(..., description="ID da sessão retornado por /launch")
+    seq: int         = Field(..., gt=0, description="Número de sequência crescente por sessão")
+    added_xp: int    = Field(..., ge=0, description="Quantidade de XP a adicionar")
+
+class BatchScoreInput(BaseModel):
+    events: List[XPEvent] = Field(..., min_length=1, description="Eventos de XP a aplicar")
+
+class BatchScoreResponse(BaseModel):
+    sessions: int    = Field(..., description="Sessões afetadas pelo lote")
+    events: int      = Field(..., description="Eventos distintos recebidos")
+    matched: int     = Field(..., description="Sessões encontradas no banco")
+    rejected: List[str] = Field(default_factory=list, description="session_ids inválidos, ignorados no lote")
     message: str     = Field(..., description="Mensagem de confirmação")
 
 
@@ -36,41 +57,34 @@ class ScoreResponse(BaseModel):
 #
 
 @router.post("/launch", response_model=LaunchResponse)
-def launch_game(input: LaunchInput):
+async def launch_game(input: LaunchInput):
     """
     Cria uma nova sessão para o jogador ou retorna a sessão existente.
+    Upsert atômico sobre o índice único em 'player': uma ida ao banco e
+    nenhuma sessão duplicada mesmo com launches simultâneos.
     """
-    # 2.1) Tenta buscar sessão existente no Mongo
-    find_res = mongo.find("sessions", {"player": input.player})
-    if not find_res["success"]:
-        raise HTTPException(status_code=500, detail=find_res["error"])
-
-    if find_res["data"]:
-        # Pega a primeira sessão encontrada
-        sess = find_res["data"][0]
-        return LaunchResponse(
-            session_id=str(sess["_id"]),
-            xp=sess.get("xp", 0),
-            max_xp=sess.get("max_xp", 100),
-        )
-
-    # 2.2) Se não encontrou, cria nova sessão
-    new_sess = {
-        "player": input.player,
-        "xp": 0,
-        "max_xp": 100,
-        "started_at": datetime.utcnow(),
-    }
-    ins_res = mongo.insert("sessions", new_sess)
-    if not ins_res["success"]:
-        raise HTTPException(status_code=500, detail=ins_res["error"])
-
-    # ins_res["id"] pode ser ObjectId ou string
-    new_id = ins_res["id"]
+    res = await async_mongo.find_one_and_update(
+        "sessions",
+        {"player": input.player},
+        {"$setOnInsert": {
+            "xp": 0,
+            "level": 1,
+            "max_xp": 100,
+            "total_xp": 0,
+            "started_at": datetime.utcnow(),
+        }},
+        projection={"xp": 1, "level": 1, "max_xp": 1},
+        upsert=True,
+    )
+    if not res["success"]:
+        raise HTTPException(status_code=500, detail=res["error"])
+
+    sess = res["data"]
     return LaunchResponse(
-        session_id=str(new_id),
-        xp=0,
-        max_xp=100,
+        session_id=str(sess["_id"]),
+        xp=sess.get("xp", 0),
+        level=sess.get("level", 1),
+        max_xp=sess.get("max_xp", 100),
     )
 
 
@@ -79,9 +93,11 @@ def launch_game(input: LaunchInput):
 #
 
 @router.post("/score", response_model=ScoreResponse)
-def submit_score(input: ScoreInput):
+async def submit_score(input: ScoreInput):
     """
     Recebe session_id e XP a adicionar, atualiza a sessão e retorna o novo XP.
+    Soma e level-up acontecem numa única operação atômica no Mongo, então
+    chamadas concorrentes para a mesma sessão não perdem XP.
     """
     # 3.1) Valida session_id como ObjectId
     try:
@@ -89,31 +105,75 @@ def submit_score(input: ScoreInput):
     except Exception:
         raise HTTPException(status_code=400, detail="session_id inválido")
 
-    # 3.2) Busca sessão existente
-    find_res = mongo.find("sessions", {"_id": oid})
-    if not find_res["success"]:
-        raise HTTPException(status_code=500, detail=find_res["error"])
-    if not find_res["data"]:
-        raise HTTPException(status_code=404, detail="Sessão não encontrada")
-
-    sess = find_res["data"][0]
-    current_xp = sess.get("xp", 0)
-    new_xp = current_xp + input.added_xp
-
-    # 3.3) Atualiza documento no Mongo
-    upd_res = mongo.update(
+    # 3.2) Soma o XP e aplica o level-up no servidor, devolvendo o documento atualizado
+    upd_res = await async_mongo.find_one_and_update(
         "sessions",
         {"_id": oid},
-        {
-            "xp": new_xp,
-            "last_updated": datetime.utcnow()
-        }
+        score_update_pipeline(input.added_xp, datetime.utcnow()),
+        projection={"xp": 1, "level": 1, "max_xp": 1},
     )
     if not upd_res["success"]:
         raise HTTPException(status_code=500, detail=upd_res["error"])
+    if not upd_res["data"]:
+        raise HTTPException(status_code=404, detail="Sessão não encontrada")
 
+    sess = upd_res["data"]
     return ScoreResponse(
         session_id=input.session_id,
-        new_xp=new_xp,
+        new_xp=sess["xp"],
+        level=sess["level"],
+        max_xp=sess["max_xp"],
         message="XP atualizado com sucesso"
     )
+
+
+#
+# 4) Endpoint: /score/batch
+#
+
+@router.post("/score/batch", response_model=BatchScoreResponse)
+async def submit_score_batch(input: BatchScoreInput):
+    """
+    Aplica um lote de eventos de XP numa única escrita em massa.
+    Eventos são idempotentes: cada sessão guarda o maior seq já aplicado
+    e ignora qualquer evento com seq menor ou igual.
+    Sessões com session_id inválido são puladas e listadas em 'rejected',
+    sem derrubar os eventos das outras sessões do lote.
+    """
+    # 4.1) Agrupa por sessão, descartando seq duplicado dentro do lote
+    by_session: Dict[str, Dict[int, int]] = {}
+    for event in input.events:
+        by_session.setdefault(event.session_id, {})[event.seq] = event.added_xp
+
+    now = datetime.utcnow()
+    operations = []
+    rejected = []
+    applied_events = 0
+    for session_id, events in by_session.items():
+        try:
+            oid = ObjectId(session_id)
+        except Exception:
+            rejected.append(session_id)
+            continue
+        ordered_events = [{"seq": seq, "added_xp": xp} for seq, xp in sorted(events.items())]
+        operations.append(UpdateOne({"_id": oid}, batch_update_pipeline(ordered_events, now)))
+        applied_events += len(ordered_events)
+
+    if rejected:
+        print(f"⚠️ Lote de XP: {len(rejected)} session_id(s) inválido(s) ignorado(s): {rejected}")
+
+    # 4.2) Uma ida ao banco para todas as sessões válidas
+    matched = 0
+    if operations:
+        bulk_res = await async_mongo.bulk_write("sessions", operations)
+        if not bulk_res["success"]:
+            raise HTTPException(status_code=500, detail=bulk_res["error"])
+        matched = bulk_res["matched_count"]
+
+    return BatchScoreResponse(
+        sessions=len(operations),
+        events=applied_events,
+        matched=matched,
+        rejected=rejected,
+        message="Lote de XP aplicado com sucesso" if not rejected else "Lote de XP aplicado parcialmente"
+    )
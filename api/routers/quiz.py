@@ -1,12 +1,23 @@
 # api/routers/quiz_generator.py
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 from typing import List, Optional
-from api.db.mongo import mongo
+from api.db.mongo import async_mongo
+from api.services.quiz_cache import phase_cache
 
 router = APIRouter(tags=["Quiz"])
 
+# Apenas os campos expostos pelo modelo Question
+QUESTION_PROJECTION = {
+    "_id": 1,
+    "phase": 1,
+    "question": 1,
+    "options": 1,
+    "answer": 1,
+    "example": 1,
+}
+
 class Question(BaseModel):
     """
     Modelo de resposta para uma pergunta já persistida.
@@ -34,25 +45,32 @@ class QuestionCreate(BaseModel):
     summary="Buscar perguntas de uma fase",
     description="Retorna todas as questões cadastradas para a fase indicada"
 )
-def get_quiz(phase: int):
-    # Busca TODOS os campos incluindo 'example'
-    res = mongo.find("quiz", {"phase": phase})
-    if not res["success"]:
-        raise HTTPException(status_code=500, detail=res["error"])
-    
-    # Log para debug
-    questions = res["data"]
-    print(f"🔍 API: Retornando {len(questions)} perguntas para fase {phase}")
-    if questions:
-        first_question = questions[0]
-        print(f"🔍 API: Primeira pergunta - {first_question.get('question', '')[:50]}...")
-        print(f"🔍 API: Campos disponíveis: {list(first_question.keys())}")
-        if 'example' in first_question:
-            print(f"✅ API: Campo 'example' encontrado: {first_question['example'][:100]}...")
-        else:
-            print("❌ API: Campo 'example' NÃO encontrado!")
-    
-    return questions
+async def get_quiz(phase: int, request: Request, response: Response):
+    entry = phase_cache.get(phase)
+    if entry is None:
+        # Usa o índice em 'phase' e traz só os campos do modelo (incluindo 'example')
+        res = await async_mongo.find(
+            "quiz",
+            {"phase": phase},
+            projection=QUESTION_PROJECTION,
+        )
+        if not res["success"]:
+            raise HTTPException(status_code=500, detail=res["error"])
+        entry = phase_cache.put(phase, res["data"])
+
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": entry.last_modified_http,
+        "Cache-Control": "no-cache",
+    }
+    if entry.not_modified(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+    ):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return entry.questions
 
 @router.post(
     "/quiz",
@@ -61,12 +79,13 @@ def get_quiz(phase: int):
     summary="Criar nova pergunta",
     description="Insere uma nova questão no banco e retorna o registro criado"
 )
-def create_question(q: QuestionCreate):
+async def create_question(q: QuestionCreate):
     payload = q.dict()
     # use_uuid=True faz _id = uuid4().hex
-    ins = mongo.insert("quiz", payload, use_uuid=True)
+    ins = await async_mongo.insert("quiz", payload, use_uuid=True)
     if not ins["success"]:
         raise HTTPException(status_code=500, detail=ins["error"])
     # Anexa o _id retornado ao payload para enviar como resposta
     payload["_id"] = ins["id"]
-    return payload
\ No newline at end of file
+    phase_cache.invalidate(q.phase)
+    return payload
@@ -0,0 +1,107 @@
+# api/services/quiz_cache.py
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+
+class PhaseCacheEntry:
+    """
+    Perguntas de uma fase já carregadas, com os validadores HTTP.
+    """
+
+    __slots__ = ("questions", "etag", "last_modified", "expires_at")
+
+    def __init__(self, questions: List[Dict[str, Any]], ttl: float):
+        self.questions = questions
+        payload = json.dumps(questions, sort_keys=True, default=str).encode("utf-8")
+        self.etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+        # Last-Modified tem resolução de segundos
+        self.last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+        self.expires_at = time.monotonic() + ttl
+
+    @property
+    def last_modified_http(self) -> str:
+        return format_datetime(self.last_modified, usegmt=True)
+
+    def not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """
+        Avalia um GET condicional. If-None-Match tem precedência sobre
+        If-Modified-Since (RFC 9110).
+        """
+        if if_none_match:
+            tags = [t.strip() for t in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags or f"W/{self.etag}" in tags
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return self.last_modified <= since
+        return False
+
+
+class PhaseQuestionCache:
+    """
+    Cache em memória das perguntas por fase, com TTL e limite LRU.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_phases: int = 32):
+        self.ttl = ttl
+        self.max_phases = max_phases
+        self._entries: "OrderedDict[int, PhaseCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, phase: int) -> Optional[PhaseCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(phase)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                # Mantém a entrada expirada só para put() reaproveitar o Last-Modified
+                self.misses += 1
+                return None
+            self._entries.move_to_end(phase)
+            self.hits += 1
+            return entry
+
+    def put(self, phase: int, questions: List[Dict[str, Any]]) -> PhaseCacheEntry:
+        entry = PhaseCacheEntry(questions, self.ttl)
+        with self._lock:
+            previous = self._entries.get(phase)
+            if previous is not None and previous.etag == entry.etag:
+                # Conteúdo igual após expirar o TTL: não "modifica" a fase
+                entry.last_modified = previous.last_modified
+            self._entries[phase] = entry
+            self._entries.move_to_end(phase)
+            while len(self._entries) > self.max_phases:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, phase: Optional[int] = None) -> None:
+        """
+        Remove uma fase do cache (ou todas, se phase=None).
+        """
+        with self._lock:
+            if phase is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(phase, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"phases": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Instância global usada pelo router de quiz
+phase_cache = PhaseQuestionCache()
@@ -0,0 +1,81 @@
+# api/services/xp_service.py
+
+from typing import Any, Dict, List
+
+# Mesma regra do XPBar.add_xp: o nível N exige 100×N XP.
+XP_PER_LEVEL = 100
+
+
+def score_update_pipeline(added_xp: int, now: Any) -> List[Dict[str, Any]]:
+    """
+    Pipeline de update (MongoDB >= 4.2) que soma `added_xp` e aplica a regra
+    de level-up no próprio servidor, numa única operação atômica.
+
+    O loop do XPBar vira forma fechada sobre o XP acumulado T:
+        nível = floor((1 + sqrt(1 + 8T/100)) / 2)
+    com um ajuste de ±1 para absorver erro de ponto flutuante do sqrt.
+    Sessões antigas sem 'level' têm o nível derivado de max_xp.
+    """
+    step = XP_PER_LEVEL
+    level = {"$max": [1, {"$ifNull": [
+        "$level",
+        {"$floor": {"$divide": [{"$ifNull": ["$max_xp", step]}, step]}},
+    ]}]}
+
+    def base(n: Any) -> Dict[str, Any]:
+        # XP acumulado no início do nível n: step × n × (n-1) / 2
+        return {"$divide": [{"$multiply": [step, n, {"$subtract": [n, 1]}]}, 2]}
+
+    guess = {"$floor": {"$divide": [
+        {"$add": [1, {"$sqrt": {"$add": [1, {"$divide": [{"$multiply": [8, "$_total_xp"]}, step]}]}}]},
+        2,
+    ]}}
+
+    return [
+        {"$set": {
+            "_total_xp": {"$add": [
+                base(level),
+                {"$max": [0, {"$ifNull": ["$xp", 0]}]},
+                added_xp,
+            ]},
+        }},
+        {"$set": {"_level": guess}},
+        {"$set": {"_level": {"$switch": {
+            "branches": [
+                {"case": {"$gt": [base("$_level"), "$_total_xp"]},
+                 "then": {"$subtract": ["$_level", 1]}},
+                {"case": {"$lte": [base({"$add": ["$_level", 1]}), "$_total_xp"]},
+                 "then": {"$add": ["$_level", 1]}},
+            ],
+            "default": "$_level",
+        }}}},
+        {"$set": {
+            "level": {"$toInt": "$_level"},
+            "xp": {"$toInt": {"$subtract": ["$_total_xp", base("$_level")]}},
+            "max_xp": {"$toInt": {"$multiply": ["$_level", step]}},
+            "total_xp": {"$toLong": "$_total_xp"},
+            "last_updated": now,
+        }},
+        {"$unset": ["_total_xp", "_level"]},
+    ]
+
+
+def batch_update_pipeline(events: List[Dict[str, int]], now: Any) -> List[Dict[str, Any]]:
+    """
+    Pipeline que aplica um lote de eventos {seq, added_xp} de uma sessão.
+    Só eventos com seq acima de 'last_seq' da sessão contam, então reenviar
+    um lote (retry do cliente) não soma XP duas vezes.
+    """
+    last_seq = {"$ifNull": ["$last_seq", 0]}
+    pending = {"$filter": {
+        "input": {"$literal": events},
+        "cond": {"$gt": ["$$this.seq", last_seq]},
+    }}
+    return [
+        {"$set": {
+            "_batch_xp": {"$sum": {"$map": {"input": pending, "in": "$$this.added_xp"}}},
+            "last_seq": {"$max": [last_seq, max(e["seq"] for e in events)]},
+        }},
+        *score_update_pipeline("$_batch_xp", now),
+        {"$unset": "_batch_xp"},
+    ]
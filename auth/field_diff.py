@@ -0,0 +1,53 @@
+# auth/field_diff.py
+
+import copy
+from typing import Any, Dict
+
+
+def _is_counter(value: Any) -> bool:
+    # bool é subclasse de int, mas não deve virar $inc
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _safe_keys(data: dict) -> bool:
+    """Chaves que podem virar caminho com ponto no MongoDB"""
+    return all(isinstance(k, str) and k and "." not in k and not k.startswith("$") for k in data)
+
+
+def _diff(old: dict, new: dict, prefix: str, ops: Dict[str, dict]):
+    for key, value in new.items():
+        path = f"{prefix}{key}"
+        if key not in old:
+            ops["$set"][path] = value
+            continue
+        previous = old[key]
+        if previous == value:
+            continue
+        if isinstance(previous, dict) and isinstance(value, dict) and _safe_keys(previous) and _safe_keys(value):
+            _diff(previous, value, path + ".", ops)
+        elif _is_counter(previous) and _is_counter(value):
+            ops["$inc"][path] = value - previous
+        else:
+            ops["$set"][path] = value
+
+    for key in old:
+        if key not in new:
+            ops["$unset"][f"{prefix}{key}"] = ""
+
+
+def diff_update(old: dict, new: dict) -> Dict[str, dict]:
+    """
+    Monta o update mínimo ($set/$inc/$unset) que leva o documento `old`
+    ao estado `new`, descendo em dicts aninhados. Contadores inteiros viram
+    $inc com o delta. Retorna {} se nada mudou.
+    """
+    if not (_safe_keys(old) and _safe_keys(new)):
+        return {"$set": {k: v for k, v in new.items() if k != "_id"}}
+    ops: Dict[str, dict] = {"$set": {}, "$inc": {}, "$unset": {}}
+    _diff(old, new, "", ops)
+    return {op: fields for op, fields in ops.items() if fields}
+
+
+def snapshot(data: dict) -> dict:
+    """Cópia profunda usada como base do próximo diff"""
+    return copy.deepcopy(data)
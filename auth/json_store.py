@@ -0,0 +1,280 @@
+# auth/json_store.py
+
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# string JSON no início de uma linha (o byte '"' nunca aparece dentro de um
+# caractere UTF-8 multibyte, então dá para achar o fim da chave sem decodificar)
+_JSON_KEY = re.compile(rb'"(?:[^"\\]|\\.)*"')
+
+_JOURNAL_PREFIX = b'{"user":'
+_JOURNAL_DATA = b',"data":'
+_JOURNAL_DELETED = b',"deleted":true}'
+
+# (arquivo, offset em bytes, tamanho) do registro mais recente de um usuário
+RecordRef = Tuple[str, int, int]
+
+
+class JournalUserStore:
+    """
+    Armazenamento local dos usuários em snapshot + journal.
+
+    - snapshot (users.json): estado completo, reescrito só na compactação,
+      de forma atômica (arquivo temporário + os.replace). Continua sendo um
+      objeto JSON válido, mas com um usuário por linha.
+    - journal (users.json.journal): uma linha JSON por alteração de usuário,
+      só com append. Salvar um usuário custa O(tamanho daquele usuário).
+
+    Em memória fica só o índice username -> (arquivo, offset, tamanho) do
+    registro mais recente; get() lê e decodifica apenas aquele trecho. Quando
+    o journal passa de `compact_every` linhas, os registros são copiados em
+    fluxo para um novo snapshot, sem decodificar os documentos.
+    """
+
+    def __init__(self, snapshot_path: str, journal_path: Optional[str] = None, compact_every: int = 200):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or snapshot_path + ".journal"
+        self.compact_every = compact_every
+        self._journal_entries = 0
+        self._offsets: Optional[Dict[str, RecordRef]] = None
+        self._lock = threading.RLock()
+
+    def _ensure_directory(self):
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    # ---------- índice ----------
+
+    def _scan_snapshot(self, offsets: Dict[str, RecordRef]) -> bool:
+        """
+        Indexa o snapshot linha a linha. Devolve False se o arquivo não está
+        no formato de um usuário por linha (ex.: JSON indentado antigo).
+        """
+        if not os.path.exists(self.snapshot_path):
+            return True
+        with open(self.snapshot_path, 'rb') as f:
+            first = f.readline()
+            if not first.strip():
+                return True
+            if first != b"{\n":
+                return False
+            pos = len(first)
+            for line in f:
+                start = pos
+                pos += len(line)
+                body = line.rstrip(b"\r\n")
+                if body == b"}":
+                    return True
+                match = _JSON_KEY.match(body)
+                if not match or body[match.end():match.end() + 2] != b": ":
+                    return False
+                if body.endswith(b","):
+                    body = body[:-1]
+                value_start = match.end() + 2
+                offsets[json.loads(match.group())] = (
+                    self.snapshot_path, start + value_start, len(body) - value_start
+                )
+        # sem a chave de fechamento: snapshot truncado
+        return False
+
+    def _scan_journal(self, offsets: Dict[str, RecordRef]) -> int:
+        """Aplica o journal sobre `offsets` e devolve quantas linhas válidas leu"""
+        if not os.path.exists(self.journal_path):
+            return 0
+        count = 0
+        with open(self.journal_path, 'rb') as f:
+            pos = 0
+            for line in f:
+                start = pos
+                pos += len(line)
+                if not line.endswith(b"\n"):
+                    # linha parcial de uma escrita interrompida: ignora
+                    continue
+                body = line.rstrip(b"\r\n")
+                if not body.startswith(_JOURNAL_PREFIX):
+                    continue
+                match = _JSON_KEY.match(body, len(_JOURNAL_PREFIX))
+                if not match:
+                    continue
+                username = json.loads(match.group())
+                rest = body[match.end():]
+                if rest == _JOURNAL_DELETED:
+                    offsets.pop(username, None)
+                elif rest.startswith(_JOURNAL_DATA) and rest.endswith(b"}"):
+                    value_start = match.end() + len(_JOURNAL_DATA)
+                    offsets[username] = (self.journal_path, start + value_start, len(body) - 1 - value_start)
+                else:
+                    continue
+                count += 1
+        return count
+
+    def _index(self) -> Dict[str, RecordRef]:
+        """Índice username -> registro; os arquivos são varridos só na primeira vez"""
+        if self._offsets is None:
+            offsets: Dict[str, RecordRef] = {}
+            if not self._scan_snapshot(offsets):
+                self._convert_legacy_snapshot()
+                offsets = {}
+                self._scan_snapshot(offsets)
+            self._journal_entries = self._scan_journal(offsets)
+            self._offsets = offsets
+        return self._offsets
+
+    def _convert_legacy_snapshot(self):
+        """Reescreve uma única vez um snapshot antigo (JSON indentado) no formato por linha"""
+        with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+            users = json.load(f)
+        print(f"🧬 Convertendo {self.snapshot_path} para um usuário por linha ({len(users)} usuários)")
+        self._write_snapshot_file((u, self._dumps(d)) for u, d in users.items())
+
+    # ---------- leitura ----------
+
+    def usernames(self) -> List[str]:
+        """Nomes de todos os usuários, sem carregar os documentos"""
+        with self._lock:
+            return list(self._index())
+
+    def get(self, username: str) -> Optional[dict]:
+        """Documento de um único usuário (lê só o trecho do registro dele)"""
+        with self._lock:
+            ref = self._index().get(username)
+            if ref is None:
+                return None
+            path, offset, length = ref
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                raw = f.read(length)
+        return json.loads(raw)
+
+    def iter_users(self) -> Iterator[Tuple[str, dict]]:
+        """Percorre (username, documento) um de cada vez"""
+        for username in self.usernames():
+            user_data = self.get(username)
+            if user_data is not None:
+                yield username, user_data
+
+    def load(self) -> Dict[str, dict]:
+        """Estado completo em memória (O(todos os usuários); prefira iter_users)"""
+        return dict(self.iter_users())
+
+    # ---------- escrita ----------
+
+    def _append_lines(self, lines: List[bytes]) -> int:
+        """Faz append das linhas e devolve o offset onde a primeira começou"""
+        self._ensure_directory()
+        with open(self.journal_path, 'ab') as f:
+            pos = f.tell()
+            if pos and lines:
+                # uma escrita interrompida pode ter deixado a última linha sem '\n'
+                with open(self.journal_path, 'rb') as tail:
+                    tail.seek(pos - 1)
+                    if tail.read(1) != b"\n":
+                        f.write(b"\n")
+                        pos += 1
+            f.write(b"".join(lines))
+            f.flush()
+        return pos
+
+    def append(self, username: str, user_data: dict) -> bool:
+        """Registra o estado completo de um usuário no journal"""
+        return self.append_many([(username, user_data)])
+
+    def append_many(self, items: Iterable[Tuple[str, dict]]) -> bool:
+        """Registra vários usuários numa única escrita no journal"""
+        lines = []
+        refs = []  # (username, offset dentro do lote, tamanho)
+        batch_pos = 0
+        for username, user_data in items:
+            prefix = _JOURNAL_PREFIX + self._dumps(username) + _JOURNAL_DATA
+            record = self._dumps(user_data)
+            line = prefix + record + b"}\n"
+            refs.append((username, batch_pos + len(prefix), len(record)))
+            lines.append(line)
+            batch_pos += len(line)
+        if not lines:
+            return True
+
+        with self._lock:
+            index = self._index()
+            start = self._append_lines(lines)
+            for username, offset, length in refs:
+                index[username] = (self.journal_path, start + offset, length)
+            self._journal_entries += len(lines)
+            if self._journal_entries >= self.compact_every:
+                self.compact()
+            return True
+
+    def delete(self, username: str) -> bool:
+        with self._lock:
+            index = self._index()
+            self._append_lines([_JOURNAL_PREFIX + self._dumps(username) + _JOURNAL_DELETED + b"\n"])
+            index.pop(username, None)
+            self._journal_entries += 1
+            return True
+
+    def _write_snapshot_file(self, records: Iterable[Tuple[str, bytes]]) -> Dict[str, RecordRef]:
+        """
+        Grava os registros (username, JSON já serializado) como novo snapshot,
+        um por linha, via temp + rename. Devolve o índice do novo arquivo.
+        """
+        self._ensure_directory()
+        directory = os.path.dirname(self.snapshot_path) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=".users-", suffix=".tmp", dir=directory)
+        offsets: Dict[str, RecordRef] = {}
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(b"{\n")
+                pos = 2
+                pending = None
+                for username, record in records:
+                    if pending is not None:
+                        f.write(pending + b",\n")
+                        pos += len(pending) + 2
+                    key = self._dumps(username) + b": "
+                    offsets[username] = (self.snapshot_path, pos + len(key), len(record))
+                    pending = key + record
+                if pending is not None:
+                    f.write(pending + b"\n")
+                f.write(b"}\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return offsets
+
+    def _iter_records(self, index: Dict[str, RecordRef]) -> Iterator[Tuple[str, bytes]]:
+        """Bytes de cada registro do índice, sem decodificar o JSON"""
+        handles: Dict[str, BinaryIO] = {}
+        try:
+            for username, (path, offset, length) in list(index.items()):
+                f = handles.get(path)
+                if f is None:
+                    f = handles[path] = open(path, 'rb')
+                f.seek(offset)
+                yield username, f.read(length)
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def compact(self) -> bool:
+        """Consolida snapshot + journal num novo snapshot, copiando registro a registro"""
+        with self._lock:
+            offsets = self._write_snapshot_file(self._iter_records(self._index()))
+            # o snapshot já contém tudo que estava no journal
+            if os.path.exists(self.journal_path):
+                open(self.journal_path, 'wb').close()
+            self._journal_entries = 0
+            self._offsets = offsets
+            return True
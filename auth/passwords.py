@@ -0,0 +1,142 @@
+# auth/passwords.py
+
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+# Custo do scrypt (n = 2**14, r = 8 -> ~16 MiB e alguns ms por verificação)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+# Fallback quando o Python não foi compilado com scrypt (OpenSSL antigo)
+PBKDF2_ITERATIONS = 200_000
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+_HAS_SCRYPT = hasattr(hashlib, "scrypt")
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text.encode("ascii"))
+
+
+def hash_password(password: str, *, n: int = SCRYPT_N, r: int = SCRYPT_R, p: int = SCRYPT_P,
+                  iterations: int = PBKDF2_ITERATIONS) -> str:
+    """
+    Gera o hash salgado no formato
+    'scrypt$n$r$p$salt$hash' ou 'pbkdf2_sha256$iter$salt$hash'.
+    """
+    salt = os.urandom(SALT_BYTES)
+    secret = password.encode("utf-8")
+    if _HAS_SCRYPT:
+        key = hashlib.scrypt(secret, salt=salt, n=n, r=r, p=p,
+                             maxmem=128 * r * (n + p + 2), dklen=KEY_BYTES)
+        return f"scrypt${n}${r}${p}${_b64(salt)}${_b64(key)}"
+    key = hashlib.pbkdf2_hmac("sha256", secret, salt, iterations, dklen=KEY_BYTES)
+    return f"pbkdf2_sha256${iterations}${_b64(salt)}${_b64(key)}"
+
+
+def is_hashed(stored: Optional[str]) -> bool:
+    return bool(stored) and stored.startswith(("scrypt$", "pbkdf2_sha256$"))
+
+
+def verify_password(stored: Optional[str], password: str) -> Tuple[bool, bool]:
+    """
+    Confere a senha. Retorna (ok, precisa_rehash): precisa_rehash é True
+    para senhas legadas em texto puro ou hashes com custo diferente do atual.
+    """
+    if not stored:
+        return False, False
+    secret = password.encode("utf-8")
+
+    if not is_hashed(stored):
+        # legado: texto puro salvo em users.json
+        return hmac.compare_digest(stored.encode("utf-8"), secret), True
+
+    try:
+        scheme, *params = stored.split("$")
+        if scheme == "scrypt":
+            n, r, p = (int(v) for v in params[:3])
+            salt, expected = _unb64(params[3]), _unb64(params[4])
+            key = hashlib.scrypt(secret, salt=salt, n=n, r=r, p=p,
+                                 maxmem=128 * r * (n + p + 2), dklen=len(expected))
+            outdated = (n, r, p) != (SCRYPT_N, SCRYPT_R, SCRYPT_P)
+        else:
+            iterations = int(params[0])
+            salt, expected = _unb64(params[1]), _unb64(params[2])
+            key = hashlib.pbkdf2_hmac("sha256", secret, salt, iterations, dklen=len(expected))
+            outdated = _HAS_SCRYPT or iterations != PBKDF2_ITERATIONS
+    except (ValueError, IndexError):
+        return False, False
+
+    ok = hmac.compare_digest(key, expected)
+    return ok, ok and outdated
+
+
+class VerifiedSessionCache:
+    """
+    Cache curto de logins já verificados: repetir authenticate() com a mesma
+    senha dentro de `ttl` segundos não roda o KDF de novo. A senha não fica
+    em memória, só um HMAC dela com uma chave aleatória do processo.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._key = os.urandom(32)
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _digest(self, username: str, password: str) -> bytes:
+        return hmac.new(self._key, f"{username}\0{password}".encode("utf-8"), hashlib.sha256).digest()
+
+    def check(self, username: str, password: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                return False
+            digest, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[username]
+                return False
+            return hmac.compare_digest(digest, self._digest(username, password))
+
+    def add(self, username: str, password: str):
+        with self._lock:
+            self._entries[username] = (self._digest(username, password), time.monotonic() + self.ttl)
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, username: str):
+        with self._lock:
+            self._entries.pop(username, None)
+
+
+if __name__ == "__main__":
+    # python -m auth.passwords -> latência de login com os parâmetros atuais
+    stored = hash_password("benchmark")
+    rounds = 20
+    start = time.perf_counter()
+    for _ in range(rounds):
+        verify_password(stored, "benchmark")
+    kdf_ms = (time.perf_counter() - start) / rounds * 1000
+
+    cache = VerifiedSessionCache()
+    cache.add("bench", "benchmark")
+    start = time.perf_counter()
+    for _ in range(rounds * 100):
+        cache.check("bench", "benchmark")
+    cached_ms = (time.perf_counter() - start) / (rounds * 100) * 1000
+
+    print(f"🔐 {stored.split('$')[0]}: {kdf_ms:.2f} ms por verificação")
+    print(f"⚡ cache de sessão: {cached_ms:.4f} ms por verificação")
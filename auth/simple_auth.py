@@ -1,27 +1,66 @@
 # auth/simple_auth.py
 
-import json
 import os
 import requests
-from typing import Dict, Optional, Any
+from itertools import islice
+from typing import Dict, Iterable, Optional, Any, Tuple
 from urllib.parse import urlparse
-from pymongo import MongoClient
+from pymongo import MongoClient, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 import datetime
 
+from auth.field_diff import diff_update, snapshot
+from auth.json_store import JournalUserStore
+from auth.passwords import VerifiedSessionCache, hash_password, verify_password
+from auth.user_cache import LRUUserCache
+from auth.write_behind import WriteBehindQueue
+
 USER_DATA_FILE = "data/users.json"
 
+# Versão atual do esquema dos documentos de usuário
+SCHEMA_VERSION = 1
+
+# Quantos documentos de usuário ficam em memória (LRU)
+USER_CACHE_SIZE = 128
+# Tamanho da página ao montar o índice de nomes a partir do MongoDB
+USER_INDEX_PAGE_SIZE = 1000
+# Usuários por lote nas gravações em massa (bulk_write / journal)
+BULK_BATCH_SIZE = 500
+
 class SimpleAuth:
+    # Migrações em ordem: (versão que o documento passa a ter, método)
+    MIGRATIONS = [
+        (1, "_repair_user_data"),   # estrutura completa com todos os defaults
+    ]
+    
     def __init__(self):
-        self.users: Dict = {}
+        # username.casefold() -> nome canônico, para TODOS os usuários (só nomes)
+        self._user_index: Dict[str, str] = {}
+        # Último estado gravado no MongoDB por usuário (base para o diff de campos)
+        self._mongo_persisted: Dict[str, dict] = {}
         self.mongo_client = None
         self.db = None
         self.users_collection = None
+        # Snapshot + journal local (append-only por usuário)
+        self.json_store = JournalUserStore(USER_DATA_FILE)
+        # Saves saem da thread do jogo: marcam o usuário e uma thread grava depois
+        self.write_queue = WriteBehindQueue(self._flush_users, flush_interval=1.0)
+        # Logins recentes já verificados (evita rodar o KDF a cada authenticate)
+        self.verified_sessions = VerifiedSessionCache()
+        # Documentos carregados sob demanda; usuários com save pendente não saem do cache
+        self.users: LRUUserCache = LRUUserCache(
+            USER_CACHE_SIZE,
+            loader=self._load_user,
+            is_pinned=self.write_queue.is_pending,
+            on_evict=self._on_user_evicted,
+        )
         
         # Inicializa MongoDB
         self._init_mongodb()
         # Carrega usuários
         self.load_users()
+        self.write_queue.start()
         print("🔄 Sistema de autenticação inicializado com persistência total")
     
     def _init_mongodb(self):
@@ -70,25 +109,23 @@ class SimpleAuth:
             print(f"❌ Erro ao criar diretório: {e}")
     
     def load_users(self):
-        """Carrega usuários do MongoDB (prioridade) ou do JSON"""
+        """
+        Monta só o índice de nomes, do MongoDB (prioridade) ou do JSON.
+        Os documentos são carregados sob demanda pelo cache LRU.
+        """
+        self.users.clear()
+        self._mongo_persisted.clear()
         try:
-            # Tenta carregar do MongoDB primeiro
+            # Tenta o MongoDB primeiro, paginando apenas os _id
             mongo_loaded = False
             if self.users_collection is not None:
                 try:
-                    mongo_users = list(self.users_collection.find({}))
-                    if mongo_users:
-                        for user_doc in mongo_users:
-                            username = user_doc.get('_id')
-                            if username:
-                                user_data = {k: v for k, v in user_doc.items() if k != '_id'}
-                                self.users[username] = self._repair_user_data(user_data, username)
-                        
-                        print(f"✅ {len(self.users)} usuários carregados do MongoDB")
+                    cursor = self.users_collection.find({}, {'_id': 1}).batch_size(USER_INDEX_PAGE_SIZE)
+                    names = [doc['_id'] for doc in cursor if isinstance(doc.get('_id'), str)]
+                    if names:
+                        self._user_index = {u.casefold(): u for u in names}
+                        print(f"✅ {len(names)} usuários indexados do MongoDB")
                         mongo_loaded = True
-                        
-                        # Sincroniza com JSON
-                        self._sync_to_json()
                 except Exception as e:
                     print(f"❌ Erro ao carregar do MongoDB: {e}")
             
@@ -98,90 +135,324 @@ class SimpleAuth:
                 
         except Exception as e:
             print(f"❌ Erro crítico ao carregar usuários: {e}")
-            self.users = {}
+            self._user_index = {}
+    
+    def _load_user(self, username: str) -> Optional[dict]:
+        """Loader do cache: busca um documento pelo nome canônico"""
+        user_data = None
+        if self.users_collection is not None:
+            try:
+                user_doc = self.users_collection.find_one({'_id': username})
+                if user_doc:
+                    user_doc.pop('_id', None)
+                    self._mongo_persisted[username] = snapshot(user_doc)
+                    user_data = user_doc
+            except Exception as e:
+                print(f"❌ Erro ao carregar {username} do MongoDB: {e}")
+        
+        if user_data is None:
+            try:
+                user_data = self.json_store.get(username)
+            except Exception as e:
+                print(f"❌ Erro ao carregar {username} do JSON: {e}")
+        
+        if user_data is None:
+            return None
+        return self._load_user_document(user_data, username)
+    
+    def _on_user_evicted(self, username: str):
+        # a base do diff só faz sentido enquanto o documento está em memória
+        self._mongo_persisted.pop(username, None)
+    
+    # 🔥 VERSÃO DE ESQUEMA E MIGRAÇÕES
+    
+    def _migrate_user(self, user_data: dict, username: str) -> dict:
+        """
+        Leva o documento até SCHEMA_VERSION aplicando só as migrações que
+        faltam. Documentos já atualizados custam uma comparação de inteiros.
+        """
+        version = user_data.get("schema_version", 0)
+        if version >= SCHEMA_VERSION:
+            return user_data
+        
+        migrated = user_data
+        for target_version, method_name in self.MIGRATIONS:
+            if version < target_version:
+                migrated = getattr(self, method_name)(migrated, username)
+                migrated["schema_version"] = target_version
+                version = target_version
+        return migrated
+    
+    def _load_user_document(self, user_data: dict, username: str) -> dict:
+        """Migra um documento recém-carregado e agenda a gravação se mudou"""
+        migrated = self._migrate_user(user_data, username)
+        if migrated is not user_data:
+            self.write_queue.mark(username)
+        return migrated
+    
+    def migrate_stored_users(self) -> dict:
+        """
+        Job em lote: migra e regrava os documentos desatualizados do MongoDB
+        e do armazenamento JSON. Retorna quantos foram migrados em cada um.
+        """
+        stats = {"mongo": 0, "json": 0}
+        
+        if self.users_collection is not None:
+            outdated = {"$or": [
+                {"schema_version": {"$exists": False}},
+                {"schema_version": {"$lt": SCHEMA_VERSION}},
+            ]}
+            try:
+                for user_doc in self.users_collection.find(outdated):
+                    username = user_doc.pop('_id')
+                    migrated = self._migrate_user(user_doc, username)
+                    self.users_collection.replace_one({'_id': username}, migrated, upsert=True)
+                    self._mongo_persisted[username] = snapshot(migrated)
+                    stats["mongo"] += 1
+            except Exception as e:
+                print(f"❌ Erro ao migrar usuários no MongoDB: {e}")
+        
+        try:
+            # percorre o JSON um usuário por vez, gravando os migrados em lotes
+            migrated_items = []
+            for username, user_data in self.json_store.iter_users():
+                migrated = self._migrate_user(user_data, username)
+                if migrated is not user_data:
+                    migrated_items.append((username, migrated))
+                    stats["json"] += 1
+                if len(migrated_items) >= BULK_BATCH_SIZE:
+                    self.json_store.append_many(migrated_items)
+                    migrated_items = []
+            if migrated_items:
+                self.json_store.append_many(migrated_items)
+            if stats["json"]:
+                self.json_store.compact()
+        except Exception as e:
+            print(f"❌ Erro ao migrar usuários no JSON: {e}")
+        
+        print(f"🧬 Migração v{SCHEMA_VERSION}: {stats['mongo']} no MongoDB, {stats['json']} no JSON")
+        return stats
+    
+    # 🔥 ÍNDICE CASE-INSENSITIVE DE USUÁRIOS
+    
+    def _resolve_username(self, username: str) -> Optional[str]:
+        """Nome canônico do usuário (busca case-insensitive em O(1))"""
+        if not username:
+            return None
+        return self._user_index.get(username.casefold())
+    
+    def _get_user(self, actual_username: str) -> Optional[dict]:
+        """Documento do usuário pelo cache, ou None se a carga falhar"""
+        try:
+            return self.users[actual_username]
+        except KeyError:
+            print(f"⚠️ Usuário {actual_username} indexado mas indisponível no armazenamento")
+            return None
     
     def _load_from_json(self):
-        """Carrega usuários do arquivo JSON"""
+        """Monta o índice de nomes a partir do JSON (snapshot + journal)"""
         try:
-            if os.path.exists(USER_DATA_FILE):
-                with open(USER_DATA_FILE, 'r', encoding='utf-8') as f:
-                    loaded_users = json.load(f)
-                    
-                    for username, user_data in loaded_users.items():
-                        self.users[username] = self._repair_user_data(user_data, username)
-                    
-                    print(f"✅ {len(self.users)} usuários carregados do JSON")
-                    
-                    # Se MongoDB está disponível, sincroniza
-                    if self.users_collection is not None:
-                        self._sync_to_mongodb()
+            if os.path.exists(USER_DATA_FILE) or os.path.exists(self.json_store.journal_path):
+                # só os nomes: os documentos ficam no disco até serem pedidos
+                usernames = self.json_store.usernames()
+                self._user_index = {u.casefold(): u for u in usernames}
+                
+                print(f"✅ {len(usernames)} usuários indexados do JSON")
+                
+                # MongoDB disponível mas vazio: popula uma única vez a partir do JSON
+                if self.users_collection is not None and usernames:
+                    self._sync_to_mongodb(self.json_store.iter_users())
             else:
                 self._ensure_data_directory()
-                self.users = {}
+                self._user_index = {}
                 print("📁 Arquivo JSON não encontrado, criando novo")
                 
         except Exception as e:
             print(f"❌ Erro ao carregar do JSON: {e}")
-            self.users = {}
+            self._user_index = {}
     
-    def _sync_to_mongodb(self):
-        """Sincroniza todos os dados do JSON para o MongoDB"""
+    def _sync_to_mongodb(self, users: Optional[Iterable[Tuple[str, dict]]] = None):
+        """
+        Sincroniza usuários (padrão: os que estão em memória) para o MongoDB.
+        `users` é percorrido em lotes, sem montar a lista inteira.
+        """
         if self.users_collection is None:
             return
             
         try:
-            for username, user_data in self.users.items():
-                self._save_user_to_mongodb(username, user_data)
+            source = iter(users if users is not None else list(self.users.items()))
+            failed = 0
+            while True:
+                batch = list(islice(source, BULK_BATCH_SIZE))
+                if not batch:
+                    break
+                items = [(u, self._migrate_user(d, u)) for u, d in batch]
+                reports = self._bulk_save_to_mongodb(items, BULK_BATCH_SIZE)
+                failed += sum(len(r["failed"]) for r in reports)
+                # as bases de diff só valem para documentos que estão no cache
+                for username, _ in items:
+                    if username not in self.users:
+                        self._mongo_persisted.pop(username, None)
+            if failed:
+                print(f"⚠️ {failed} usuários não sincronizados para MongoDB")
             print("🔄 Dados sincronizados para MongoDB")
         except Exception as e:
             print(f"❌ Erro ao sincronizar com MongoDB: {e}")
     
     def _sync_to_json(self):
-        """Sincroniza todos os dados do MongoDB para o JSON"""
+        """Grava os usuários em memória no journal e consolida o snapshot"""
         try:
-            self._ensure_data_directory()
-            with open(USER_DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.users, f, indent=2, ensure_ascii=False)
+            self.json_store.append_many(list(self.users.items()))
+            self.json_store.compact()
             print("🔄 Dados sincronizados para JSON")
         except Exception as e:
             print(f"❌ Erro ao sincronizar com JSON: {e}")
     
     def _save_user_to_mongodb(self, username: str, user_data: dict) -> bool:
-        """Salva um usuário específico no MongoDB"""
+        """
+        Salva um usuário específico no MongoDB.
+        Se já existe um estado gravado, envia só os campos alterados
+        ($set/$inc/$unset); senão grava o documento inteiro.
+        """
         if self.users_collection is None:
             return False
+        report = self._bulk_save_to_mongodb([(username, user_data)], 1)[0]
+        if report["failed"]:
+            print(f"❌ Erro ao salvar {username} no MongoDB: {report['error']}")
+        return not report["failed"]
+    
+    # 🔥 GRAVAÇÃO EM MASSA
+    
+    def _mongo_write_op(self, username: str, user_data: dict):
+        """
+        Operação de bulk para um usuário: UpdateOne com o diff de campos se há
+        base conhecida, ReplaceOne com upsert se não. (None, estado) se nada mudou.
+        """
+        new_state = snapshot(user_data)
+        persisted = self._mongo_persisted.get(username)
+        if persisted is not None:
+            update_ops = diff_update(persisted, new_state)
+            if not update_ops:
+                return None, new_state
+            return UpdateOne({'_id': username}, update_ops), new_state
+        return ReplaceOne({'_id': username}, new_state, upsert=True), new_state
+    
+    def _bulk_save_to_mongodb(self, items: list, batch_size: int) -> list:
+        """
+        Grava `items` [(username, dados)] com bulk_write não ordenado, em lotes.
+        Retorna um relatório por lote: {'batch', 'ok', 'failed', 'error'}.
+        """
+        reports = []
+        if self.users_collection is None:
+            return reports
+        
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            report = {"batch": start // batch_size, "ok": 0, "failed": [], "error": None}
+            ops, op_users, states = [], [], {}
             
+            for username, user_data in batch:
+                try:
+                    op, new_state = self._mongo_write_op(username, user_data)
+                except Exception as e:
+                    # ex.: dict alterado por outra thread durante a cópia
+                    report["failed"].append(username)
+                    report["error"] = str(e)
+                    continue
+                states[username] = new_state
+                if op is None:
+                    report["ok"] += 1
+                else:
+                    ops.append(op)
+                    op_users.append(username)
+            
+            failed_indexes = set()
+            if ops:
+                try:
+                    result = self.users_collection.bulk_write(ops, ordered=False)
+                    updates = [i for i, op in enumerate(ops) if isinstance(op, UpdateOne)]
+                    if result.matched_count + result.upserted_count < len(ops) and updates:
+                        # algum documento sumiu: não dá para saber qual UpdateOne não casou,
+                        # então regrava todos com replace + upsert (idempotente) no mesmo flush
+                        failed_indexes = self._replace_missing(
+                            [(i, op_users[i], states[op_users[i]]) for i in updates], report
+                        )
+                except BulkWriteError as e:
+                    write_errors = e.details.get("writeErrors", [])
+                    failed_indexes = {err["index"] for err in write_errors}
+                    report["error"] = write_errors[0].get("errmsg") if write_errors else str(e)
+                except Exception as e:
+                    failed_indexes = set(range(len(ops)))
+                    report["error"] = str(e)
+            
+            for index, username in enumerate(op_users):
+                if index in failed_indexes:
+                    report["failed"].append(username)
+                    self._mongo_persisted.pop(username, None)
+                else:
+                    report["ok"] += 1
+                    if username in states:
+                        self._mongo_persisted[username] = states[username]
+            reports.append(report)
+        return reports
+    
+    def _replace_missing(self, entries: list, report: dict) -> set:
+        """
+        Regrava [(índice, username, estado)] com ReplaceOne(upsert=True).
+        Devolve os índices que continuaram sem ser gravados.
+        """
+        ops = [ReplaceOne({'_id': username}, state, upsert=True) for _, username, state in entries]
         try:
-            mongo_data = user_data.copy()
-            result = self.users_collection.replace_one(
-                {'_id': username}, 
-                mongo_data, 
-                upsert=True
-            )
-            return result.acknowledged
+            self.users_collection.bulk_write(ops, ordered=False)
+            return set()
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            report["error"] = write_errors[0].get("errmsg") if write_errors else str(e)
+            return {entries[err["index"]][0] for err in write_errors}
         except Exception as e:
-            print(f"❌ Erro ao salvar {username} no MongoDB: {e}")
-            return False
+            report["error"] = str(e)
+            return {index for index, _, _ in entries}
+    
+    def _bulk_save_to_json(self, items: list, batch_size: int) -> list:
+        """Grava `items` no journal com uma escrita por lote; mesmo relatório do Mongo"""
+        reports = []
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            report = {"batch": start // batch_size, "ok": 0, "failed": [], "error": None}
+            try:
+                self.json_store.append_many(batch)
+                report["ok"] = len(batch)
+            except Exception as e:
+                report["failed"] = [username for username, _ in batch]
+                report["error"] = str(e)
+            reports.append(report)
+        return reports
+    
+    def bulk_save(self, items: list, batch_size: int = BULK_BATCH_SIZE) -> dict:
+        """
+        Grava vários usuários no MongoDB e no JSON em lotes.
+        Retorna {'mongo': [relatórios], 'json': [relatórios], 'failed': [...]}
+        onde 'failed' são os usuários que não foram gravados em nenhuma fonte.
+        """
+        mongo_reports = self._bulk_save_to_mongodb(items, batch_size)
+        json_reports = self._bulk_save_to_json(items, batch_size)
+        
+        mongo_ok = self.users_collection is not None
+        mongo_failed = {u for r in mongo_reports for u in r["failed"]}
+        json_failed = {u for r in json_reports for u in r["failed"]}
+        failed = [u for u, _ in items
+                  if u in json_failed and (not mongo_ok or u in mongo_failed)]
+        
+        for source, reports in (("MongoDB", mongo_reports), ("JSON", json_reports)):
+            for r in reports:
+                if r["failed"]:
+                    print(f"⚠️ {source} lote {r['batch']}: {r['ok']} ok, {len(r['failed'])} falhas ({r['error']})")
+        return {"mongo": mongo_reports, "json": json_reports, "failed": failed}
     
     def _save_user_to_json(self, username: str, user_data: dict) -> bool:
-        """Salva um usuário específico no JSON"""
+        """Salva um usuário específico no JSON (append no journal)"""
         try:
-            self._ensure_data_directory()
-            
-            # Carrega dados existentes
-            existing_data = {}
-            if os.path.exists(USER_DATA_FILE):
-                with open(USER_DATA_FILE, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            
-            # Atualiza usuário específico
-            existing_data[username] = user_data
-            
-            # Salva arquivo completo
-            with open(USER_DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
-            
-            return True
+            return self.json_store.append(username, user_data)
         except Exception as e:
             print(f"❌ Erro ao salvar {username} no JSON: {e}")
             return False
@@ -194,7 +465,7 @@ class SimpleAuth:
             # Dados básicos obrigatórios
             required_fields = {
                 "nome": username,
-                "password": user_data.get("password", "123456"),
+                "password": user_data.get("password"),
                 "avatar_path": None,
                 "avatar_url": None, 
                 "xp": 0,
@@ -309,52 +580,53 @@ class SimpleAuth:
         
         return repaired
 
-    def save_users(self):
-        """Salva TODOS os usuários no MongoDB e JSON - PERSISTÊNCIA TOTAL"""
+    def save_users(self, batch_size: int = BULK_BATCH_SIZE):
+        """Salva todos os usuários em memória no MongoDB e JSON, em lotes"""
         try:
-            success_count = 0
-            total_users = len(self.users)
-            
-            for username, user_data in self.users.items():
-                # Sempre repara antes de salvar
-                repaired_data = self._repair_user_data(user_data, username)
-                self.users[username] = repaired_data
-                
-                # Salva em ambas as fontes
-                mongo_success = self._save_user_to_mongodb(username, repaired_data)
-                json_success = self._save_user_to_json(username, repaired_data)
-                
-                if mongo_success or json_success:
-                    success_count += 1
+            items = list(self.users.items())
+            report = self.bulk_save(items, batch_size)
+            success_count = len(items) - len(report["failed"])
             
-            print(f"💾 Persistência completa: {success_count}/{total_users} usuários salvos")
-            return success_count == total_users
+            print(f"💾 Persistência completa: {success_count}/{len(items)} usuários salvos")
+            return not report["failed"]
             
         except Exception as e:
             print(f"❌ Erro crítico ao salvar usuários: {e}")
             return False
     
-    def save_user(self, username: str) -> bool:
-        """Salva um usuário específico com persistência total"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
+    def save_user(self, username: str, immediate: bool = False) -> bool:
+        """
+        Marca o usuário para persistência write-behind (não bloqueia o jogo).
+        immediate=True grava na hora, junto com o que estiver pendente.
+        """
+        actual_username = self._resolve_username(username)
         if not actual_username:
             return False
         
-        user_data = self.users[actual_username]
-        repaired_data = self._repair_user_data(user_data, actual_username)
-        self.users[actual_username] = repaired_data
-        
-        # Salva em ambas as fontes
-        mongo_success = self._save_user_to_mongodb(actual_username, repaired_data)
-        json_success = self._save_user_to_json(actual_username, repaired_data)
-        
-        success = mongo_success or json_success
-        if success:
-            print(f"💾 Usuário {username} salvo com persistência total")
-        else:
-            print(f"❌ Falha ao salvar usuário {username}")
+        self.write_queue.mark(actual_username)
+        if immediate:
+            return self.write_queue.flush()
+        return True
+    
+    def _flush_users(self, usernames: list) -> list:
+        """Grava os usuários marcados; devolve os que falharam em ambas as fontes"""
+        # Sem reparo: o esquema já foi migrado no load
+        items = [(u, self.users.get(u)) for u in usernames]
+        items = [(u, d) for u, d in items if d is not None]
+        if not items:
+            return []
         
-        return success
+        failed = self.bulk_save(items)["failed"]
+        print(f"💾 {len(items) - len(failed)}/{len(items)} usuários salvos com persistência total")
+        return failed
+    
+    def flush(self) -> bool:
+        """Grava imediatamente tudo que está pendente (chamar no shutdown)"""
+        return self.write_queue.flush()
+    
+    def write_stats(self) -> dict:
+        """Métricas da fila write-behind (tamanho, idade, coalescência, flushes)"""
+        return self.write_queue.stats()
 
     # 🔥 MÉTODOS PRINCIPAIS COM PERSISTÊNCIA AUTOMÁTICA
     
@@ -364,7 +636,7 @@ class SimpleAuth:
         
         new_user = {
             "nome": nome,
-            "password": password,
+            "password": hash_password(password),
             "avatar_path": None,
             "avatar_url": avatar_url,
             "xp": 0,
@@ -398,11 +670,12 @@ class SimpleAuth:
             "created_at": datetime.datetime.now().isoformat()
         }
         
-        new_user = self._repair_user_data(new_user, username)
+        new_user = self._migrate_user(new_user, username)
         self.users[username] = new_user
+        self._user_index[username.casefold()] = username
         
         # SALVA IMEDIATAMENTE
-        success = self.save_user(username)
+        success = self.save_user(username, immediate=True)
         
         if success:
             print(f"🎮 Novo usuário registrado: {username} (salvo permanentemente)")
@@ -410,11 +683,13 @@ class SimpleAuth:
     
     def purchase_item(self, username: str, item_id: str, item_price: int) -> bool:
         """COMPRA ITEM COM PERSISTÊNCIA IMEDIATA"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
+        actual_username = self._resolve_username(username)
         if not actual_username:
             return False
         
-        user_data = self.users[actual_username]
+        user_data = self._get_user(actual_username)
+        if user_data is None:
+            return False
         current_coins = user_data.get("coins", 0)
         
         if current_coins < item_price:
@@ -446,29 +721,31 @@ class SimpleAuth:
             return False
     
     def add_to_inventory(self, username: str, item_id: str, quantity: int = 1) -> bool:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            inventory = self.users[actual_username].get("inventory", {})
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
+            inventory = user_data.get("inventory", {})
             
             if item_id in inventory:
                 inventory[item_id] += quantity
             else:
                 inventory[item_id] = quantity
             
-            self.users[actual_username]["inventory"] = inventory
+            user_data["inventory"] = inventory
             return self.save_user(actual_username)
         return False
     
     def equip_to_hotbar(self, username: str, item_id: str, slot: str) -> bool:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            inventory = self.users[actual_username].get("inventory", {})
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
+            inventory = user_data.get("inventory", {})
             if item_id not in inventory or inventory[item_id] <= 0:
                 return False
             
-            hotbar = self.users[actual_username].get("hotbar", {})
+            hotbar = user_data.get("hotbar", {})
             hotbar[slot] = item_id
-            self.users[actual_username]["hotbar"] = hotbar
+            user_data["hotbar"] = hotbar
             
             return self.save_user(actual_username)
         return False
@@ -477,7 +754,7 @@ class SimpleAuth:
     
     def save_quiz_state(self, username: str, quiz_state: dict) -> bool:
         """Salva o estado atual do quiz (vidas, mana, fase, etc.)"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
+        actual_username = self._resolve_username(username)
         if not actual_username:
             return False
         
@@ -502,15 +779,15 @@ class SimpleAuth:
     
     def get_quiz_state(self, username: str) -> dict:
         """Obtém o estado salvo do quiz"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            user_data = self.users[actual_username]
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
             return user_data.get("quiz_state", {})
         return {}
     
     def save_quiz_progress(self, username: str, phase: int, progress_data: dict) -> bool:
         """Salva progresso específico de uma fase do quiz"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
+        actual_username = self._resolve_username(username)
         if not actual_username:
             return False
         
@@ -541,9 +818,9 @@ class SimpleAuth:
     
     def get_quiz_progress(self, username: str, phase: int = None) -> dict:
         """Obtém progresso do quiz (geral ou de fase específica)"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            user_data = self.users[actual_username]
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
             quiz_progress = user_data.get("quiz_progress", {})
             
             if phase is not None:
@@ -555,7 +832,7 @@ class SimpleAuth:
     
     def update_item_usage(self, username: str, item_id: str) -> bool:
         """Atualiza estatísticas de uso de itens"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
+        actual_username = self._resolve_username(username)
         if not actual_username:
             return False
         
@@ -578,7 +855,7 @@ class SimpleAuth:
     
     def save_session_stats(self, username: str, session_stats: dict) -> bool:
         """Salva estatísticas da sessão atual"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
+        actual_username = self._resolve_username(username)
         if not actual_username:
             return False
         
@@ -597,52 +874,100 @@ class SimpleAuth:
 
     # 🔥 MÉTODOS DE CONSULTA
     def user_exists(self, username: str) -> bool:
-        return username.lower() in [u.lower() for u in self.users.keys()]
+        return self._resolve_username(username) is not None
     
     def authenticate(self, username: str, password: str) -> bool:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            return self.users[actual_username]["password"] == password
-        return False
+        actual_username = self._resolve_username(username)
+        if not actual_username:
+            return False
+        
+        if self.verified_sessions.check(actual_username, password):
+            return True
+        
+        user_data = self._get_user(actual_username)
+        if user_data is None:
+            return False
+        ok, needs_rehash = verify_password(user_data.get("password"), password)
+        if not ok:
+            return False
+        
+        if needs_rehash:
+            # senha legada (texto puro) ou custo antigo: regrava com o KDF atual
+            user_data["password"] = hash_password(password)
+            self.save_user(actual_username)
+            print(f"🔐 Senha de {actual_username} migrada para hash")
+        
+        self.verified_sessions.add(actual_username, password)
+        return True
     
     def get_user_data(self, username: str) -> Optional[Dict]:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            return self._repair_user_data(self.users[actual_username], actual_username)
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
+            user_data = self._migrate_user(user_data, actual_username)
+            self.users[actual_username] = user_data
+            return dict(user_data)
         return None
     
     def update_user_data(self, username: str, user_data: dict) -> bool:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
+        actual_username = self._resolve_username(username)
         if actual_username:
-            repaired_data = self._repair_user_data(user_data, actual_username)
-            self.users[actual_username] = repaired_data
+            self.users[actual_username] = self._migrate_user(user_data, actual_username)
             return self.save_user(actual_username)
         return False
     
     def get_inventory(self, username: str) -> Dict:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            return self.users[actual_username].get("inventory", {})
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
+            return user_data.get("inventory", {})
         return {}
     
     def get_coins(self, username: str) -> int:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            return self.users[actual_username].get("coins", 0)
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
+            return user_data.get("coins", 0)
         return 0
     
     def get_hotbar(self, username: str) -> Dict:
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            return self.users[actual_username].get("hotbar", {})
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
+            return user_data.get("hotbar", {})
         return {}
     
+    def delete_user(self, username: str) -> bool:
+        """Remove um usuário da memória, do índice, do JSON e do MongoDB"""
+        actual_username = self._resolve_username(username)
+        if not actual_username:
+            return False
+        
+        self.users.pop(actual_username, None)
+        self._user_index.pop(actual_username.casefold(), None)
+        self._mongo_persisted.pop(actual_username, None)
+        self.verified_sessions.invalidate(actual_username)
+        
+        try:
+            self.json_store.delete(actual_username)
+        except Exception as e:
+            print(f"❌ Erro ao remover {actual_username} do JSON: {e}")
+        
+        if self.users_collection is not None:
+            try:
+                self.users_collection.delete_one({'_id': actual_username})
+            except Exception as e:
+                print(f"❌ Erro ao remover {actual_username} do MongoDB: {e}")
+        
+        print(f"🗑️ Usuário {actual_username} removido")
+        return True
+    
     def add_coins(self, username: str, amount: int) -> bool:
         """Adiciona moedas ao usuário"""
-        actual_username = next((u for u in self.users.keys() if u.lower() == username.lower()), None)
-        if actual_username:
-            current_coins = self.users[actual_username].get("coins", 0)
-            self.users[actual_username]["coins"] = current_coins + amount
+        actual_username = self._resolve_username(username)
+        user_data = self._get_user(actual_username) if actual_username else None
+        if user_data is not None:
+            user_data["coins"] = user_data.get("coins", 0) + amount
             return self.save_user(actual_username)
         return False
 
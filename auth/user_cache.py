@@ -0,0 +1,57 @@
+# auth/user_cache.py
+
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class LRUUserCache(OrderedDict):
+    """
+    Dicionário username -> documento limitado a `capacity` usuários quentes.
+
+    - cache[user] num usuário ausente chama `loader(user)` (carga sob demanda);
+    - ao passar da capacidade, remove o menos usado que não esteja "preso"
+      (`is_pinned`, ex.: save pendente na fila write-behind) e avisa `on_evict`.
+    """
+
+    def __init__(self, capacity: int,
+                 loader: Callable[[str], Optional[dict]],
+                 is_pinned: Callable[[str], bool] = lambda _: False,
+                 on_evict: Callable[[str], None] = lambda _: None):
+        super().__init__()
+        self.capacity = capacity
+        self.loader = loader
+        self.is_pinned = is_pinned
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+
+    def __getitem__(self, username):
+        if username in self:
+            self.hits += 1
+            self.move_to_end(username)
+            return super().__getitem__(username)
+        return self.__missing__(username)
+
+    def __missing__(self, username):
+        self.misses += 1
+        user_data = self.loader(username)
+        if user_data is None:
+            raise KeyError(username)
+        self[username] = user_data
+        return user_data
+
+    def __setitem__(self, username, user_data):
+        super().__setitem__(username, user_data)
+        self.move_to_end(username)
+        self._evict()
+
+    def _evict(self):
+        if len(self) <= self.capacity:
+            return
+        for username in list(self.keys()):
+            if len(self) <= self.capacity:
+                break
+            if self.is_pinned(username):
+                continue
+            super().__delitem__(username)
+            self.on_evict(username)
@@ -0,0 +1,153 @@
+# auth/write_behind.py
+
+import atexit
+import threading
+import time
+from typing import Callable, Dict, Iterable, List
+
+
+class WriteBehindQueue:
+    """
+    Fila write-behind de usuários "sujos".
+
+    mark() só registra o usuário e retorna na hora; uma thread em segundo
+    plano chama flush_fn com todos os usuários marcados no máximo a cada
+    `flush_interval` segundos. Várias marcações do mesmo usuário entre dois
+    flushes viram uma única escrita.
+
+    Backpressure: se a fila passar de `max_pending` usuários o flush é
+    antecipado, e stats() expõe tamanho da fila, idade do item mais antigo,
+    marcações coalescidas e duração do último flush.
+    """
+
+    def __init__(self, flush_fn: Callable[[List[str]], Iterable[str]],
+                 flush_interval: float = 1.0, max_pending: int = 256):
+        """
+        flush_fn recebe a lista de usuários e devolve os que falharam
+        (eles voltam para a fila).
+        """
+        self.flush_fn = flush_fn
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._dirty: Dict[str, float] = {}   # usuário -> momento da 1ª marcação pendente
+        self._inflight: Dict[str, float] = {}  # lote sendo gravado agora
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+        self._marks = 0
+        self._coalesced = 0
+        self._flushes = 0
+        self._flushed_users = 0
+        self._failures = 0
+        self._backpressure_events = 0
+        self._max_pending_seen = 0
+        self._last_flush_ms = 0.0
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Para a thread e grava o que ainda estiver pendente"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def mark(self, username: str):
+        with self._cond:
+            self._marks += 1
+            if username in self._dirty:
+                self._coalesced += 1
+            else:
+                self._dirty[username] = time.monotonic()
+                if len(self._dirty) == 1:
+                    # acorda a thread para começar a contar o intervalo
+                    self._cond.notify_all()
+            pending = len(self._dirty)
+            self._max_pending_seen = max(self._max_pending_seen, pending)
+            if pending >= self.max_pending:
+                self._backpressure_events += 1
+                self._cond.notify_all()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._dirty)
+
+    def is_pending(self, username: str) -> bool:
+        """True se o usuário ainda tem save na fila ou sendo gravado"""
+        with self._cond:
+            return username in self._dirty or username in self._inflight
+
+    def flush(self) -> bool:
+        """Grava imediatamente todos os usuários pendentes (bloqueante)"""
+        with self._flush_lock:
+            with self._cond:
+                if not self._dirty:
+                    return True
+                batch = self._dirty
+                self._dirty = {}
+                self._inflight = batch
+
+            start = time.perf_counter()
+            try:
+                failed = set(self.flush_fn(list(batch)))
+            except Exception as e:
+                print(f"❌ Erro no flush write-behind: {e}")
+                failed = set(batch)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with self._cond:
+                self._flushes += 1
+                self._flushed_users += len(batch) - len(failed)
+                self._failures += len(failed)
+                self._last_flush_ms = elapsed_ms
+                self._inflight = {}
+                for username in failed:
+                    # mantém a idade original para o retry
+                    self._dirty.setdefault(username, batch[username])
+            return not failed
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                if not self._dirty:
+                    self._cond.wait()
+                    continue
+                oldest = min(self._dirty.values())
+                wait = oldest + self.flush_interval - time.monotonic()
+                if wait > 0 and len(self._dirty) < self.max_pending:
+                    self._cond.wait(timeout=wait)
+                    continue
+            if not self.flush():
+                # evita loop apertado se o destino estiver fora do ar
+                time.sleep(self.flush_interval)
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            now = time.monotonic()
+            oldest = min(self._dirty.values()) if self._dirty else now
+            return {
+                "pending": len(self._dirty),
+                "oldest_pending_s": round(now - oldest, 3),
+                "max_pending_seen": self._max_pending_seen,
+                "marks": self._marks,
+                "coalesced": self._coalesced,
+                "flushes": self._flushes,
+                "flushed_users": self._flushed_users,
+                "failures": self._failures,
+                "backpressure_events": self._backpressure_events,
+                "last_flush_ms": round(self._last_flush_ms, 2),
+            }
@@ -27,7 +27,7 @@ LOGIN_MUSIC = os.path.join(BASE_PATH, "assets/sounds/specular_city.mp3")
 
 # ===== MUNDO ABERTO =====
 OPEN_WORLD_TILESET = os.path.join(BASE_PATH, "assets/maps/tilesets/Scene Overview.png")
-OPEN_WORLD_TEMP_MAP = os.path.join(BASE_PATH, "assets/maps/victorian-preview.tmx")
+OPEN_WORLD_TEMP_MAP = os.path.join(BASE_PATH, "assets/maps/lpc-victorian-preview/victorian-preview.tmx")
 
 # ===== TRIGGERS DO MUNDO ABERTO =====
 WORLD_TRIGGER_CODES = {
@@ -55,6 +55,8 @@ WORLD_TRIGGER_CODES = {
 WORLD_TILE_SIZE = 16
 WORLD_MAP_WIDTH = 20
 WORLD_MAP_HEIGHT = 20
+WORLD_REGION_TILES = 32  # Lado (em tiles) de cada região carregada sob demanda
+WORLD_PREFETCH_RADIUS = 1  # Regiões vizinhas pré-carregadas ao redor do jogador
 
 # ===== AVATARS LOCAIS =====
 AVATARS_DIR = os.path.join(BASE_PATH, "assets", "avatars")
@@ -147,6 +149,9 @@ API_BASE_URL = f"http://{API_HOST}:{API_PORT}"
 MONGODB_URI = "mongodb://localhost:27017"
 MONGODB_DB_NAME = "rpg_emilly"
 
+# ===== BUNDLE OFFLINE DE PERGUNTAS =====
+QUESTION_BUNDLE_PATH = os.path.join(BASE_PATH, "data", "questions.bundle")
+
 # ===== CONFIGURAÇÕES DO JOGADOR =====
 PLAYER_START_X = 100
 PLAYER_START_Y = 100
@@ -184,6 +189,7 @@ SFX_VOLUME = 0.7
 # ===== CONFIGURAÇÕES DE DESEMPENHO =====
 FRAME_RATE = 50
 USE_SPATIAL_HASH = True  # Otimização de colisão
+MAP_CHUNK_TILES = 16  # Tamanho (em tiles) de cada pedaço do mapa desenhado
 
 # ===== CONFIGURAÇÕES DE DEBUG =====
 DEBUG_MODE = False
@@ -15,7 +15,9 @@ from config import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 from views.login_view import LoginView
 from api.app import app as fastapi_app
 from api.db.mongo import mongo
+from auth.simple_auth import auth_system
 import seed
+import question_bundle
 
 
 def check_arcade_version() -> bool:
@@ -123,6 +125,12 @@ def register_signal_handlers(termination_callback):
 def main():
     setup_environment()
 
+    # Compila o bundle offline de perguntas (só reescreve se o seed mudou)
+    try:
+        question_bundle.build_bundle(seed.QUIZZES)
+    except Exception as e:
+        print(f"⚠️ Aviso: não foi possível compilar o bundle de perguntas: {e}")
+
     # Conecta ao MongoDB (necessário para seed e operações)
     print("🔌 Conectando ao MongoDB...")
     if not mongo.connect():
@@ -164,6 +172,10 @@ def main():
     def terminate():
         try:
             print("🧹 Finalizando aplicação (salvando estado e desconectando)...")
+            try:
+                auth_system.flush()
+            except Exception:
+                pass
             try:
                 mongo.disconnect()
             except Exception:
@@ -190,6 +202,12 @@ def main():
     except Exception as e:
         print(f"❌ Erro crítico no jogo: {e}")
     finally:
+        # Grava saves pendentes da fila write-behind antes de sair
+        try:
+            auth_system.flush()
+            print(f"💾 Write-behind: {auth_system.write_stats()}")
+        except Exception:
+            pass
         # Certifica-se de desconectar do Mongo e encerrar
         try:
             mongo.disconnect()
@@ -0,0 +1,153 @@
+# question_bundle.py
+"""
+Bundle offline de perguntas, compilado a partir de seed.QUIZZES.
+
+Formato (little-endian):
+    b"DOQB" | versão do formato (u16) | tamanho do índice (u32) | índice JSON | blocos
+
+O índice guarda o hash do conteúdo e, para cada fase, o offset e o tamanho
+de um bloco JSON comprimido com zlib. O leitor mapeia o arquivo em memória
+e descomprime só a fase pedida, sem precisar da API nem do MongoDB.
+
+    python question_bundle.py    # (re)compila data/questions.bundle
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, List, Optional
+
+from config import QUESTION_BUNDLE_PATH
+
+MAGIC = b"DOQB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHI")
+
+
+def content_hash(quizzes: List[Dict]) -> str:
+    raw = json.dumps(quizzes, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()
+
+
+def build_bundle(quizzes: List[Dict], path: str = QUESTION_BUNDLE_PATH) -> Dict:
+    """Compila as perguntas por fase num bundle; só reescreve se o conteúdo mudou"""
+    digest = content_hash(quizzes)
+    current = QuestionBundle(path)
+    if current.version == digest:
+        current.close()
+        return {'success': True, 'path': path, 'rebuilt': False, 'version': digest}
+    current.close()
+
+    by_phase: Dict[int, List[Dict]] = {}
+    for i, quiz in enumerate(quizzes):
+        # mesmo formato da API: cada pergunta tem um _id estável
+        question = {"_id": f"seed-{quiz['phase']}-{i}", **quiz}
+        by_phase.setdefault(quiz["phase"], []).append(question)
+
+    blocks = []
+    phases = {}
+    offset = 0
+    for phase in sorted(by_phase):
+        block = zlib.compress(
+            json.dumps(by_phase[phase], separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+            9
+        )
+        phases[str(phase)] = [offset, len(block)]
+        blocks.append(block)
+        offset += len(block)
+
+    index = json.dumps({"version": digest, "phases": phases}, separators=(",", ":")).encode("utf-8")
+    base = HEADER.size + len(index)
+    # offsets do índice são relativos ao fim do cabeçalho + índice
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(index)))
+        f.write(index)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, path)
+
+    print(f"📦 Bundle de perguntas compilado: {len(quizzes)} perguntas, {len(phases)} fases, {base + offset} bytes")
+    return {'success': True, 'path': path, 'rebuilt': True, 'version': digest}
+
+
+class QuestionBundle:
+    """Leitor do bundle: mmap do arquivo e descompressão por fase"""
+
+    def __init__(self, path: str = QUESTION_BUNDLE_PATH):
+        self.path = path
+        self.version = None
+        self.phases: Dict[str, List[int]] = {}
+        self._data = None
+        self._base = 0
+        self._file = None
+        self._open()
+
+    def _open(self):
+        try:
+            self._file = open(self.path, "rb")
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, fmt, index_len = HEADER.unpack_from(self._data, 0)
+            if magic != MAGIC or fmt != FORMAT_VERSION:
+                raise ValueError(f"formato de bundle não suportado: {magic!r} v{fmt}")
+            index = json.loads(self._data[HEADER.size:HEADER.size + index_len])
+            self.version = index["version"]
+            self.phases = index["phases"]
+            self._base = HEADER.size + index_len
+        except FileNotFoundError:
+            self.close()
+        except Exception as e:
+            print(f"⚠️ Bundle de perguntas inválido ({self.path}): {e}")
+            self.close()
+
+    @property
+    def available(self) -> bool:
+        return self._data is not None
+
+    def load_phase(self, phase: int) -> Optional[List[Dict]]:
+        if not self.available:
+            return None
+        entry = self.phases.get(str(phase))
+        if not entry:
+            return None
+        offset, length = entry
+        start = self._base + offset
+        return json.loads(zlib.decompress(self._data[start:start + length]))
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_bundle: Optional[QuestionBundle] = None
+_bundle_lock = threading.Lock()
+
+
+def load_phase(phase: int) -> Optional[List[Dict]]:
+    """Perguntas de uma fase a partir do bundle local, ou None se não houver"""
+    global _bundle
+    with _bundle_lock:
+        if _bundle is None:
+            _bundle = QuestionBundle()
+        try:
+            return _bundle.load_phase(phase)
+        except Exception as e:
+            print(f"⚠️ Falha ao ler fase {phase} do bundle: {e}")
+            return None
+
+
+if __name__ == "__main__":
+    from seed import QUIZZES
+
+    result = build_bundle(QUIZZES)
+    if not result['rebuilt']:
+        print(f"✅ Bundle já atualizado ({result['version'][:12]})")
@@ -0,0 +1,85 @@
+# utils/chunked_map.py
+import arcade
+
+
+class ChunkedTileRenderer:
+    """
+    Desenha as layers de um TileMap em pedaços (chunks) de N x N tiles.
+    Só os chunks visíveis pela câmera são desenhados; a SpriteList de cada
+    chunk é montada na primeira vez que ele aparece e descartada quando
+    fica longe da câmera, então o custo por frame depende do tamanho da
+    tela e não do tamanho do mapa.
+    """
+
+    def __init__(self, tile_map, chunk_tiles: int = 16, keep_margin: int = 1):
+        self.chunk_tiles = chunk_tiles
+        self.keep_margin = keep_margin
+        self.chunk_px = chunk_tiles * tile_map.tile_width * tile_map.scaling
+
+        # layer -> {(cx, cy): [sprites]}; só referências, nada vai para a GPU aqui
+        self.layers = {}
+        for name, sprite_list in tile_map.sprite_lists.items():
+            buckets = {}
+            for sprite in sprite_list:
+                buckets.setdefault(self._key(sprite.center_x, sprite.center_y), []).append(sprite)
+            self.layers[name] = buckets
+
+        # (layer, cx, cy) -> SpriteList montada
+        self.built = {}
+
+    def _key(self, x: float, y: float):
+        return int(x // self.chunk_px), int(y // self.chunk_px)
+
+    def _chunk_range(self, left: float, right: float, bottom: float, top: float, margin: int = 0):
+        x0, y0 = self._key(left, bottom)
+        x1, y1 = self._key(right, top)
+        return range(x0 - margin, x1 + margin + 1), range(y0 - margin, y1 + margin + 1)
+
+    @staticmethod
+    def _view_rect(camera: arcade.camera.Camera2D):
+        """Retângulo visível em coordenadas do mundo (left, right, bottom, top)"""
+        x, y = camera.position
+        return x + camera.left, x + camera.right, y + camera.bottom, y + camera.top
+
+    def _get_chunk(self, layer: str, cx: int, cy: int):
+        key = (layer, cx, cy)
+        chunk = self.built.get(key)
+        if chunk is None:
+            sprites = self.layers[layer].get((cx, cy))
+            if not sprites:
+                return None
+            chunk = arcade.SpriteList(lazy=True)
+            chunk.extend(sprites)
+            self.built[key] = chunk
+        return chunk
+
+    def draw(self, camera: arcade.camera.Camera2D):
+        """Desenha os chunks visíveis, layer por layer, na ordem do mapa"""
+        xs, ys = self._chunk_range(*self._view_rect(camera))
+        for layer in self.layers:
+            for cx in xs:
+                for cy in ys:
+                    chunk = self._get_chunk(layer, cx, cy)
+                    if chunk is not None:
+                        chunk.draw(pixelated=True)
+
+        self._unload_far_chunks(camera)
+
+    def _unload_far_chunks(self, camera: arcade.camera.Camera2D):
+        xs, ys = self._chunk_range(*self._view_rect(camera), self.keep_margin)
+        far = [key for key in self.built if key[1] not in xs or key[2] not in ys]
+        for key in far:
+            # clear() tira a SpriteList de sprite.sprite_lists; só descartar a
+            # lista deixaria uma referência morta em cada sprite (compartilhados
+            # entre views pelo cache de TileMap)
+            self.built.pop(key).clear()
+
+    def release(self):
+        """Descarta todos os chunks montados; são remontados sob demanda"""
+        for chunk in self.built.values():
+            chunk.clear()
+        self.built.clear()
+
+    def stats(self):
+        total = sum(len(buckets) for buckets in self.layers.values())
+        return {"chunks": total, "built": len(self.built)}
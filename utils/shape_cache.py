@@ -0,0 +1,79 @@
+# utils/shape_cache.py
+import math
+
+import arcade
+from arcade.shape_list import (
+    ShapeElementList,
+    create_ellipse_filled,
+    create_polygon,
+    create_rectangle_filled,
+    create_rectangle_outline,
+    create_triangles_strip_filled_with_colors,
+)
+
+CIRCLE_SEGMENTS = 48
+
+
+class ShapeCache:
+    """
+    Camadas de UI em modo retido. Cada camada é uma ShapeElementList
+    montada uma vez e desenhada com uma única chamada; ela só é remontada
+    quando a chave de estado (tamanho da janela, vidas, slots...) muda.
+    """
+
+    def __init__(self):
+        self._layers = {}  # nome -> (chave, ShapeElementList)
+        self.rebuilds = 0
+
+    def draw(self, name: str, key, build):
+        """Desenha a camada `name`; `build(shapes)` só roda se `key` mudou"""
+        cached = self._layers.get(name)
+        if cached is None or cached[0] != key:
+            shapes = ShapeElementList()
+            build(shapes)
+            cached = self._layers[name] = (key, shapes)
+            self.rebuilds += 1
+        cached[1].draw()
+
+    def invalidate(self, name: str = None):
+        if name is None:
+            self._layers.clear()
+        else:
+            self._layers.pop(name, None)
+
+
+def _rgba(color):
+    return arcade.types.Color.from_iterable(color)
+
+
+def lrbt_filled(left, right, bottom, top, color):
+    return create_rectangle_filled(
+        (left + right) / 2, (bottom + top) / 2, right - left, top - bottom, _rgba(color)
+    )
+
+
+def lrbt_outline(left, right, bottom, top, color, border_width=1):
+    return create_rectangle_outline(
+        (left + right) / 2, (bottom + top) / 2, right - left, top - bottom, _rgba(color), border_width
+    )
+
+
+def circle_filled(x, y, radius, color):
+    return create_ellipse_filled(x, y, radius * 2, radius * 2, _rgba(color), num_segments=CIRCLE_SEGMENTS)
+
+
+def circle_outline(x, y, radius, color, border_width=1):
+    """Anel com espessura (create_ellipse_outline só desenha linhas de 1px)"""
+    outer = radius + border_width / 2
+    inner = radius - border_width / 2
+    points = []
+    for i in range(CIRCLE_SEGMENTS + 1):
+        angle = 2 * math.pi * i / CIRCLE_SEGMENTS
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        points.append((x + outer * cos_a, y + outer * sin_a))
+        points.append((x + inner * cos_a, y + inner * sin_a))
+    return create_triangles_strip_filled_with_colors(points, [_rgba(color)] * len(points))
+
+
+def polygon_filled(points, color):
+    return create_polygon(points, _rgba(color))
@@ -0,0 +1,76 @@
+# utils/text_cache.py
+from collections import OrderedDict
+
+import arcade
+from arcade.types import Color
+
+
+class TextCache:
+    """
+    Cache LRU de arcade.Text compartilhado entre as views.
+    A chave inclui o conteúdo e o estilo, então cada texto é diagramado uma
+    vez; nos frames seguintes só posição e cor são atualizadas no objeto.
+    O cache do próprio arcade.draw_text usa só o estilo como chave e
+    rediagrama sempre que duas strings diferentes se alternam.
+    Um texto desenhado várias vezes por frame (sombra + texto, padrões
+    repetidos) deve ter o próprio arcade.Text na view: aqui ele seria
+    reposicionado a cada chamada.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, arcade.Text]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, x, y, color, font_size, width, align, font_name,
+            bold, italic, anchor_x, anchor_y, multiline, rotation, z) -> arcade.Text:
+        text = str(text)
+        color = Color.from_iterable(color)
+        key = (text, font_size, width, align, font_name, bold, italic,
+               anchor_x, anchor_y, multiline, rotation)
+
+        label = self._entries.get(key)
+        if label is None:
+            self.misses += 1
+            label = arcade.Text(
+                text, x, y, color, font_size,
+                width=width, align=align, font_name=font_name, bold=bold, italic=italic,
+                anchor_x=anchor_x, anchor_y=anchor_y, multiline=multiline,
+                rotation=rotation, z=z,
+            )
+            self._entries[key] = label
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return label
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        if label.x != x or label.y != y or label.z != z:
+            label.position = x, y, z
+        if label.color != color:
+            label.color = color
+        return label
+
+    def draw(self, text, x, y, color=arcade.color.WHITE, font_size=12.0, width=None,
+             align="left", font_name=("calibri", "arial"), bold=False, italic=False,
+             anchor_x="left", anchor_y="baseline", multiline=False, rotation=0, z=0):
+        self.get(text, x, y, color, font_size, width, align, font_name,
+                 bold, italic, anchor_x, anchor_y, multiline, rotation, z).draw()
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+text_cache = TextCache()
+
+
+def draw_text(text, x, y, color=arcade.color.WHITE, font_size=12.0, width=None,
+              align="left", font_name=("calibri", "arial"), bold=False, italic=False,
+              anchor_x="left", anchor_y="baseline", multiline=False, rotation=0, z=0):
+    """Substituto de arcade.draw_text com a mesma assinatura, usando o text_cache"""
+    text_cache.draw(text, x, y, color, font_size, width, align, font_name,
+                    bold, italic, anchor_x, anchor_y, multiline, rotation, z)
@@ -0,0 +1,59 @@
+# utils/trigger_grid.py
+import math
+
+import arcade
+
+
+class TriggerGrid:
+    """
+    Índice espacial de triggers por célula do mapa.
+    Em vez de testar colisão contra todos os triggers, olha só a célula
+    do jogador e as vizinhas, então o custo não cresce com o tamanho do mapa.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells = {}
+        # maior lado de trigger já indexado; triggers maiores que a célula
+        # alcançam o jogador a partir de células mais distantes
+        self.max_extent = 0.0
+
+    def _key(self, x: float, y: float):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def clear(self):
+        self.cells.clear()
+        self.max_extent = 0.0
+
+    def add(self, sprite: arcade.Sprite):
+        self.max_extent = max(self.max_extent, sprite.width, sprite.height)
+        self.cells.setdefault(self._key(sprite.center_x, sprite.center_y), []).append(sprite)
+
+    def remove(self, sprite: arcade.Sprite):
+        key = self._key(sprite.center_x, sprite.center_y)
+        sprites = self.cells.get(key)
+        if sprites and sprite in sprites:
+            sprites.remove(sprite)
+            if not sprites:
+                del self.cells[key]
+
+    def near(self, x: float, y: float, radius: int = 1):
+        """Triggers na célula de (x, y) e nas vizinhas até `radius` células"""
+        cx, cy = self._key(x, y)
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                yield from self.cells.get((cx + dx, cy + dy), ())
+
+    def find_hit(self, sprite: arcade.Sprite):
+        """Primeiro trigger que colide com o sprite, ou None"""
+        # há colisão só se a distância entre centros < (lado do sprite + lado do
+        # trigger) / 2; um trigger k células adiante está a mais de (k-1) células
+        reach = (max(sprite.width, sprite.height) + self.max_extent) / 2
+        radius = 1 + math.ceil(reach / self.cell_size)
+        for trig in self.near(sprite.center_x, sprite.center_y, radius):
+            if arcade.check_for_collision(sprite, trig):
+                return trig
+        return None
+
+    def __len__(self):
+        return sum(len(sprites) for sprites in self.cells.values())
@@ -0,0 +1,265 @@
+# utils/world_streaming.py
+import bisect
+import queue
+import threading
+from pathlib import Path
+
+import arcade
+import pytiled_parser
+
+# Os bits altos do gid guardam espelhamento/rotação do tile
+GID_MASK = 0x0FFFFFFF
+
+
+class WorldRegion:
+    """Conteúdo de uma região do mundo: tiles, triggers e perguntas"""
+
+    def __init__(self, key):
+        self.key = key
+        self.sprites = {}  # layer -> [Sprite] (montados na thread de carga)
+        self.sprite_lists = {}  # layer -> SpriteList (montadas na thread principal)
+        self.triggers = []  # sprites com .region_name
+        self.names = set()  # regiões nomeadas (WORLD_TRIGGER_CODES) presentes aqui
+        self.questions = {}  # nome da região -> perguntas
+
+
+class RegionStreamer:
+    """
+    Divide um mapa Tiled em regiões quadradas e as carrega sob demanda.
+    A leitura do TMX, o recorte das texturas e a busca de perguntas rodam
+    numa thread de fundo; a thread principal só pede as regiões dentro do
+    raio de pré-carga e descarta as que ficaram para trás.
+    """
+
+    def __init__(self, map_path, trigger_codes: dict, region_tiles: int = 32,
+                 prefetch_radius: int = 1, question_loader=None):
+        self.map_path = Path(map_path)
+        self.trigger_codes = trigger_codes
+        self.region_tiles = region_tiles
+        self.prefetch_radius = prefetch_radius
+        self.question_loader = question_loader
+
+        self.tiled_map = None
+        self.layer_names = []
+        self.region_px = 0
+        self.regions_x = self.regions_y = 0
+        self.ready = threading.Event()
+        self.error = None
+
+        self.loaded = {}  # (rx, ry) -> WorldRegion
+        self._requested = set()
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+
+        # usados só pela thread de carga
+        self._textures = {}
+        self._sheets = {}
+        self._firstgids = []
+        self._broken_tilesets = set()
+
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    # ------------------------------------------------------------------
+    # Thread principal
+    # ------------------------------------------------------------------
+
+    @property
+    def width(self):
+        return self.tiled_map.map_size.width * self.tiled_map.tile_size.width if self.tiled_map else 0
+
+    @property
+    def height(self):
+        return self.tiled_map.map_size.height * self.tiled_map.tile_size.height if self.tiled_map else 0
+
+    def region_at(self, x: float, y: float):
+        return int(x // self.region_px), int(y // self.region_px)
+
+    def _distance(self, a, b):
+        return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+    def update(self, x: float, y: float):
+        """
+        Pede as regiões ao redor de (x, y), integra as que terminaram de
+        carregar e descarta as distantes. Devolve (novas, descartadas).
+        """
+        if not self.ready.is_set():
+            return [], []
+
+        center = self.region_at(x, y)
+        radius = self.prefetch_radius
+
+        # mais próximas primeiro, para a região do jogador chegar antes
+        wanted = [
+            (rx, ry)
+            for rx in range(center[0] - radius, center[0] + radius + 1)
+            for ry in range(center[1] - radius, center[1] + radius + 1)
+            if 0 <= rx < self.regions_x and 0 <= ry < self.regions_y
+        ]
+        wanted.sort(key=lambda key: self._distance(key, center))
+        for key in wanted:
+            if key not in self.loaded and key not in self._requested:
+                self._requested.add(key)
+                self._requests.put(key)
+
+        added = []
+        while True:
+            try:
+                region = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._requested.discard(region.key)
+            if self._distance(region.key, center) > radius + 1:
+                continue
+            for layer, sprites in region.sprites.items():
+                sprite_list = arcade.SpriteList(lazy=True)
+                sprite_list.extend(sprites)
+                region.sprite_lists[layer] = sprite_list
+            region.sprites = {}
+            self.loaded[region.key] = region
+            added.append(region)
+
+        # uma região de folga evita carregar/descartar na fronteira
+        evicted = [
+            self.loaded.pop(key)
+            for key in list(self.loaded)
+            if self._distance(key, center) > radius + 1
+        ]
+        return added, evicted
+
+    def draw(self):
+        """Desenha as regiões carregadas, layer por layer"""
+        for layer in self.layer_names:
+            for region in self.loaded.values():
+                sprite_list = region.sprite_lists.get(layer)
+                if sprite_list is not None:
+                    sprite_list.draw(pixelated=True)
+
+    def stop(self):
+        self._requests.put(None)
+
+    # ------------------------------------------------------------------
+    # Thread de carga
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        try:
+            self.tiled_map = pytiled_parser.parse_map(self.map_path)
+            self._firstgids = sorted(self.tiled_map.tilesets)
+            self.layer_names = [
+                layer.name for layer in self.tiled_map.layers
+                if isinstance(layer, pytiled_parser.TileLayer) and layer.data
+            ]
+            self.region_px = self.region_tiles * self.tiled_map.tile_size.width
+            self.regions_x = -(-self.tiled_map.map_size.width // self.region_tiles)
+            self.regions_y = -(-self.tiled_map.map_size.height // self.region_tiles)
+            print(f"🌍 Mundo aberto: {self.regions_x}x{self.regions_y} regiões de {self.region_tiles} tiles")
+        except Exception as e:
+            self.error = e
+            print(f"❌ Erro ao ler mapa do mundo aberto: {e}")
+            return
+        finally:
+            self.ready.set()
+
+        while True:
+            key = self._requests.get()
+            if key is None:
+                return
+            try:
+                self._results.put(self._load_region(key))
+            except Exception as e:
+                print(f"❌ Erro ao carregar região {key}: {e}")
+
+    def _load_region(self, key):
+        region = WorldRegion(key)
+        tmap = self.tiled_map
+        tile_w, tile_h = tmap.tile_size.width, tmap.tile_size.height
+        map_w, map_h = tmap.map_size.width, tmap.map_size.height
+
+        cols = range(key[0] * self.region_tiles, min((key[0] + 1) * self.region_tiles, map_w))
+        # linhas contadas de baixo para cima, como nas coordenadas do arcade
+        rows_up = range(key[1] * self.region_tiles, min((key[1] + 1) * self.region_tiles, map_h))
+
+        tile_layers = [layer for layer in tmap.layers if layer.name in self.layer_names]
+        for layer_index, layer in enumerate(tile_layers):
+            sprites = []
+            for row_up in rows_up:
+                row = layer.data[map_h - row_up - 1]
+                for col in cols:
+                    gid = row[col] & GID_MASK
+                    if not gid:
+                        continue
+
+                    # triggers vêm da primeira layer, como no mapa da campanha
+                    if layer_index == 0 and gid in self.trigger_codes:
+                        name = self.trigger_codes[gid]
+                        trig = arcade.SpriteSolidColor(
+                            tile_w - 4, tile_h - 4, arcade.color.TRANSPARENT_BLACK
+                        )
+                        trig.center_x = col * tile_w + tile_w / 2
+                        trig.center_y = row_up * tile_h + tile_h / 2
+                        trig.region_name = name
+                        region.triggers.append(trig)
+                        region.names.add(name)
+
+                    texture = self._texture(gid)
+                    if texture is None:
+                        continue
+                    # tiles maiores que a grade são ancorados no canto inferior esquerdo
+                    sprites.append(arcade.Sprite(
+                        texture,
+                        center_x=col * tile_w + texture.width / 2,
+                        center_y=row_up * tile_h + texture.height / 2,
+                    ))
+            if sprites:
+                region.sprites[layer.name] = sprites
+
+        if self.question_loader:
+            for name in region.names:
+                try:
+                    region.questions[name] = self.question_loader(name)
+                except Exception as e:
+                    print(f"⚠️ Perguntas da região {name} indisponíveis: {e}")
+
+        return region
+
+    def _resolve(self, path):
+        path = Path(path)
+        return path if path.is_absolute() else self.map_path.parent / path
+
+    def _texture(self, gid: int):
+        if gid in self._textures:
+            return self._textures[gid]
+
+        firstgid = self._firstgids[bisect.bisect_right(self._firstgids, gid) - 1]
+        tileset = self.tiled_map.tilesets[firstgid]
+        local_id = gid - firstgid
+        texture = None
+        try:
+            if tileset.image is not None:
+                image = self._resolve(tileset.image)
+                sheet = self._sheets.get(image)
+                if sheet is None:
+                    sheet = self._sheets[image] = arcade.load_spritesheet(image)
+                col, row = local_id % tileset.columns, local_id // tileset.columns
+                texture = sheet.get_texture(
+                    arcade.LBWH(
+                        tileset.margin + col * (tileset.tile_width + tileset.spacing),
+                        tileset.margin + row * (tileset.tile_height + tileset.spacing),
+                        tileset.tile_width,
+                        tileset.tile_height,
+                    ),
+                    hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+                )
+            elif tileset.tiles and local_id in tileset.tiles and tileset.tiles[local_id].image:
+                texture = arcade.load_texture(
+                    self._resolve(tileset.tiles[local_id].image),
+                    hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+                )
+        except Exception as e:
+            if tileset.name not in self._broken_tilesets:
+                self._broken_tilesets.add(tileset.name)
+                print(f"⚠️ Tileset {tileset.name} indisponível: {e}")
+
+        self._textures[gid] = texture
+        return texture
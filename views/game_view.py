@@ -6,13 +6,131 @@ import requests
 import math
 import json
 import os
+import copy
+import hashlib
 import threading
 
-from config import RAW_MAP_PATH, TEMP_MAP_PATH, TILE_SIZE, PHASE_TRIGGER_CODES
+from config import (
+    BASE_PATH, RAW_MAP_PATH, TEMP_MAP_PATH, TILE_SIZE, PHASE_TRIGGER_CODES,
+    USE_SPATIAL_HASH, MAP_CHUNK_TILES,
+)
 from assets.xp.xp import XPBar
 from auth.user_manager import user_manager
 from auth.simple_auth import auth_system
 from assets.characters.character_movement import CharacterMovement  # 🔥 NOVO IMPORT
+from utils.trigger_grid import TriggerGrid
+from utils.chunked_map import ChunkedTileRenderer
+from utils.text_cache import draw_text
+
+
+# Tileset injetado inline no mapa processado
+MAP_TILESET_SOURCE = "assets/maps/tilesets/tilemap_packed.png"
+# Incrementar quando _process_tmx_map mudar a forma de gerar o mapa
+TMX_CACHE_VERSION = 1
+TMX_HASH_PATH = TEMP_MAP_PATH + ".sha1"
+
+
+def tmx_inputs_hash() -> str:
+    """Hash do TMX original, do tileset e da versão do processamento"""
+    digest = hashlib.sha1(f"v{TMX_CACHE_VERSION}".encode())
+    for path in (RAW_MAP_PATH, os.path.join(BASE_PATH, MAP_TILESET_SOURCE)):
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+# Mapas já carregados, por caminho: (mtime, TileMap, índice de triggers)
+_TILE_MAP_CACHE = {}
+
+
+def build_trigger_index(tile_map, codes=PHASE_TRIGGER_CODES):
+    """
+    Varre uma vez a primeira layer de tiles e devolve {gid: [(x, y), ...]}
+    com o centro, em pixels, de cada célula cujo gid é um trigger.
+    """
+    layer = None
+    for candidate in tile_map.tiled_map.layers:
+        if hasattr(candidate, 'data'):
+            layer = candidate
+            break
+
+    index = {}
+    if not layer:
+        print("❌ Nenhuma layer encontrada no mapa")
+        return index
+
+    rows = len(layer.data)
+    for r, row in enumerate(layer.data):
+        for c, gid in enumerate(row):
+            if gid in codes:
+                x = c * TILE_SIZE + TILE_SIZE / 2
+                y = (rows - r - 1) * TILE_SIZE + TILE_SIZE / 2
+                index.setdefault(gid, []).append((x, y))
+    return index
+
+
+def load_tile_map_cached(path: str):
+    """Carrega o TileMap e seu índice de triggers só quando o arquivo mudou"""
+    mtime = os.path.getmtime(path)
+    cached = _TILE_MAP_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    tile_map = arcade.load_tilemap(
+        path,
+        scaling=1.0,
+        use_spatial_hash=True,
+        lazy=False
+    )
+    trigger_cells = build_trigger_index(tile_map)
+    _TILE_MAP_CACHE[path] = (mtime, tile_map, trigger_cells)
+    return tile_map, trigger_cells
+
+
+class ProgressAutosaver:
+    """
+    Persiste snapshots de progresso numa thread própria, fora do frame.
+    Só existe um salvamento em andamento por vez; snapshots que chegam
+    enquanto ele roda substituem uns aos outros e apenas o mais recente
+    é gravado.
+    """
+
+    def __init__(self, persist_fn):
+        self.persist_fn = persist_fn
+        self._pending = None
+        self._worker = None
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def submit(self, snapshot: dict):
+        with self._lock:
+            self._pending = snapshot
+            if self._worker is not None:
+                return
+            self._idle.clear()
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Bloqueia até não haver salvamento pendente"""
+        return self._idle.wait(timeout)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+                if snapshot is None:
+                    self._worker = None
+                    self._idle.set()
+                    return
+            try:
+                self.persist_fn(snapshot)
+            except Exception as e:
+                print(f"❌ Erro no salvamento em segundo plano: {e}")
 
 
 class GameView(arcade.View):
@@ -49,6 +167,10 @@ class GameView(arcade.View):
         self.is_moving = False
 
         self.trigger_list = arcade.SpriteList()
+        self.phase_triggers = {}  # fase -> sprites de trigger (criados uma vez)
+        self.trigger_cells = {}  # gid -> posições das células de trigger
+        self.trigger_grid = TriggerGrid(TILE_SIZE)  # índice espacial dos triggers ativos
+        self.tile_map = None
         self.near_trigger = None
         self.animation_time = 0.0
         self.status_message = ""
@@ -58,6 +180,11 @@ class GameView(arcade.View):
         self.map_width = 0
         self.map_height = 0
 
+        # Renderização em chunks com câmera seguindo o jogador
+        self.map_renderer = None
+        self.camera = None
+        self.gui_camera = None
+
         # Sistema de campanha - MELHORADO para persistência
         self.campaign_data = None
         self.fase_status = {}
@@ -68,7 +195,12 @@ class GameView(arcade.View):
 
         # NOVO: Sistema de salvamento automático melhorado
         self.last_save_time = 0.0
-        self.save_interval = 5.0  # Salva a cada 5 segundos (mais frequente)
+        self.save_interval = 5.0  # Verifica mudanças a cada 5 segundos
+        # Só salva se o personagem andou pelo menos isso desde o último save
+        self.autosave_min_distance = TILE_SIZE * 2
+        self._saved_fingerprint = None
+        self._saved_position = None
+        self.autosaver = ProgressAutosaver(self._persist_progress)
 
         # NOVO: Controle de fase/quiz para permitir RETENTATIVA e retorno ao mapa
         self.last_started_phase = None
@@ -261,13 +393,14 @@ class GameView(arcade.View):
         try:
             self._process_tmx_map()
 
-            tile_map = arcade.load_tilemap(
-                TEMP_MAP_PATH,
-                scaling=1.0,
-                use_spatial_hash=True,
-                lazy=False
-            )
+            tile_map, self.trigger_cells = load_tile_map_cached(TEMP_MAP_PATH)
+            self.tile_map = tile_map
             self.scene = arcade.Scene.from_tilemap(tile_map)
+            if self.map_renderer:
+                self.map_renderer.release()
+            self.map_renderer = ChunkedTileRenderer(tile_map, MAP_CHUNK_TILES)
+            self.camera = arcade.camera.Camera2D()
+            self.gui_camera = arcade.camera.Camera2D()
 
             self.map_width = tile_map.width * TILE_SIZE
             self.map_height = tile_map.height * TILE_SIZE
@@ -304,9 +437,9 @@ class GameView(arcade.View):
     def _setup_triggers_robust(self):
         """Configura triggers de forma robusta"""
         try:
-            from arcade import load_tilemap
-            tile_map = load_tilemap(TEMP_MAP_PATH, scaling=1.0)
-            self._setup_triggers(tile_map)
+            if self.tile_map is None:
+                self.tile_map, self.trigger_cells = load_tile_map_cached(TEMP_MAP_PATH)
+            self._setup_triggers()
             print("✅ Triggers configurados")
         except Exception as e:
             print(f"⚠️ Erro nos triggers: {e}")
@@ -372,98 +505,142 @@ class GameView(arcade.View):
             print(f"❌ Erro crítico no setup: {e}")
             self._emergency_setup()
 
-    def _save_user_progress_robust(self):
-        """SALVA TODO O PROGRESSO DO USUÁRIO DE FORMA ROBUSTA - MELHORADO"""
-        try:
-            # ATUALIZA DADOS LOCAIS
-            if self.user_data:
-                # Dados de XP e nível
-                self.user_data["xp"] = self.xp_bar.current_xp if self.xp_bar else 0
-                self.user_data["level"] = self.xp_bar.level if self.xp_bar else 1
-
-                # Progresso da campanha - SALVA TODOS OS DADOS ATUAIS
-                self.user_data["campaign_progress"] = {
-                    "fase_atual": max([f for f, s in self.fase_status.items() if s in ["liberada", "concluida"]], default=1),
-                    "fases": self.fase_status,
-                    "fases_concluidas": self.fases_concluidas
-                }
-
-                # POSIÇÃO DO PERSONAGEM - SALVA SEMPRE
-                if self.player_sprite:
-                    self.character_data["position"] = {
-                        "x": self.player_sprite.center_x,
-                        "y": self.player_sprite.center_y
-                    }
-                self.user_data["character"] = self.character_data
+    def _progress_fingerprint(self):
+        """Resumo do estado que vale a pena salvar (exceto posição)"""
+        return (
+            self.xp_bar.current_xp if self.xp_bar else 0,
+            self.xp_bar.level if self.xp_bar else 1,
+            frozenset(self.fase_status.items()),
+            tuple(self.fases_concluidas),
+        )
 
-            # SALVA NO AUTH_SYSTEM (PRINCIPAL)
-            try:
-                if self.current_user and self.user_data:
-                    if hasattr(auth_system, "update_user_data"):
-                        success = auth_system.update_user_data(self.current_user, self.user_data)
-                    else:
-                        success = getattr(auth_system, "update_user_xp", lambda u, xp, lvl: False)(
-                            self.current_user,
-                            self.user_data.get("xp", 0),
-                            self.user_data.get("level", 1)
-                        )
-                    if success:
-                        print("💾 Progresso salvo no auth_system")
-                    else:
-                        print("⚠️ Falha ao salvar no auth_system")
-            except Exception as e:
-                print(f"⚠️ auth_system indisponível: {e}")
+    def _progress_changed(self) -> bool:
+        """True se XP, campanha ou posição mudaram desde o último salvamento"""
+        if self._progress_fingerprint() != self._saved_fingerprint:
+            return True
+        if self.player_sprite and self._saved_position:
+            x, y = self._saved_position
+            dist = math.hypot(self.player_sprite.center_x - x, self.player_sprite.center_y - y)
+            return dist >= self.autosave_min_distance
+        return self.player_sprite is not None
+
+    def _collect_progress(self):
+        """Atualiza user_data com o estado atual e devolve uma cópia independente"""
+        if not self.user_data:
+            return None
+
+        # Dados de XP e nível
+        self.user_data["xp"] = self.xp_bar.current_xp if self.xp_bar else 0
+        self.user_data["level"] = self.xp_bar.level if self.xp_bar else 1
+
+        # Progresso da campanha - SALVA TODOS OS DADOS ATUAIS
+        self.user_data["campaign_progress"] = {
+            "fase_atual": max([f for f, s in self.fase_status.items() if s in ["liberada", "concluida"]], default=1),
+            "fases": self.fase_status,
+            "fases_concluidas": self.fases_concluidas
+        }
 
-            # SALVA NO MONGODB (BACKUP)
-            try:
-                if self.current_user:
-                    progress_data = {
-                        "username": self.current_user,
-                        "level": self.user_data.get("level", 1),
-                        "xp": self.user_data.get("xp", 0),
-                        "campaign_progress": self.user_data.get("campaign_progress", {}),
-                        "character": self.user_data.get("character", {})
-                    }
-
-                    resp = requests.put(
-                        f"http://127.0.0.1:8000/api/user/{self.current_user}/progress",
-                        json=progress_data,
-                        timeout=3
-                    )
-                    if resp.status_code == 200:
-                        print("💾 Progresso salvo no MongoDB")
-                    else:
-                        print(f"⚠️ MongoDB retornou status: {resp.status_code}")
-            except Exception as e:
-                print(f"⚠️ MongoDB não disponível: {e}")
+        # POSIÇÃO DO PERSONAGEM - SALVA SEMPRE
+        if self.player_sprite:
+            self.character_data["position"] = {
+                "x": self.player_sprite.center_x,
+                "y": self.player_sprite.center_y
+            }
+        self.user_data["character"] = self.character_data
 
-            # SALVA LOCALMENTE (EMERGÊNCIA) - MELHORADO
-            try:
-                backup_dir = "game_saves"
-                if not os.path.exists(backup_dir):
-                    os.makedirs(backup_dir)
-                
-                local_backup_path = os.path.join(backup_dir, f"backup_{self.current_user}.json")
-                with open(local_backup_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.user_data, f, indent=2, ensure_ascii=False)
-                print(f"💾 Backup local salvo: {local_backup_path}")
-            except Exception as e:
-                print(f"⚠️ Backup local falhou: {e}")
+        self._saved_fingerprint = self._progress_fingerprint()
+        if self.player_sprite:
+            self._saved_position = (self.player_sprite.center_x, self.player_sprite.center_y)
 
-            # ATUALIZA USER_MANAGER PARA SINCRONIZAR COM O MENU
-            try:
-                if self.xp_bar:
-                    user_manager.set_current_user(self.current_user, self.xp_bar)
-                    print("✅ UserManager atualizado")
-            except Exception as e:
-                print(f"⚠️ UserManager não atualizado: {e}")
+        # a thread de salvamento trabalha numa cópia; o frame segue alterando user_data
+        return copy.deepcopy(self.user_data)
 
+    def _save_user_progress_robust(self, blocking: bool = True):
+        """SALVA TODO O PROGRESSO DO USUÁRIO DE FORMA ROBUSTA - MELHORADO
+        Com blocking=False o salvamento roda em segundo plano e o frame não espera.
+        """
+        try:
+            snapshot = self._collect_progress()
+            if snapshot is None:
+                return False
+
+            # o cache do auth_system não é thread-safe: atualiza no frame (só marca o save)
+            self._save_to_auth_system()
+            self.autosaver.submit(snapshot)
+            if blocking:
+                self.autosaver.wait(timeout=10)
             return True
 
         except Exception as e:
             print(f"❌ Erro crítico ao salvar progresso: {e}")
             return False
 
+    def _save_to_auth_system(self):
+        """SALVA NO AUTH_SYSTEM (PRINCIPAL) - roda na thread do jogo"""
+        try:
+            if self.current_user and self.user_data:
+                if hasattr(auth_system, "update_user_data"):
+                    success = auth_system.update_user_data(self.current_user, self.user_data)
+                else:
+                    success = getattr(auth_system, "update_user_xp", lambda u, xp, lvl: False)(
+                        self.current_user,
+                        self.user_data.get("xp", 0),
+                        self.user_data.get("level", 1)
+                    )
+                if success:
+                    print("💾 Progresso salvo no auth_system")
+                else:
+                    print("⚠️ Falha ao salvar no auth_system")
+        except Exception as e:
+            print(f"⚠️ auth_system indisponível: {e}")
+
+    def _persist_progress(self, user_data: dict):
+        """Grava um snapshot no MongoDB e no backup local (thread de salvamento)"""
+        # SALVA NO MONGODB (BACKUP)
+        try:
+            if self.current_user:
+                progress_data = {
+                    "username": self.current_user,
+                    "level": user_data.get("level", 1),
+                    "xp": user_data.get("xp", 0),
+                    "campaign_progress": user_data.get("campaign_progress", {}),
+                    "character": user_data.get("character", {})
+                }
+
+                resp = requests.put(
+                    f"http://127.0.0.1:8000/api/user/{self.current_user}/progress",
+                    json=progress_data,
+                    timeout=3
+                )
+                if resp.status_code == 200:
+                    print("💾 Progresso salvo no MongoDB")
+                else:
+                    print(f"⚠️ MongoDB retornou status: {resp.status_code}")
+        except Exception as e:
+            print(f"⚠️ MongoDB não disponível: {e}")
+
+        # SALVA LOCALMENTE (EMERGÊNCIA) - JSON compacto, gravado de forma atômica
+        try:
+            backup_dir = "game_saves"
+            os.makedirs(backup_dir, exist_ok=True)
+
+            local_backup_path = os.path.join(backup_dir, f"backup_{self.current_user}.json")
+            tmp_path = local_backup_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(user_data, f, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp_path, local_backup_path)
+            print(f"💾 Backup local salvo: {local_backup_path}")
+        except Exception as e:
+            print(f"⚠️ Backup local falhou: {e}")
+
+        # ATUALIZA USER_MANAGER PARA SINCRONIZAR COM O MENU
+        try:
+            if self.xp_bar:
+                user_manager.set_current_user(self.current_user, self.xp_bar)
+                print("✅ UserManager atualizado")
+        except Exception as e:
+            print(f"⚠️ UserManager não atualizado: {e}")
+
     def _has_sprite_list(self, name: str) -> bool:
         """Verifica se uma sprite list existe na cena"""
         try:
@@ -473,8 +650,16 @@ class GameView(arcade.View):
             return False
 
     def _process_tmx_map(self):
-        """Processa o arquivo TMX e injeta tileset"""
+        """Processa o arquivo TMX e injeta tileset
+        O resultado é reaproveitado enquanto o hash das entradas não mudar.
+        """
         try:
+            inputs_hash = tmx_inputs_hash()
+            if os.path.exists(TEMP_MAP_PATH) and os.path.exists(TMX_HASH_PATH):
+                with open(TMX_HASH_PATH, encoding="utf-8") as f:
+                    if f.read().strip() == inputs_hash:
+                        return
+
             tree = ET.parse(RAW_MAP_PATH)
             root = tree.getroot()
 
@@ -493,61 +678,68 @@ class GameView(arcade.View):
                 "columns": "6"
             })
             image = ET.SubElement(tileset, "image", {
-                "source": "assets/maps/tilesets/tilemap_packed.png",
+                "source": MAP_TILESET_SOURCE,
                 "width": "192",
                 "height": "160"
             })
             root.insert(0, tileset)
 
             tree.write(TEMP_MAP_PATH, encoding="utf-8", xml_declaration=True)
+            with open(TMX_HASH_PATH, "w", encoding="utf-8") as f:
+                f.write(inputs_hash)
+            print("🗺️ Mapa TMX processado e armazenado em cache")
 
         except Exception as e:
             print(f"❌ Erro ao processar mapa TMX: {e}")
             raise
 
-    def _setup_triggers(self, tile_map):
-        """Configura os triggers de fase no mapa - SÓ FASES LIBERADAS"""
+    def _setup_triggers(self):
+        """Cria os sprites de trigger a partir do índice e ativa só as fases liberadas"""
         try:
-            # Encontra a layer de objetos ou a primeira layer de tiles
-            object_layer = None
-            for layer in tile_map.tiled_map.layers:
-                if hasattr(layer, 'data'):
-                    object_layer = layer
-                    break
-
-            if not object_layer:
-                print("❌ Nenhuma layer encontrada no mapa")
-                return
-
-            rows = len(object_layer.data)
-            cols = len(object_layer.data[0]) if rows > 0 else 0
-
-            for r in range(rows):
-                for c in range(cols):
-                    gid = object_layer.data[r][c]
-                    if gid in PHASE_TRIGGER_CODES:
-                        fase_id = PHASE_TRIGGER_CODES[gid]
-
-                        # SÓ CRIA TRIGGER SE A FASE ESTIVER DISPONÍVEL
-                        if fase_id not in self.available_phases:
-                            print(f"🔒 Trigger Fase {fase_id} ignorado (não disponível)")
-                            continue
+            self.phase_triggers = {}
+            for gid, positions in self.trigger_cells.items():
+                fase_id = PHASE_TRIGGER_CODES[gid]
+                for x, y in positions:
+                    trig = arcade.SpriteSolidColor(
+                        TILE_SIZE - 4, TILE_SIZE - 4, arcade.color.TRANSPARENT_BLACK
+                    )
+                    trig.center_x = x
+                    trig.center_y = y
+                    trig.phase = fase_id
+                    self.phase_triggers.setdefault(fase_id, []).append(trig)
 
-                        x = c * TILE_SIZE + TILE_SIZE / 2
-                        y = (rows - r - 1) * TILE_SIZE + TILE_SIZE / 2
+            self._refresh_triggers()
 
-                        trig = arcade.SpriteSolidColor(
-                            TILE_SIZE - 4, TILE_SIZE - 4, arcade.color.TRANSPARENT_BLACK
-                        )
-                        trig.center_x = x
-                        trig.center_y = y
-                        trig.phase = fase_id
-                        self.trigger_list.append(trig)
+        except Exception as e:
+            print(f"❌ Erro ao configurar triggers: {e}")
 
-                        print(f"✅ Trigger Fase {fase_id} ativo em ({x:.1f}, {y:.1f})")
+    def _refresh_triggers(self):
+        """Ativa os triggers das fases disponíveis - SÓ FASES LIBERADAS"""
+        self.trigger_list.clear()
+        self.trigger_grid.clear()
+        for fase_id, sprites in self.phase_triggers.items():
+            # SÓ ATIVA TRIGGER SE A FASE ESTIVER DISPONÍVEL
+            if fase_id not in self.available_phases:
+                print(f"🔒 Trigger Fase {fase_id} ignorado (não disponível)")
+                continue
+            for trig in sprites:
+                self.trigger_list.append(trig)
+                self.trigger_grid.add(trig)
+                print(f"✅ Trigger Fase {fase_id} ativo em ({trig.center_x:.1f}, {trig.center_y:.1f})")
+
+        # perguntas das fases liberadas chegam enquanto o jogador anda pelo mapa
+        self._prefetch_questions(
+            fase_id for fase_id, status in self.fase_status.items() if status == "liberada"
+        )
 
+    def _prefetch_questions(self, phases):
+        """Busca em segundo plano as perguntas das fases, para o quiz abrir na hora"""
+        try:
+            from views.quiz_view import question_cache
+            for fase_id in phases:
+                question_cache.prefetch(fase_id)
         except Exception as e:
-            print(f"❌ Erro ao configurar triggers: {e}")
+            print(f"⚠️ Pré-carregamento de perguntas falhou: {e}")
 
     def set_status(self, message: str, duration: float = 3.0):
         """Define mensagem de status temporária"""
@@ -565,7 +757,17 @@ class GameView(arcade.View):
 
         # Desenha a cena apenas se estiver configurada
         if self.scene and self.setup_complete:
-            self.scene.draw()
+            if self.map_renderer and self.camera:
+                # só os chunks visíveis pela câmera são desenhados
+                self._update_camera()
+                self.camera.use()
+                self.map_renderer.draw(self.camera)
+                self.scene["Player"].draw()
+                self._draw_trigger_highlight()
+                self.gui_camera.use()
+            else:
+                self.scene.draw()
+                self._draw_trigger_highlight()
 
         # Desenha UI
         self._draw_ui()
@@ -582,7 +784,7 @@ class GameView(arcade.View):
 
         # Mensagem de status
         if self.status_message and self.status_timer > 0:
-            arcade.draw_text(
+            draw_text(
                 self.status_message,
                 self.window.width / 2,
                 self.window.height - 50,
@@ -597,7 +799,7 @@ class GameView(arcade.View):
 
         # NOME DO PERSONAGEM
         if self.character_data and self.setup_complete:
-            arcade.draw_text(
+            draw_text(
                 f"Personagem: {self.character_data.get('name', 'Emily')}",
                 20,
                 self.window.height - 60,
@@ -608,8 +810,8 @@ class GameView(arcade.View):
 
         # Instruções (apenas se setup completo) - MELHORADO
         if self.setup_complete:
-            arcade.draw_text(
-                "WASD: Mover • ENTER: Iniciar fase • ESC: Voltar ao menu",
+            draw_text(
+                "WASD: Mover • ENTER: Iniciar fase • O: Mundo aberto • ESC: Voltar ao menu",
                 self.window.width / 2,
                 30,
                 arcade.color.LIGHT_GRAY,
@@ -619,7 +821,7 @@ class GameView(arcade.View):
 
         # Informações do jogador (apenas se setup completo)
         if self.xp_bar and self.setup_complete:
-            arcade.draw_text(
+            draw_text(
                 f"Jogador: {self.current_user}",
                 20,
                 self.window.height - 40,
@@ -628,7 +830,7 @@ class GameView(arcade.View):
                 bold=True
             )
 
-            arcade.draw_text(
+            draw_text(
                 f"LEVEL {self.xp_bar.level}",
                 self.window.width - 100,
                 self.window.height - 40,
@@ -638,7 +840,7 @@ class GameView(arcade.View):
                 bold=True
             )
 
-            arcade.draw_text(
+            draw_text(
                 f"XP: {self.xp_bar.current_xp}/{self.xp_bar.max_xp}",
                 self.window.width - 100,
                 self.window.height - 60,
@@ -652,7 +854,7 @@ class GameView(arcade.View):
         if not self.fase_status:
             return
 
-        arcade.draw_text(
+        draw_text(
             "STATUS DAS FASES:",
             self.window.width - 150,
             self.window.height - 100,
@@ -676,7 +878,7 @@ class GameView(arcade.View):
                 texto = f"Fase {fase_id}: ❌ Bloqueada"
                 cor = arcade.color.RED
 
-            arcade.draw_text(
+            draw_text(
                 texto,
                 self.window.width - 150,
                 y_pos,
@@ -702,9 +904,7 @@ class GameView(arcade.View):
                 texto = f"🔒 Fase {fase_id} bloqueada"
                 cor = arcade.color.RED
 
-            pulse = (math.sin(self.animation_time * 8) + 1) * 0.3 + 0.7
-
-            arcade.draw_text(
+            draw_text(
                 texto,
                 self.window.width / 2,
                 self.window.height - 100,
@@ -714,6 +914,11 @@ class GameView(arcade.View):
                 bold=True
             )
 
+    def _draw_trigger_highlight(self):
+        """Círculo pulsante ao redor do jogador (coordenadas do mundo)"""
+        if self.near_trigger and self.player_sprite:
+            pulse = (math.sin(self.animation_time * 8) + 1) * 0.3 + 0.7
+
             arcade.draw_circle_outline(
                 self.player_sprite.center_x,
                 self.player_sprite.center_y,
@@ -722,6 +927,17 @@ class GameView(arcade.View):
                 3
             )
 
+    def _update_camera(self):
+        """Centraliza a câmera no jogador sem mostrar além das bordas do mapa"""
+        half_w = self.camera.width / 2
+        half_h = self.camera.height / 2
+        x, y = half_w, half_h
+        if self.player_sprite:
+            x, y = self.player_sprite.center_x, self.player_sprite.center_y
+        x = min(max(x, half_w), max(half_w, self.map_width - half_w))
+        y = min(max(y, half_h), max(half_h, self.map_height - half_h))
+        self.camera.position = (x, y)
+
     def on_update(self, delta_time: float):
         """Atualiza a lógica do jogo - MELHORADO"""
         self.animation_time += delta_time
@@ -732,12 +948,16 @@ class GameView(arcade.View):
 
         if self.setup_complete and self.player_sprite:
             self._handle_movement(delta_time)
+            previous_trigger = self.near_trigger
             self._check_triggers()
+            if self.near_trigger and self.near_trigger is not previous_trigger:
+                # revalida o cache ao chegar perto da fase
+                self._prefetch_questions([self.near_trigger.phase])
 
-            # SALVA PROGRESSO AUTOMATICAMENTE A CADA save_interval (mais frequente)
+            # SALVA AUTOMATICAMENTE SÓ SE ALGO MUDOU, SEM TRAVAR O FRAME
             if self.last_save_time >= self.save_interval:
-                if self._save_user_progress_robust():
-                    print("💾 Salvamento automático realizado")
+                if self._progress_changed() and self._save_user_progress_robust(blocking=False):
+                    print("💾 Salvamento automático agendado")
                 self.last_save_time = 0.0
 
     def _handle_movement(self, delta_time: float):
@@ -771,6 +991,11 @@ class GameView(arcade.View):
         if not self.player_sprite:
             return
 
+        if USE_SPATIAL_HASH:
+            # só a célula do jogador e as vizinhas são testadas
+            self.near_trigger = self.trigger_grid.find_hit(self.player_sprite)
+            return
+
         hits = arcade.check_for_collision_with_list(
             self.player_sprite,
             self.trigger_list
@@ -813,17 +1038,31 @@ class GameView(arcade.View):
         elif key == arcade.key.X and self.setup_complete:
             if self.xp_bar:
                 levels = self.xp_bar.add_xp(50)
-                self._save_user_progress_robust()
+                self._save_user_progress_robust(blocking=False)
                 if levels > 0:
                     self.set_status(f"🎉 LEVEL UP! Novo nível: {self.xp_bar.level}")
                 else:
                     self.set_status(f"➕ +50 XP | Progresso: {self.xp_bar.current_xp}/{self.xp_bar.max_xp}")
 
+        elif key == arcade.key.O and self.setup_complete:
+            self._open_world()
+
         elif key == arcade.key.C and self.setup_complete:
             if self.near_trigger:
                 fase_id = self.near_trigger.phase
                 self._completar_fase(fase_id)
 
+    def _open_world(self):
+        """Abre o mundo aberto; ESC lá volta para esta view"""
+        try:
+            from views.world_view import OpenWorldView
+            world_view = OpenWorldView(self.character_data, parent=self)
+            world_view.setup()
+            self.window.show_view(world_view)
+        except Exception as e:
+            print(f"❌ Erro ao abrir mundo aberto: {e}")
+            self.set_status("❌ Mundo aberto indisponível")
+
     def on_key_release(self, key: int, modifiers: int):
         """Lida com liberação de teclas"""
         if key in self.keys:
@@ -923,13 +1162,10 @@ class GameView(arcade.View):
                         print(f"🔓 Nova fase liberada: {proxima_fase}")
 
                 # Salva progresso completo
-                self._save_user_progress_robust()
+                self._save_user_progress_robust(blocking=False)
 
-                # Atualiza triggers (remonta)
-                self.trigger_list.clear()
-                from arcade import load_tilemap
-                tile_map = load_tilemap(TEMP_MAP_PATH, scaling=1.0)
-                self._setup_triggers(tile_map)
+                # Atualiza triggers (só liga/desliga os sprites já criados)
+                self._refresh_triggers()
 
                 # Limpa referência de última fase (já concluída)
                 self.last_started_phase = None
@@ -999,13 +1235,10 @@ class GameView(arcade.View):
                     self.set_status(f"🌟 LEVEL UP! Novo nível: {self.xp_bar.level}")
 
             # SALVA PROGRESSO COMPLETO
-            self._save_user_progress_robust()
+            self._save_user_progress_robust(blocking=False)
 
             # Atualiza triggers
-            self.trigger_list.clear()
-            from arcade import load_tilemap
-            tile_map = load_tilemap(TEMP_MAP_PATH, scaling=1.0)
-            self._setup_triggers(tile_map)
+            self._refresh_triggers()
 
         except Exception as e:
             print(f"❌ Erro ao completar fase: {e}")
@@ -1049,7 +1282,14 @@ class GameView(arcade.View):
     def on_hide_view(self):
         """Chamado quando a view é escondida - SALVA PROGRESSO"""
         print("⏸️  GameView pausada - Salvando progresso...")
-        self._save_user_progress_robust()
+        if self._progress_changed():
+            self._save_user_progress_robust()
+        else:
+            # nada novo: só garante que o salvamento em segundo plano terminou
+            self.autosaver.wait(timeout=10)
+        if self.map_renderer:
+            # os sprites do TileMap em cache não guardam referência aos chunks desta view
+            self.map_renderer.release()
         if self.on_exit_callback:
             self.on_exit_callback()
 
@@ -1059,6 +1299,9 @@ class GameView(arcade.View):
 
     def on_resize(self, width: int, height: int):
         """Lida com redimensionamento da janela"""
+        if self.camera:
+            self.camera.match_window()
+            self.gui_camera.match_window()
         if self.xp_bar:
             self.xp_bar.window_width = width
             self.xp_bar.window_height = height
\ No newline at end of file
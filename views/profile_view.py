@@ -1,8 +1,10 @@
 # views/profile_view.py
 
 import arcade
+import pyglet
 from auth.simple_auth import auth_system
 from auth.user_manager import user_manager
+from utils.text_cache import draw_text
 
 
 class ProfileView(arcade.View):
@@ -23,6 +25,11 @@ class ProfileView(arcade.View):
         self.character_sprite_list = arcade.SpriteList()
         self.avatar_sprite_list = arcade.SpriteList()
         
+        # Padrão decorativo do fundo (montado no primeiro draw)
+        self._pattern_batch = None
+        self._pattern_texts = []
+        self._pattern_size = None
+        
         # Componentes de UI
         self.active_tab = 0
         self.tabs = ["PERSONAGEM", "EQUIPAMENTOS"]
@@ -192,15 +199,22 @@ class ProfileView(arcade.View):
             (15, 10, 25)
         )
         
-        # Padrão decorativo
-        for i in range(0, width, 80):
-            for j in range(0, height, 80):
-                if (i + j) % 160 == 0:
-                    arcade.draw_text(
-                        "◆", i, j, 
-                        (139, 0, 0, 30), 16,
-                        anchor_x="center", anchor_y="center"
-                    )
+        # Padrão decorativo: um batch com todos os losangos, remontado só no resize
+        if self._pattern_size != (width, height):
+            self._pattern_batch = pyglet.graphics.Batch()
+            self._pattern_texts = [
+                arcade.Text(
+                    "◆", i, j, 
+                    (139, 0, 0, 30), 16,
+                    anchor_x="center", anchor_y="center",
+                    batch=self._pattern_batch
+                )
+                for i in range(0, width, 80)
+                for j in range(0, height, 80)
+                if (i + j) % 160 == 0
+            ]
+            self._pattern_size = (width, height)
+        self._pattern_batch.draw()
 
     def _draw_main_layout(self):
         """Desenha estrutura principal do layout"""
@@ -253,7 +267,7 @@ class ProfileView(arcade.View):
         if self.avatar_texture:
             self._draw_avatar_sprite(avatar_x, avatar_y)
         else:
-            arcade.draw_text(
+            draw_text(
                 "👤", avatar_x, avatar_y,
                 (200, 200, 200), 32,
                 anchor_x="center", anchor_y="center"
@@ -262,20 +276,20 @@ class ProfileView(arcade.View):
         # Informações do usuário
         info_y = avatar_y - 80
         
-        arcade.draw_text(
+        draw_text(
             self.display_name, panel_x, info_y,
             (255, 255, 255), 20,
             anchor_x="center", bold=True
         )
         
-        arcade.draw_text(
+        draw_text(
             f"@{self.username}", panel_x, info_y - 25,
             (150, 150, 150), 14,
             anchor_x="center"
         )
         
         # Guilda
-        arcade.draw_text(
+        draw_text(
             self.guild, panel_x, info_y - 50,
             (255, 215, 0), 16,
             anchor_x="center", bold=True
@@ -284,7 +298,7 @@ class ProfileView(arcade.View):
         # Level e XP
         level_y = info_y - 85
         
-        arcade.draw_text(
+        draw_text(
             f"LEVEL {self.level}", panel_x, level_y,
             (255, 215, 0), 18,
             anchor_x="center", bold=True
@@ -317,21 +331,21 @@ class ProfileView(arcade.View):
         )
         
         # Texto XP
-        arcade.draw_text(
+        draw_text(
             f"{self.xp}%", panel_x, bar_y - 20,
             (200, 200, 200), 12,
             anchor_x="center"
         )
         
         # Troféus
-        arcade.draw_text(
+        draw_text(
             f"🏆 {self.trophies}", panel_x, bar_y - 45,
             (255, 215, 0), 16,
             anchor_x="center", bold=True
         )
         
         # Moedas
-        arcade.draw_text(
+        draw_text(
             f"💰 {self.coins} moedas", panel_x, bar_y - 75,
             (255, 215, 0), 16,
             anchor_x="center", bold=True
@@ -366,7 +380,7 @@ class ProfileView(arcade.View):
         )
         
         # Título
-        arcade.draw_text(
+        draw_text(
             "ATRIBUTOS DO PERSONAGEM",
             x, y + height/2 - 30,
             (255, 215, 0), 24,
@@ -379,7 +393,7 @@ class ProfileView(arcade.View):
         if self.character_texture:
             self._draw_character_sprite(char_x, char_y, 150)
         else:
-            arcade.draw_text(
+            draw_text(
                 "🎮", char_x, char_y,
                 (200, 200, 200), 64,
                 anchor_x="center", anchor_y="center"
@@ -388,7 +402,7 @@ class ProfileView(arcade.View):
         # Nome do personagem
         if self.characters:
             current_char = self.characters[self.current_character_index]
-            arcade.draw_text(
+            draw_text(
                 current_char["name"],
                 char_x, char_y - 90,
                 (255, 255, 255), 20,
@@ -418,21 +432,21 @@ class ProfileView(arcade.View):
             attr_y = atributos_y - (i * 35)
             
             # Ícone
-            arcade.draw_text(
+            draw_text(
                 icone, stats_x - 100, attr_y,
                 (255, 215, 0), 14,
                 anchor_x="center", anchor_y="center"
             )
             
             # Nome do atributo
-            arcade.draw_text(
+            draw_text(
                 nome, stats_x - 80, attr_y,
                 (200, 200, 200), 12,
                 anchor_y="center"
             )
             
             # Valor
-            arcade.draw_text(
+            draw_text(
                 str(valor), stats_x + 120, attr_y,
                 (255, 255, 255), 14,
                 anchor_x="right", anchor_y="center", bold=True
@@ -448,7 +462,7 @@ class ProfileView(arcade.View):
         )
         
         # Título
-        arcade.draw_text(
+        draw_text(
             "INVENTÁRIO - EQUIPAMENTOS",
             x, y + height/2 - 30,
             (255, 215, 0), 24,
@@ -476,7 +490,7 @@ class ProfileView(arcade.View):
         )
         
         # Texto do botão
-        arcade.draw_text(
+        draw_text(
             "⚙️ CONFIGURAR BARRA DE ATIVAÇÃO",
             button_x, button_y,
             (255, 255, 255), 16,
@@ -491,7 +505,7 @@ class ProfileView(arcade.View):
         
         # Lista de itens do inventário
         start_y = button_y - 80
-        arcade.draw_text(
+        draw_text(
             "SEU INVENTÁRIO:",
             x - width/2 + 40, start_y,
             (255, 215, 0), 18,
@@ -528,7 +542,7 @@ class ProfileView(arcade.View):
         )
         
         # Título
-        arcade.draw_text(
+        draw_text(
             "CONFIGURAÇÃO DA BARRA DE ATIVAÇÃO",
             x, y + height/2 - 30,
             (255, 215, 0), 24,
@@ -536,7 +550,7 @@ class ProfileView(arcade.View):
         )
         
         # Instruções
-        arcade.draw_text(
+        draw_text(
             "Clique em um item do inventário e depois em um slot para equipar",
             x, y + height/2 - 60,
             (200, 200, 200), 14,
@@ -548,7 +562,7 @@ class ProfileView(arcade.View):
         
         # Lista de itens do inventário abaixo da hotbar
         inventory_y = y - 200
-        arcade.draw_text(
+        draw_text(
             "SEU INVENTÁRIO:",
             x - width/2 + 40, inventory_y,
             (255, 215, 0), 18,
@@ -581,7 +595,7 @@ class ProfileView(arcade.View):
             x - 80, x + 80, back_button_y - 20, back_button_y + 20,
             (139, 0, 0)
         )
-        arcade.draw_text(
+        draw_text(
             "VOLTAR", x, back_button_y,
             (255, 255, 255), 14,
             anchor_x="center", anchor_y="center", bold=True
@@ -594,7 +608,7 @@ class ProfileView(arcade.View):
             x - 80, x + 80, save_button_y - 20, save_button_y + 20,
             (0, 150, 0)
         )
-        arcade.draw_text(
+        draw_text(
             "SALVAR", x, save_button_y,
             (255, 255, 255), 14,
             anchor_x="center", anchor_y="center", bold=True
@@ -608,7 +622,7 @@ class ProfileView(arcade.View):
         start_x = x - (width / 2) + slot_size/2
         
         # Título dos slots numéricos
-        arcade.draw_text(
+        draw_text(
             "ARMAS/HABILIDADES (1-8)",
             x, y + 100,
             (255, 215, 0), 16,
@@ -622,7 +636,7 @@ class ProfileView(arcade.View):
             self._draw_hotbar_slot(slot_x, y + 50, slot_size, slot_id, is_circle=False)
         
         # Título dos slots de poções
-        arcade.draw_text(
+        draw_text(
             "POÇÕES (A-G)",
             x, y - 30,
             (255, 215, 0), 16,
@@ -661,7 +675,7 @@ class ProfileView(arcade.View):
             )
         
         # ID do slot (número ou letra)
-        arcade.draw_text(
+        draw_text(
             slot_id, x, y,
             (255, 255, 255), 16,
             anchor_x="center", anchor_y="center", bold=True
@@ -681,7 +695,7 @@ class ProfileView(arcade.View):
             }
             
             icon = item_icons.get(item_id, "❓")
-            arcade.draw_text(
+            draw_text(
                 icon, x, y - 2,
                 (255, 255, 255), 20,
                 anchor_x="center", anchor_y="center"
@@ -706,14 +720,14 @@ class ProfileView(arcade.View):
         )
         
         # Ícone
-        arcade.draw_text(
+        draw_text(
             item_data["icon"], x - width/2 + 30, y,
             (255, 215, 0), 24,
             anchor_y="center"
         )
         
         # Nome
-        arcade.draw_text(
+        draw_text(
             item_data["name"], x - width/2 + 70, y + 10,
             (255, 255, 255), 16,
             bold=True
@@ -723,13 +737,13 @@ class ProfileView(arcade.View):
         type_color = (100, 200, 255) if item_data["type"] == "weapon" else (
             (255, 100, 255) if item_data["type"] == "skill" else (100, 255, 100)
         )
-        arcade.draw_text(
+        draw_text(
             f"Tipo: {item_data['type']}", x - width/2 + 70, y - 10,
             type_color, 12
         )
         
         # Quantidade
-        arcade.draw_text(
+        draw_text(
             f"Quantidade: {quantity}", x + width/2 - 20, y,
             (200, 200, 200), 12,
             anchor_x="right", anchor_y="center"
@@ -760,7 +774,7 @@ class ProfileView(arcade.View):
         )
         
         # Texto
-        arcade.draw_text(
+        draw_text(
             f"VIDA: {personagem['vida']}/{personagem['vida_maxima']}",
             x, y - 25,
             (255, 255, 255), 12,
@@ -792,7 +806,7 @@ class ProfileView(arcade.View):
         )
         
         # Texto
-        arcade.draw_text(
+        draw_text(
             f"MANA: {personagem['mana']}/{personagem['mana_maxima']}",
             x, y - 25,
             (255, 255, 255), 12,
@@ -826,7 +840,7 @@ class ProfileView(arcade.View):
             )
             
             # Texto da aba
-            arcade.draw_text(
+            draw_text(
                 tab, tab_x, tab_y,
                 text_color, 16,
                 anchor_x="center", anchor_y="center",
@@ -864,19 +878,19 @@ class ProfileView(arcade.View):
         for i, (label, value, icon) in enumerate(stats):
             x_pos = 40 + (i * stat_spacing)
             
-            arcade.draw_text(
+            draw_text(
                 icon, x_pos, 60,
                 (255, 215, 0), 16,
                 anchor_x="center"
             )
             
-            arcade.draw_text(
+            draw_text(
                 label, x_pos, 45,
                 (150, 150, 150), 10,
                 anchor_x="center"
             )
             
-            arcade.draw_text(
+            draw_text(
                 str(value), x_pos, 30,
                 (255, 255, 255), 14,
                 anchor_x="center", bold=True
@@ -902,7 +916,7 @@ class ProfileView(arcade.View):
             )
             
             # Texto da mensagem
-            arcade.draw_text(
+            draw_text(
                 self.hotbar_message,
                 width/2, height/2,
                 (255, 255, 255), 16,
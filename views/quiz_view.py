@@ -5,12 +5,16 @@ import threading
 import time
 import random
 import math
+from array import array
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
 from assets.xp.xp import XPBar
 from auth.simple_auth import auth_system
 from auth.user_manager import user_manager
+import question_bundle
+from utils.text_cache import draw_text
+from utils.shape_cache import ShapeCache, circle_filled, circle_outline, lrbt_filled, lrbt_outline
 
 @dataclass
 class ParticleConfig:
@@ -22,45 +26,110 @@ class ParticleConfig:
     GRAVITY: float = -30.0
 
 class ParticleSystem:
-    class Particle:
-        def __init__(self, x: float, y: float, color: Tuple[int, int, int], cfg: ParticleConfig):
-            self.x = x
-            self.y = y
-            self.color = color
-            self.size = random.uniform(*cfg.SIZE_RANGE)
-            self.speed_x = random.uniform(*cfg.SPEED_RANGE_X)
-            self.speed_y = random.uniform(*cfg.SPEED_RANGE_Y)
-            self.life = cfg.LIFETIME
-            self.gravity = cfg.GRAVITY
-            self.alpha = 255
-
-        def update(self, dt: float) -> bool:
-            self.x += self.speed_x * dt
-            self.y += self.speed_y * dt
-            self.speed_y += self.gravity * dt
-            self.life -= dt
-            self.size = max(0, self.size - dt * 2)
-            self.alpha = int(255 * max(0.0, min(1.0, self.life)))
-            return self.life > 0 and self.size > 0
-
-        def draw(self):
-            alpha = max(0, min(255, self.alpha))
-            arcade.draw_circle_filled(self.x, self.y, self.size, (*self.color, alpha))
-
-    def __init__(self):
-        self.particles: List[ParticleSystem.Particle] = []
+    """
+    Pool de partículas de capacidade fixa. O estado fica em arrays paralelos
+    e as partículas vivas ocupam os índices [0, count); quando uma expira, a
+    última viva assume o lugar dela, então nada é alocado a cada frame.
+    O desenho é um único SpriteList com um sprite pré-criado por slot.
+    """
+
+    CAPACITY = 512
+    TEXTURE_DIAMETER = 16
+
+    _texture = None
+
+    def __init__(self, capacity: int = CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+
+        zeros = [0.0] * capacity
+        self.x = array("f", zeros)
+        self.y = array("f", zeros)
+        self.speed_x = array("f", zeros)
+        self.speed_y = array("f", zeros)
+        self.gravity = array("f", zeros)
+        self.life = array("f", zeros)
+        self.size = array("f", zeros)
+        self.colors: List[Tuple[int, int, int]] = [(255, 255, 255)] * capacity
+
+        if ParticleSystem._texture is None:
+            ParticleSystem._texture = arcade.make_circle_texture(
+                self.TEXTURE_DIAMETER, (255, 255, 255, 255), name="particle_circle"
+            )
+        self.sprites = arcade.SpriteList(lazy=True, capacity=capacity)
+        for _ in range(capacity):
+            sprite = arcade.Sprite(ParticleSystem._texture)
+            sprite.visible = False
+            self.sprites.append(sprite)
 
     def create_effect(self, x: float, y: float, color: Tuple[int, int, int], cfg: ParticleConfig = None):
         cfg = cfg or ParticleConfig()
         for _ in range(cfg.COUNT):
-            self.particles.append(self.Particle(x, y, color, cfg))
+            if self.count >= self.capacity:
+                return
+            i = self.count
+            self.x[i] = x
+            self.y[i] = y
+            self.speed_x[i] = random.uniform(*cfg.SPEED_RANGE_X)
+            self.speed_y[i] = random.uniform(*cfg.SPEED_RANGE_Y)
+            self.gravity[i] = cfg.GRAVITY
+            self.life[i] = cfg.LIFETIME
+            self.size[i] = random.uniform(*cfg.SIZE_RANGE)
+            self.colors[i] = color
+            # aplica o estado antes de mostrar: um draw antes do próximo update
+            # não pode exibir o slot com a posição/escala antigas
+            self._apply(i)
+            self.sprites[i].visible = True
+            self.count += 1
+
+    def _apply(self, i: int):
+        """Copia o estado da partícula i para o sprite do slot"""
+        sprite = self.sprites[i]
+        sprite.position = (self.x[i], self.y[i])
+        sprite.scale = self.size[i] * 2 / self.TEXTURE_DIAMETER
+        sprite.color = (*self.colors[i], int(255 * min(1.0, self.life[i])))
+
+    def _kill(self, i: int):
+        last = self.count - 1
+        if i != last:
+            self.x[i] = self.x[last]
+            self.y[i] = self.y[last]
+            self.speed_x[i] = self.speed_x[last]
+            self.speed_y[i] = self.speed_y[last]
+            self.gravity[i] = self.gravity[last]
+            self.life[i] = self.life[last]
+            self.size[i] = self.size[last]
+            self.colors[i] = self.colors[last]
+        self.sprites[last].visible = False
+        self.count = last
 
     def update(self, dt: float):
-        self.particles[:] = [p for p in self.particles if p.update(dt)]
+        i = 0
+        while i < self.count:
+            life = self.life[i] - dt
+            size = self.size[i] - dt * 2
+            if life <= 0 or size <= 0:
+                # o slot i recebe a última partícula viva; processa ela em seguida
+                self._kill(i)
+                continue
+
+            self.life[i] = life
+            self.size[i] = size
+            self.x[i] += self.speed_x[i] * dt
+            self.y[i] += self.speed_y[i] * dt
+            self.speed_y[i] += self.gravity[i] * dt
+
+            self._apply(i)
+            i += 1
+
+    def clear(self):
+        for i in range(self.count):
+            self.sprites[i].visible = False
+        self.count = 0
 
     def draw(self):
-        for p in self.particles:
-            p.draw()
+        if self.count:
+            self.sprites.draw()
 
 class FloatingText:
     def __init__(self, text: str, x: float, y: float, color=(255, 215, 0), effect_type="normal"):
@@ -102,7 +171,7 @@ class FloatingText:
         r, g, b = self.color[:3]
         base_color = (r, g, b, alpha)
 
-        arcade.draw_text(
+        draw_text(
             self.text,
             self.x + 2 + sx,
             self.y - 2 + sy,
@@ -111,7 +180,7 @@ class FloatingText:
             anchor_x="center",
             font_name="Arial"
         )
-        arcade.draw_text(
+        draw_text(
             self.text,
             self.x + sx,
             self.y + sy,
@@ -188,14 +257,14 @@ class ExampleView(arcade.View):
             (212, 175, 55), 3
         )
 
-        arcade.draw_text(
+        draw_text(
             "💡 EXEMPLO ILUSTRATIVO",
             panel_x, panel_y + panel_height / 2 - 50,
             (25, 21, 0), 28,
             anchor_x="center", bold=True
         )
 
-        arcade.draw_text(
+        draw_text(
             self.example_text,
             panel_x, panel_y,
             (200, 200, 200), 16,
@@ -220,7 +289,7 @@ class ExampleView(arcade.View):
             button_y - button_height / 2, button_y + button_height / 2,
             (255, 255, 255), 2
         )
-        arcade.draw_text(
+        draw_text(
             "CONTINUAR",
             button_x, button_y,
             (255, 255, 255), 20,
@@ -301,7 +370,7 @@ class QuizResultView(arcade.View):
         title = "🎉 PARABÉNS! 🎉" if self.passed_phase else "💀 FASE FALHADA"
         title_color = (0, 255, 0) if self.passed_phase else (255, 50, 50)
 
-        arcade.draw_text(
+        draw_text(
             title,
             panel_x, panel_y + panel_height / 2 - 50,
             title_color, 32,
@@ -310,25 +379,25 @@ class QuizResultView(arcade.View):
 
         results_y = panel_y + panel_height / 2 - 120
 
-        arcade.draw_text(
+        draw_text(
             f"⭐ XP Ganho: {self.xp_earned}",
             panel_x, results_y,
             (255, 215, 0), 24,
             anchor_x="center"
         )
-        arcade.draw_text(
+        draw_text(
             f"💰 Moedas: +{self.coins_earned}",
             panel_x, results_y - 40,
             (255, 215, 0), 24,
             anchor_x="center"
         )
-        arcade.draw_text(
+        draw_text(
             f"✅ Acertos: {self.correct_answers}",
             panel_x, results_y - 80,
             (0, 255, 0), 20,
             anchor_x="center"
         )
-        arcade.draw_text(
+        draw_text(
             f"❌ Erros: {self.wrong_answers}",
             panel_x, results_y - 110,
             (255, 50, 50), 20,
@@ -336,7 +405,7 @@ class QuizResultView(arcade.View):
         )
 
         status_text = "✅ FASE COMPLETADA!" if self.passed_phase else "❌ FALHOU - TENTE NOVAMENTE"
-        arcade.draw_text(
+        draw_text(
             status_text,
             panel_x, results_y - 160,
             title_color, 22,
@@ -353,7 +422,7 @@ class QuizResultView(arcade.View):
         )
         arcade.draw_lrbt_rectangle_filled(*self.retry_button, (139, 0, 0))
         arcade.draw_lrbt_rectangle_outline(*self.retry_button, (255, 255, 255), 2)
-        arcade.draw_text(
+        draw_text(
             "🔁 REFAZER",
             panel_x - button_width / 2 - 20, button_y,
             (255, 255, 255), 18,
@@ -367,14 +436,14 @@ class QuizResultView(arcade.View):
             )
             arcade.draw_lrbt_rectangle_filled(*self.next_phase_button, (0, 150, 0))
             arcade.draw_lrbt_rectangle_outline(*self.next_phase_button, (255, 255, 255), 2)
-            arcade.draw_text(
+            draw_text(
                 "➡️ PRÓXIMA FASE",
                 panel_x + button_width / 2 + 20, button_y,
                 (255, 255, 255), 18,
                 anchor_x="center", anchor_y="center", bold=True
             )
 
-        arcade.draw_text(
+        draw_text(
             "💡 Dica: Pressione F11 para tela cheia",
             self.window.width / 2, 30,
             (150, 150, 150), 14,
@@ -405,6 +474,177 @@ class QuizResultView(arcade.View):
     def on_resize(self, width, height):
         self.window.set_viewport(0, width, 0, height)
 
+class XPEventBuffer:
+    """
+    Acumula eventos de XP e os envia em lote para /api/score/batch.
+    Cada evento leva um seq crescente por sessão (baseado no relógio, então
+    continua crescendo entre partidas); o servidor ignora seq já aplicado,
+    o que torna seguro reenviar um lote que falhou.
+    """
+
+    FLUSH_INTERVAL = 5.0
+    URL = "http://127.0.0.1:8000/api/score/batch"
+
+    _last_seq: Dict[str, int] = {}
+    _seq_lock = threading.Lock()
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.pending: List[Dict] = []
+        self._lock = threading.Lock()
+        # serializa os envios para que os lotes cheguem em ordem de seq
+        self._send_lock = threading.Lock()
+        self._elapsed = 0.0
+
+    @classmethod
+    def _next_seq(cls, session_id: str) -> int:
+        with cls._seq_lock:
+            seq = max(cls._last_seq.get(session_id, 0) + 1, int(time.time() * 1000))
+            cls._last_seq[session_id] = seq
+            return seq
+
+    def add(self, added_xp: int):
+        if not self.session_id or added_xp <= 0:
+            return
+        with self._lock:
+            self.pending.append({
+                "session_id": self.session_id,
+                "seq": self._next_seq(self.session_id),
+                "added_xp": added_xp,
+            })
+
+    def update(self, dt: float):
+        self._elapsed += dt
+        if self._elapsed >= self.FLUSH_INTERVAL:
+            self._elapsed = 0.0
+            self.flush()
+
+    def flush(self, blocking: bool = False):
+        with self._lock:
+            if not self.pending:
+                return
+        if blocking:
+            self._send()
+        else:
+            threading.Thread(target=self._send, daemon=True).start()
+
+    def _send(self):
+        with self._send_lock:
+            with self._lock:
+                batch, self.pending = self.pending, []
+            if not batch:
+                return
+            try:
+                resp = requests.post(self.URL, json={"events": batch}, timeout=3)
+            except requests.RequestException as e:
+                print("❌ Falha ao salvar XP no servidor:", e)
+                self._requeue(batch)
+                return
+
+            if resp.status_code >= 500:
+                print(f"❌ Falha ao salvar XP no servidor: HTTP {resp.status_code}")
+                self._requeue(batch)
+            elif resp.status_code >= 400:
+                # lote inválido (400/422): reenviar daria o mesmo erro para sempre
+                print(f"❌ Lote de XP rejeitado (HTTP {resp.status_code}), {len(batch)} evento(s) descartado(s): {resp.text[:200]}")
+            else:
+                try:
+                    rejected = resp.json().get("rejected") or []
+                except ValueError:
+                    rejected = []
+                if rejected:
+                    print(f"⚠️ XP descartado para session_id(s) inválido(s): {rejected}")
+
+    def _requeue(self, batch: List[Dict]):
+        # devolve para a fila; o próximo flush reenvia na mesma ordem
+        with self._lock:
+            self.pending[:0] = batch
+
+
+class QuestionCache:
+    """
+    Cache de perguntas por fase, compartilhado entre as views.
+    As buscas rodam em threads de fundo; a view só consulta o resultado.
+    Entradas antigas são revalidadas com If-None-Match, então o servidor
+    responde 304 sem reenviar as perguntas quando nada mudou.
+    """
+
+    URL = "http://127.0.0.1:8000/api/quiz/{phase}"
+    MAX_AGE = 300.0
+
+    def __init__(self):
+        self._entries: Dict[int, Dict] = {}
+        self._errors: Dict[int, Exception] = {}
+        self._inflight = set()
+        self._lock = threading.Lock()
+
+    def get(self, phase: int) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(phase)
+            if entry:
+                return entry["questions"]
+
+        # sem cache: usa o bundle offline e deixa a API revalidar depois
+        questions = question_bundle.load_phase(phase)
+        if questions:
+            with self._lock:
+                entry = self._entries.setdefault(phase, {
+                    "questions": questions,
+                    "etag": None,
+                    "fetched_at": 0.0,
+                })
+            return entry["questions"]
+        return None
+
+    def error(self, phase: int) -> Optional[Exception]:
+        with self._lock:
+            if phase in self._inflight or phase in self._entries:
+                return None
+            return self._errors.get(phase)
+
+    def prefetch(self, phase: int):
+        """Busca (ou revalida) a fase em segundo plano, se necessário"""
+        with self._lock:
+            if phase in self._inflight:
+                return
+            entry = self._entries.get(phase)
+            if entry and time.time() - entry["fetched_at"] < self.MAX_AGE:
+                return
+            self._inflight.add(phase)
+            self._errors.pop(phase, None)
+        threading.Thread(target=self._fetch, args=(phase,), daemon=True).start()
+
+    def _fetch(self, phase: int):
+        try:
+            with self._lock:
+                entry = self._entries.get(phase)
+            headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else {}
+            resp = requests.get(self.URL.format(phase=phase), headers=headers, timeout=5)
+            if resp.status_code == 304 and entry:
+                with self._lock:
+                    entry["fetched_at"] = time.time()
+                return
+            resp.raise_for_status()
+            data = resp.json()
+            if not isinstance(data, list) or not data:
+                raise ValueError(f"nenhuma pergunta para a fase {phase}")
+            with self._lock:
+                self._entries[phase] = {
+                    "questions": data,
+                    "etag": resp.headers.get("ETag"),
+                    "fetched_at": time.time(),
+                }
+        except Exception as e:
+            with self._lock:
+                self._errors[phase] = e
+        finally:
+            with self._lock:
+                self._inflight.discard(phase)
+
+
+question_cache = QuestionCache()
+
+
 class QuizView(arcade.View):
     COLORS = {
         "background": (30, 30, 30),
@@ -427,6 +667,7 @@ class QuizView(arcade.View):
         self.xp_bar = xp_bar
         self.session_id = session_id
         self.parent = parent
+        self.xp_events = XPEventBuffer(session_id)
 
         # gameplay state
         self.max_lives = 4
@@ -451,10 +692,12 @@ class QuizView(arcade.View):
         self.active_effects = {"double_xp": False, "reveal_letter": False, "remove_wrong": False, "extra_time": False}
 
         self.questions: List[Dict] = []
+        self.loading = False
         self.current = 0
         self.option_boxes: List[Dict] = []
         self.floating_texts: List[FloatingText] = []
         self.particle_system = ParticleSystem()
+        self.hud_shapes = ShapeCache()
 
         self.mouse_x = 0
         self.mouse_y = 0
@@ -528,18 +771,8 @@ class QuizView(arcade.View):
         pass
 
     def _sync_xp_to_server(self, added_xp: int):
-        def job():
-            try:
-                resp = requests.post(
-                    "http://127.0.0.1:8000/api/score",
-                    json={"session_id": self.session_id, "added_xp": added_xp},
-                    timeout=3
-                )
-                resp.raise_for_status()
-            except Exception as e:
-                print("❌ Falha ao salvar XP no servidor:", e)
-
-        threading.Thread(target=job, daemon=True).start()
+        # enfileira; o envio acontece em lote (timer, fim do quiz ou saída da view)
+        self.xp_events.add(added_xp)
 
     def _save_coins_to_user(self, coins: int):
         try:
@@ -555,17 +788,36 @@ class QuizView(arcade.View):
 
     def on_show(self):
         arcade.set_background_color(self.COLORS["background"])
-        if not self.questions:
+        if not self.questions and not self.loading:
             self.setup()
 
+    def on_hide_view(self):
+        self.xp_events.flush()
+
     def setup(self):
+        """Usa as perguntas do cache; se ainda não chegaram, busca sem travar a janela"""
+        cached = question_cache.get(self.phase)
+        if cached:
+            return self._start_questions(cached)
+        self.loading = True
+        question_cache.prefetch(self.phase)
+
+    def _poll_questions(self):
+        questions = question_cache.get(self.phase)
+        if questions:
+            self.loading = False
+            self._start_questions(questions)
+            return
+        error = question_cache.error(self.phase)
+        if error:
+            self.loading = False
+            print("❌ Erro ao carregar perguntas:", error)
+            self._return_to_map()
+
+    def _start_questions(self, data: List[Dict]):
         try:
-            resp = requests.get(f"http://127.0.0.1:8000/api/quiz/{self.phase}", timeout=5)
-            resp.raise_for_status()
-            data = resp.json()
-            if not isinstance(data, list) or not data:
-                return self._return_to_map()
-            self.questions = data
+            # cópia rasa: a lista do cache é compartilhada entre as views
+            self.questions = list(data)
             self.current = 0
             # reset session counters but keep saved lives/mana
             self.correct_answers = 0
@@ -574,7 +826,7 @@ class QuizView(arcade.View):
             self.used_items.clear()
             self.active_effects = {k: False for k in self.active_effects}
             self.floating_texts.clear()
-            self.particle_system.particles.clear()
+            self.particle_system.clear()
             self._build_option_boxes()
         except Exception as e:
             print("❌ Erro ao carregar perguntas:", e)
@@ -592,6 +844,7 @@ class QuizView(arcade.View):
             pass
 
     def _show_result_screen(self):
+        self.xp_events.flush()
         coins_earned = 10 if self.correct_answers >= 3 else 0
         self._save_phase_progress()
         if coins_earned > 0:
@@ -670,84 +923,78 @@ class QuizView(arcade.View):
         bar_width = 200
         bar_x = self.window.width - bar_width - 20
         bar_y = self.window.height - 50
-
-        arcade.draw_text("VIDA", bar_x + bar_width / 2, bar_y + 40, self.COLORS["text_silver"], 16, anchor_x="center", bold=True)
-
-        circle_radius = 20
-        circle_spacing = 8
-        start_x = bar_x + circle_radius
-
-        for i in range(self.max_lives):
-            x = start_x + (i * (circle_radius * 2 + circle_spacing))
-            y = bar_y
-            arcade.draw_circle_filled(x, y, circle_radius, (80, 80, 80))
-            arcade.draw_circle_outline(x, y, circle_radius, (120, 120, 120), 2)
-            if i < self.lives:
-                if self.lives <= 2 and i == self.lives - 1:
-                    pulse = math.sin(self.animation * 10) * 0.1 + 1.0
-                    current_radius = circle_radius * pulse
-                    arcade.draw_circle_filled(x, y, current_radius, self.COLORS["life_red"])
-                else:
-                    arcade.draw_circle_filled(x, y, circle_radius, self.COLORS["life_red"])
-                arcade.draw_circle_outline(x, y, circle_radius, (255, 100, 100), 2)
+        draw_text("VIDA", bar_x + bar_width / 2, bar_y + 40, self.COLORS["text_silver"], 16, anchor_x="center", bold=True)
+        self._draw_orb_bar("life", bar_x, bar_y, self.lives, self.max_lives, self.COLORS["life_red"], (255, 100, 100))
 
     def _draw_mana_bar(self):
         bar_width = 200
         bar_x = self.window.width - bar_width - 20
         bar_y = self.window.height - 120
+        draw_text("MANA", bar_x + bar_width / 2, bar_y + 40, self.COLORS["text_silver"], 16, anchor_x="center", bold=True)
+        self._draw_orb_bar("mana", bar_x, bar_y, self.mana, self.max_mana, self.COLORS["mana_blue"], (100, 180, 255))
 
-        arcade.draw_text("MANA", bar_x + bar_width / 2, bar_y + 40, self.COLORS["text_silver"], 16, anchor_x="center", bold=True)
-
+    def _draw_orb_bar(self, name, bar_x, bar_y, value, maximum, fill_color, outline_color):
         circle_radius = 20
         circle_spacing = 8
         start_x = bar_x + circle_radius
-
-        for i in range(self.max_mana):
-            x = start_x + (i * (circle_radius * 2 + circle_spacing))
-            y = bar_y
-            arcade.draw_circle_filled(x, y, circle_radius, (80, 80, 80))
-            arcade.draw_circle_outline(x, y, circle_radius, (120, 120, 120), 2)
-            if i < self.mana:
-                if self.mana <= 2 and i == self.mana - 1:
-                    pulse = math.sin(self.animation * 10) * 0.1 + 1.0
-                    current_radius = circle_radius * pulse
-                    arcade.draw_circle_filled(x, y, current_radius, self.COLORS["mana_blue"])
-                else:
-                    arcade.draw_circle_filled(x, y, circle_radius, self.COLORS["mana_blue"])
-                arcade.draw_circle_outline(x, y, circle_radius, (100, 180, 255), 2)
-
-    def _draw_hotbar(self):
+        # a última esfera pulsa quando restam 2 ou menos; ela fica fora da camada em cache
+        pulsing = value - 1 if value <= 2 else -1
+
+        def build(shapes):
+            for i in range(maximum):
+                x = start_x + (i * (circle_radius * 2 + circle_spacing))
+                shapes.append(circle_filled(x, bar_y, circle_radius, (80, 80, 80)))
+                shapes.append(circle_outline(x, bar_y, circle_radius, (120, 120, 120), 2))
+                if i < value and i != pulsing:
+                    shapes.append(circle_filled(x, bar_y, circle_radius, fill_color))
+                    shapes.append(circle_outline(x, bar_y, circle_radius, outline_color, 2))
+
+        self.hud_shapes.draw(name, (bar_x, bar_y, value, maximum), build)
+
+        if pulsing >= 0:
+            x = start_x + (pulsing * (circle_radius * 2 + circle_spacing))
+            pulse = math.sin(self.animation * 10) * 0.1 + 1.0
+            arcade.draw_circle_filled(x, bar_y, circle_radius * pulse, fill_color)
+            arcade.draw_circle_outline(x, bar_y, circle_radius, outline_color, 2)
+
+    def _hotbar_layout(self):
         bar_width = min(500, self.window.width * 0.8)
-        bar_height = 80
         bar_x = self.window.width / 2
         bar_y = 120
-
-        arcade.draw_lrbt_rectangle_filled(
-            bar_x - bar_width / 2, bar_x + bar_width / 2,
-            bar_y - bar_height / 2, bar_y + bar_height / 2,
-            (40, 40, 40, 200)
-        )
-        arcade.draw_lrbt_rectangle_outline(
-            bar_x - bar_width / 2, bar_x + bar_width / 2,
-            bar_y - bar_height / 2, bar_y + bar_height / 2,
-            (100, 100, 100), 2
-        )
-
         slot_size = min(50, bar_width / 16)
         spacing = 10
         start_x = bar_x - (bar_width / 2) + slot_size / 2
 
+        slots = []
         for i in range(8):
-            slot_x = start_x + (i * (slot_size + spacing))
-            slot_id = str(i + 1)
-            self._draw_hotbar_slot(slot_x, bar_y, slot_size, slot_id, is_circle=False)
-
+            slots.append((start_x + (i * (slot_size + spacing)), bar_y, str(i + 1), False))
         for i in range(7):
-            slot_x = start_x + (i * (slot_size + spacing))
-            slot_id = chr(65 + i)
-            self._draw_hotbar_slot(slot_x, bar_y - 65, slot_size, slot_id, is_circle=True)
+            slots.append((start_x + (i * (slot_size + spacing)), bar_y - 65, chr(65 + i), True))
+        return bar_x, bar_y, bar_width, slot_size, slots
 
-    def _draw_hotbar_slot(self, x, y, size, slot_id, is_circle=False):
+    def _draw_hotbar(self):
+        bar_x, bar_y, bar_width, slot_size, slots = self._hotbar_layout()
+        bar_height = 80
+
+        def build(shapes):
+            l, r = bar_x - bar_width / 2, bar_x + bar_width / 2
+            b, t = bar_y - bar_height / 2, bar_y + bar_height / 2
+            shapes.append(lrbt_filled(l, r, b, t, (40, 40, 40, 200)))
+            shapes.append(lrbt_outline(l, r, b, t, (100, 100, 100), 2))
+            for slot_x, slot_y, slot_id, is_circle in slots:
+                self._build_hotbar_slot(shapes, slot_x, slot_y, slot_size, slot_id, is_circle)
+
+        key = (
+            self.window.width, self.window.height,
+            tuple(sorted(self.hotbar_slots.items())),
+            frozenset(self.used_items),
+        )
+        self.hud_shapes.draw("hotbar", key, build)
+
+        for slot_x, slot_y, slot_id, is_circle in slots:
+            self._draw_hotbar_slot(slot_x, slot_y, slot_size, slot_id, is_circle)
+
+    def _build_hotbar_slot(self, shapes, x, y, size, slot_id, is_circle=False):
         item_id = self.hotbar_slots.get(slot_id)
         item_info = UserInventoryManager.get_item_info(item_id) if item_id else None
 
@@ -759,16 +1006,20 @@ class QuizView(arcade.View):
             bg_color = (0, 150, 0) if item_info and item_info["mana_cost"] > 0 else (0, 100, 200)
 
         if is_circle:
-            arcade.draw_circle_filled(x, y, size / 2, bg_color)
-            arcade.draw_circle_outline(x, y, size / 2, (200, 200, 200), 2)
+            shapes.append(circle_filled(x, y, size / 2, bg_color))
+            shapes.append(circle_outline(x, y, size / 2, (200, 200, 200), 2))
         else:
-            arcade.draw_lrbt_rectangle_filled(x - size / 2, x + size / 2, y - size / 2, y + size / 2, bg_color)
-            arcade.draw_lrbt_rectangle_outline(x - size / 2, x + size / 2, y - size / 2, y + size / 2, (200, 200, 200), 2)
+            shapes.append(lrbt_filled(x - size / 2, x + size / 2, y - size / 2, y + size / 2, bg_color))
+            shapes.append(lrbt_outline(x - size / 2, x + size / 2, y - size / 2, y + size / 2, (200, 200, 200), 2))
 
-        arcade.draw_text(slot_id, x, y, (255, 255, 255), 14, anchor_x="center", anchor_y="center", bold=True)
+    def _draw_hotbar_slot(self, x, y, size, slot_id, is_circle=False):
+        item_id = self.hotbar_slots.get(slot_id)
+        item_info = UserInventoryManager.get_item_info(item_id) if item_id else None
+
+        draw_text(slot_id, x, y, (255, 255, 255), 14, anchor_x="center", anchor_y="center", bold=True)
 
         if item_id:
-            arcade.draw_text(item_info["icon"], x, y - 2, (255, 255, 255), 20, anchor_x="center", anchor_y="center")
+            draw_text(item_info["icon"], x, y - 2, (255, 255, 255), 20, anchor_x="center", anchor_y="center")
 
         if item_id and slot_id not in self.used_items:
             slot_rect = self._get_slot_rect(x, y, size, is_circle)
@@ -798,11 +1049,11 @@ class QuizView(arcade.View):
             tooltip_y - tooltip_height / 2, tooltip_y + tooltip_height / 2,
             (255, 255, 255), 1
         )
-        arcade.draw_text(item_info["name"], tooltip_x, tooltip_y + 30, (255, 255, 255), 16, anchor_x="center", anchor_y="center", bold=True)
-        arcade.draw_text(item_info["description"], tooltip_x, tooltip_y + 5, (200, 200, 200), 12, anchor_x="center", anchor_y="center", width=tooltip_width - 20, align="center")
+        draw_text(item_info["name"], tooltip_x, tooltip_y + 30, (255, 255, 255), 16, anchor_x="center", anchor_y="center", bold=True)
+        draw_text(item_info["description"], tooltip_x, tooltip_y + 5, (200, 200, 200), 12, anchor_x="center", anchor_y="center", width=tooltip_width - 20, align="center")
         if item_info["mana_cost"] > 0:
-            arcade.draw_text(f"Custo: {item_info['mana_cost']} mana", tooltip_x, tooltip_y - 25, (100, 200, 255), 12, anchor_x="center", anchor_y="center")
-        arcade.draw_text("Clique para usar", tooltip_x, tooltip_y - 40, (200, 255, 200), 11, anchor_x="center", anchor_y="center")
+            draw_text(f"Custo: {item_info['mana_cost']} mana", tooltip_x, tooltip_y - 25, (100, 200, 255), 12, anchor_x="center", anchor_y="center")
+        draw_text("Clique para usar", tooltip_x, tooltip_y - 40, (200, 255, 200), 11, anchor_x="center", anchor_y="center")
 
     def _draw_xp_bar_at_top(self):
         if not self.xp_bar:
@@ -822,20 +1073,24 @@ class QuizView(arcade.View):
             arcade.draw_lrbt_rectangle_filled(bar_x, bar_x + fill_width, bar_y - bar_height / 2, bar_y + bar_height / 2, (100, 200, 255))
 
         arcade.draw_lrbt_rectangle_outline(bar_x, bar_x + bar_width, bar_y - bar_height / 2, bar_y + bar_height / 2, (150, 150, 150), 2)
-        arcade.draw_text(f"XP: {current_xp}/{max_xp}", bar_x, bar_y + bar_height + 5, self.COLORS["text_silver"], 14)
+        draw_text(f"XP: {current_xp}/{max_xp}", bar_x, bar_y + bar_height + 5, self.COLORS["text_silver"], 14)
 
     def _draw_phase_banner(self):
-        arcade.draw_text(f"Fase {self.phase}", self.window.width / 2, self.window.height - 100, self.COLORS["text_gold"], font_size=26, anchor_x="center", bold=True)
+        draw_text(f"Fase {self.phase}", self.window.width / 2, self.window.height - 100, self.COLORS["text_gold"], font_size=26, anchor_x="center", bold=True)
 
     def _draw_question_frame(self):
         if not self.questions or not (0 <= self.current < len(self.questions)):
             return
         l, r, b, t = self.question_rect
         cx, cy = (l + r) / 2, (b + t) / 2
-        arcade.draw_lrbt_rectangle_filled(l, r, b, t, self.COLORS["frame"])
-        arcade.draw_lrbt_rectangle_outline(l, r, b, t, self.COLORS["frame_border"], border_width=4)
+
+        def build(shapes):
+            shapes.append(lrbt_filled(l, r, b, t, self.COLORS["frame"]))
+            shapes.append(lrbt_outline(l, r, b, t, self.COLORS["frame_border"], 4))
+
+        self.hud_shapes.draw("question_frame", self.question_rect, build)
         question = self.questions[self.current].get("question", "")
-        arcade.draw_text(question, cx, cy, self.COLORS["text_silver"], font_size=18, width=int(r - l) - 40, align="center", anchor_x="center", anchor_y="center")
+        draw_text(question, cx, cy, self.COLORS["text_silver"], font_size=18, width=int(r - l) - 40, align="center", anchor_x="center", anchor_y="center")
 
     def _draw_options_with_effects(self):
         if not self.questions:
@@ -854,30 +1109,30 @@ class QuizView(arcade.View):
             arcade.draw_lrbt_rectangle_outline(l, r, b, t, border, 2)
             option_number = f"{idx + 1}. "
             full_text = option_number + box["text"]
-            arcade.draw_text(full_text, cx, cy, self.COLORS["text_silver"], font_size=16, width=int(width) - 40, align="center", anchor_x="center", anchor_y="center")
+            draw_text(full_text, cx, cy, self.COLORS["text_silver"], font_size=16, width=int(width) - 40, align="center", anchor_x="center", anchor_y="center")
 
     def _draw_progress_indicator(self):
         if not self.questions:
             return
-        arcade.draw_text(f"{self.current + 1} / {len(self.questions)}", self.window.width - 60, self.window.height - 40, self.COLORS["text_silver"], font_size=16, anchor_x="center")
+        draw_text(f"{self.current + 1} / {len(self.questions)}", self.window.width - 60, self.window.height - 40, self.COLORS["text_silver"], font_size=16, anchor_x="center")
 
     def _draw_header(self):
-        arcade.draw_text("Pergunta", self.window.width / 2, self.window.height - 60, self.COLORS["text_gold"], font_size=24, anchor_x="center", font_name="serif")
+        draw_text("Pergunta", self.window.width / 2, self.window.height - 60, self.COLORS["text_gold"], font_size=24, anchor_x="center", font_name="serif")
 
     def _draw_active_effects(self):
         if any(self.active_effects.values()):
             effects_x = self.window.width - 200
             effects_y = self.window.height - 180
-            arcade.draw_text("Efeitos Ativos:", effects_x, effects_y, self.COLORS["text_gold"], 14, bold=True)
+            draw_text("Efeitos Ativos:", effects_x, effects_y, self.COLORS["text_gold"], 14, bold=True)
             effect_icons = {"double_xp": "⭐", "reveal_letter": "🔤", "remove_wrong": "❌", "extra_time": "⏱️"}
             y_offset = effects_y - 25
             for effect, active in self.active_effects.items():
                 if active:
-                    arcade.draw_text(effect_icons.get(effect, "✨"), effects_x, y_offset, (0, 255, 0), 20)
+                    draw_text(effect_icons.get(effect, "✨"), effects_x, y_offset, (0, 255, 0), 20)
                     y_offset -= 25
 
     def _draw_fullscreen_hint(self):
-        arcade.draw_text("💡 Pressione F11 para Tela Cheia", self.window.width / 2, 30, (150, 150, 150), 14, anchor_x="center")
+        draw_text("💡 Pressione F11 para Tela Cheia", self.window.width / 2, 30, (150, 150, 150), 14, anchor_x="center")
 
     def on_draw(self):
         self.clear()
@@ -885,7 +1140,7 @@ class QuizView(arcade.View):
         self._draw_header()
 
         if not self.questions:
-            arcade.draw_text("Carregando perguntas...", self.window.width / 2, self.window.height / 2, arcade.color.WHITE, 24, anchor_x="center", anchor_y="center")
+            draw_text("Carregando perguntas...", self.window.width / 2, self.window.height / 2, arcade.color.WHITE, 24, anchor_x="center", anchor_y="center")
         else:
             self._draw_question_frame()
             self._draw_options_with_effects()
@@ -911,6 +1166,9 @@ class QuizView(arcade.View):
 
     def on_update(self, dt: float):
         self.animation += dt
+        if self.loading:
+            self._poll_questions()
+        self.xp_events.update(dt)
         self.particle_system.update(dt)
         self.floating_texts[:] = [ft for ft in self.floating_texts if ft.update(dt)]
 
@@ -1219,6 +1477,7 @@ class QuizView(arcade.View):
             self.window.set_viewport(0, self.window.width, 0, self.window.height)
 
     def on_resize(self, width, height):
+        self.hud_shapes.invalidate()
         self.window.set_viewport(0, width, 0, height)
         if self.questions:
             self._build_option_boxes()
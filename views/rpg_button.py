@@ -3,6 +3,8 @@ import arcade
 import math
 import random
 
+from utils.shape_cache import ShapeCache, lrbt_filled, polygon_filled
+
 class RPGButton:
     def __init__(self, label, center_x, center_y, width=250, height=60):
         self.label = label
@@ -26,6 +28,12 @@ class RPGButton:
             'highlight': (220, 180, 255)   # Destaque muito claro
         }
 
+        # Fundo, cantos e cristais só mudam com posição, tamanho ou hover
+        self._shapes = ShapeCache()
+        # Sombra e texto desenhados juntos todo frame: um arcade.Text para cada
+        self._label_texts = None
+        self._label_key = None
+
     def update(self, delta_time):
         """Atualiza animações do botão"""
         self.pulse_time += delta_time * 5
@@ -52,21 +60,49 @@ class RPGButton:
         """Verifica se o botão foi clicado"""
         return self.check_hover(x, y)
 
-    def draw_crystal(self, x, y, size):
-        """Desenha um cristal decorativo"""
+    def _build_label_texts(self):
+        """Sombra e texto principal; só são recriados se o rótulo ou a posição mudar"""
+        key = (self.label, self.center_x, self.center_y)
+        if self._label_key != key:
+            # Sombra
+            shadow = arcade.Text(
+                self.label,
+                self.center_x + 2, self.center_y - 2,
+                (0, 0, 0, 150),
+                font_size=20,
+                anchor_x="center",
+                anchor_y="center",
+                bold=True
+            )
+            # Texto principal
+            main = arcade.Text(
+                self.label,
+                self.center_x, self.center_y,
+                self.colors['text'],
+                font_size=20,
+                anchor_x="center",
+                anchor_y="center",
+                bold=True
+            )
+            self._label_texts = (shadow, main)
+            self._label_key = key
+        return self._label_texts
+
+    def build_crystal(self, shapes, x, y, size):
+        """Adiciona um cristal decorativo à camada em cache"""
         # Cristal principal
-        arcade.draw_polygon_filled([
+        shapes.append(polygon_filled([
             (x, y + size),
             (x - size/2, y),
             (x + size/2, y)
-        ], self.colors['crystal'])
+        ], self.colors['crystal']))
         
         # Brilho no cristal
-        arcade.draw_polygon_filled([
+        shapes.append(polygon_filled([
             (x, y + size*0.7),
             (x - size/4, y + size*0.2),
             (x + size/4, y + size*0.2)
-        ], self.colors['highlight'])
+        ], self.colors['highlight']))
 
     def draw_rune(self, x, y, size, time):
         """Desenha uma runa mágica giratória"""
@@ -81,21 +117,8 @@ class RPGButton:
         
         arcade.draw_polygon_outline(points, self.colors['border'], 2)
 
-    def draw(self):
-        # Cor baseada no estado
-        is_hover = self.texture_index == 1
-        base_color = self.colors['hover'] if is_hover else self.colors['normal']
-        
-        # Efeito de brilho de fundo quando em hover
-        if is_hover:
-            glow_radius = self.glow_intensity * 15
-            arcade.draw_circle_filled(
-                self.center_x, self.center_y, 
-                self.width/2 + glow_radius,
-                (self.colors['glow'][0], self.colors['glow'][1], 
-                 self.colors['glow'][2], int(80 * self.glow_intensity))
-            )
-        
+    def _build_body(self, shapes, base_color, is_hover):
+        """Monta as partes estáticas do botão na ShapeElementList"""
         # Fundo do botão com gradiente
         for i in range(5):
             shade_factor = 0.8 + (i * 0.05)
@@ -106,14 +129,57 @@ class RPGButton:
             )
             
             offset = i * 2
-            arcade.draw_lrbt_rectangle_filled(
+            shapes.append(lrbt_filled(
                 self.center_x - self.width/2 + offset, 
                 self.center_x + self.width/2 - offset,
                 self.center_y - self.height/2 + offset,
                 self.center_y + self.height/2 - offset,
                 shaded_color
+            ))
+        
+        # Cantos decorativos
+        corner_size = 8
+        half_w, half_h = self.width/2, self.height/2
+        for cx, cy in ((-1, 1), (1, 1), (-1, -1), (1, -1)):
+            x_edge = self.center_x + cx * half_w
+            y_edge = self.center_y + cy * half_h
+            shapes.append(lrbt_filled(
+                min(x_edge, x_edge - cx * corner_size),
+                max(x_edge, x_edge - cx * corner_size),
+                min(y_edge, y_edge - cy * corner_size),
+                max(y_edge, y_edge - cy * corner_size),
+                self.colors['border']
+            ))
+        
+        # Cristais decorativos nos cantos (apenas no hover)
+        if is_hover:
+            for cx, cy in ((-1, 1), (1, 1), (-1, -1), (1, -1)):
+                self.build_crystal(
+                    shapes,
+                    self.center_x + cx * (half_w - 15),
+                    self.center_y + cy * (half_h - 15),
+                    6
+                )
+
+    def draw(self):
+        # Cor baseada no estado
+        is_hover = self.texture_index == 1
+        base_color = self.colors['hover'] if is_hover else self.colors['normal']
+        
+        # Efeito de brilho de fundo quando em hover
+        if is_hover:
+            glow_radius = self.glow_intensity * 15
+            arcade.draw_circle_filled(
+                self.center_x, self.center_y, 
+                self.width/2 + glow_radius,
+                (self.colors['glow'][0], self.colors['glow'][1], 
+                 self.colors['glow'][2], int(80 * self.glow_intensity))
             )
         
+        # Fundo, cantos e cristais: montados uma vez por estado
+        key = (self.center_x, self.center_y, self.width, self.height, is_hover)
+        self._shapes.draw("body", key, lambda shapes: self._build_body(shapes, base_color, is_hover))
+        
         # Borda com efeito pulsante
         border_width = 3 + math.sin(self.pulse_time) * 1.5
         arcade.draw_lrbt_rectangle_outline(
@@ -124,64 +190,6 @@ class RPGButton:
             self.colors['border'], border_width
         )
         
-        # Cantos decorativos
-        corner_size = 8
-        # Canto superior esquerdo
-        arcade.draw_lrbt_rectangle_filled(
-            self.center_x - self.width/2,
-            self.center_x - self.width/2 + corner_size,
-            self.center_y + self.height/2 - corner_size,
-            self.center_y + self.height/2,
-            self.colors['border']
-        )
-        # Canto superior direito
-        arcade.draw_lrbt_rectangle_filled(
-            self.center_x + self.width/2 - corner_size,
-            self.center_x + self.width/2,
-            self.center_y + self.height/2 - corner_size,
-            self.center_y + self.height/2,
-            self.colors['border']
-        )
-        # Canto inferior esquerdo
-        arcade.draw_lrbt_rectangle_filled(
-            self.center_x - self.width/2,
-            self.center_x - self.width/2 + corner_size,
-            self.center_y - self.height/2,
-            self.center_y - self.height/2 + corner_size,
-            self.colors['border']
-        )
-        # Canto inferior direito
-        arcade.draw_lrbt_rectangle_filled(
-            self.center_x + self.width/2 - corner_size,
-            self.center_x + self.width/2,
-            self.center_y - self.height/2,
-            self.center_y - self.height/2 + corner_size,
-            self.colors['border']
-        )
-        
-        # Cristais decorativos nos cantos (apenas no hover)
-        if is_hover:
-            self.draw_crystal(
-                self.center_x - self.width/2 + 15,
-                self.center_y + self.height/2 - 15,
-                6
-            )
-            self.draw_crystal(
-                self.center_x + self.width/2 - 15,
-                self.center_y + self.height/2 - 15,
-                6
-            )
-            self.draw_crystal(
-                self.center_x - self.width/2 + 15,
-                self.center_y - self.height/2 + 15,
-                6
-            )
-            self.draw_crystal(
-                self.center_x + self.width/2 - 15,
-                self.center_y - self.height/2 + 15,
-                6
-            )
-        
         # Runa mágica central (apenas no hover)
         if is_hover:
             self.draw_rune(
@@ -192,23 +200,5 @@ class RPGButton:
             )
         
         # Texto com sombra para melhor legibilidade
-        # Sombra
-        arcade.draw_text(
-            self.label,
-            self.center_x + 2, self.center_y - 2,
-            (0, 0, 0, 150),
-            font_size=20,
-            anchor_x="center",
-            anchor_y="center",
-            bold=True
-        )
-        # Texto principal
-        arcade.draw_text(
-            self.label,
-            self.center_x, self.center_y,
-            self.colors['text'],
-            font_size=20,
-            anchor_x="center",
-            anchor_y="center",
-            bold=True
-        )
\ No newline at end of file
+        for text in self._build_label_texts():
+            text.draw()
\ No newline at end of file
@@ -5,6 +5,7 @@ import json
 import arcade
 from auth.simple_auth import auth_system
 from auth.user_manager import user_manager
+from utils.text_cache import draw_text
 
 class ShopView(arcade.View):
     def __init__(self, menu_view=None):
@@ -204,12 +205,12 @@ class ShopView(arcade.View):
 
     def _draw_header(self):
         width, height = self.window.width, self.window.height
-        arcade.draw_text("🏪 LOJA RPG - ITENS PERMANENTES", width / 2, height - 60, 
-                         (255, 215, 0), 28, anchor_x="center", bold=True)
-        arcade.draw_text(f"💰 {self.coins} Moedas", width - 30, height - 40, 
-                         (255, 215, 0), 20, anchor_x="right", bold=True)
-        arcade.draw_text(f"👤 {self.display_name}", 30, height - 40, 
-                         (200, 200, 200), 16)
+        draw_text("🏪 LOJA RPG - ITENS PERMANENTES", width / 2, height - 60, 
+                  (255, 215, 0), 28, anchor_x="center", bold=True)
+        draw_text(f"💰 {self.coins} Moedas", width - 30, height - 40, 
+                  (255, 215, 0), 20, anchor_x="right", bold=True)
+        draw_text(f"👤 {self.display_name}", 30, height - 40, 
+                  (200, 200, 200), 16)
 
     def _draw_shop_items(self):
         width, height = self.window.width, self.window.height
@@ -230,24 +231,24 @@ class ShopView(arcade.View):
         arcade.draw_lrbt_rectangle_filled(x, x + width, y - height, y, bg_color)
         arcade.draw_lrbt_rectangle_outline(x, x + width, y - height, y, rarity_color, 3)
 
-        arcade.draw_text(item["icon"], x + width / 2, y - 30, rarity_color, 36, 
-                         anchor_x="center", anchor_y="center")
-        arcade.draw_text(item["name"], x + width / 2, y - 70, (255, 255, 255), 16, 
-                         anchor_x="center", anchor_y="center", bold=True)
-        arcade.draw_text(item["description"], x + width / 2, y - 100, (180, 180, 180), 12, 
-                         anchor_x="center", anchor_y="center", width=width - 20)
+        draw_text(item["icon"], x + width / 2, y - 30, rarity_color, 36, 
+                  anchor_x="center", anchor_y="center")
+        draw_text(item["name"], x + width / 2, y - 70, (255, 255, 255), 16, 
+                  anchor_x="center", anchor_y="center", bold=True)
+        draw_text(item["description"], x + width / 2, y - 100, (180, 180, 180), 12, 
+                  anchor_x="center", anchor_y="center", width=width - 20)
 
         price_color = (0, 255, 0) if self.coins >= item["price"] else (255, 50, 50)
-        arcade.draw_text(f"💰 {item['price']}", x + width / 2, y - 130, price_color, 18, 
-                         anchor_x="center", anchor_y="center", bold=True)
+        draw_text(f"💰 {item['price']}", x + width / 2, y - 130, price_color, 18, 
+                  anchor_x="center", anchor_y="center", bold=True)
 
         button_y = y - 160
         button_color = (0, 150, 0) if self.coins >= item["price"] else (100, 100, 100)
         arcade.draw_lrbt_rectangle_filled(x + 20, x + width - 20, button_y - 10, button_y + 10, button_color)
 
         button_text = "COMPRAR" if self.coins >= item["price"] else "MOEDAS INSUFICIENTES"
-        arcade.draw_text(button_text, x + width / 2, button_y, (255, 255, 255), 12, 
-                         anchor_x="center", anchor_y="center", bold=True)
+        draw_text(button_text, x + width / 2, button_y, (255, 255, 255), 12, 
+                  anchor_x="center", anchor_y="center", bold=True)
 
     def _draw_info_panel(self):
         width, height = self.window.width, self.window.height
@@ -261,41 +262,41 @@ class ShopView(arcade.View):
                                            panel_y - panel_height / 2, panel_y + panel_height / 2, 
                                            (212, 175, 55), 2)
         
-        arcade.draw_text("📦 INVENTÁRIO PERMANENTE", panel_x, panel_y + panel_height / 2 - 30, 
-                         (255, 215, 0), 20, anchor_x="center", bold=True)
+        draw_text("📦 INVENTÁRIO PERMANENTE", panel_x, panel_y + panel_height / 2 - 30, 
+                  (255, 215, 0), 20, anchor_x="center", bold=True)
 
         inventory_y = panel_y + panel_height / 2 - 70
         if not self.inventory:
-            arcade.draw_text("Nenhum item comprado ainda", panel_x, inventory_y, 
-                             (150, 150, 150), 16, anchor_x="center")
+            draw_text("Nenhum item comprado ainda", panel_x, inventory_y, 
+                      (150, 150, 150), 16, anchor_x="center")
         else:
             for i, (item_id, quantity) in enumerate(self.inventory.items()):
                 item = next((it for it in self.shop_items if it["id"] == item_id), None)
                 if item:
                     item_y = inventory_y - (i * 40)
                     rarity_color = self.rarity_colors.get(item["rarity"], (200, 200, 200))
-                    arcade.draw_text(f"{item['icon']} {item['name']}", 
-                                   panel_x - panel_width / 2 + 20, item_y,
-                                   rarity_color, 14, anchor_y="center", bold=True)
-                    arcade.draw_text(f"x{quantity}", panel_x + panel_width / 2 - 20, item_y, 
-                                   (200, 200, 200), 14, anchor_x="right", anchor_y="center")
+                    draw_text(f"{item['icon']} {item['name']}", 
+                              panel_x - panel_width / 2 + 20, item_y,
+                              rarity_color, 14, anchor_y="center", bold=True)
+                    draw_text(f"x{quantity}", panel_x + panel_width / 2 - 20, item_y, 
+                              (200, 200, 200), 14, anchor_x="right", anchor_y="center")
 
         hotbar_y = inventory_y - (len(self.inventory) * 40) - 40
-        arcade.draw_text("🎯 HOTBAR ATIVA", panel_x, hotbar_y, 
-                         (255, 215, 0), 16, anchor_x="center", bold=True)
+        draw_text("🎯 HOTBAR ATIVA", panel_x, hotbar_y, 
+                  (255, 215, 0), 16, anchor_x="center", bold=True)
         
         if not self.hotbar:
-            arcade.draw_text("Nenhum item equipado", panel_x, hotbar_y - 30, 
-                             (150, 150, 150), 14, anchor_x="center")
+            draw_text("Nenhum item equipado", panel_x, hotbar_y - 30, 
+                      (150, 150, 150), 14, anchor_x="center")
         else:
             for i, (slot, item_id) in enumerate(self.hotbar.items()):
                 item = next((it for it in self.shop_items if it["id"] == item_id), None)
                 if item:
                     slot_y = hotbar_y - 30 - (i * 25)
                     rarity_color = self.rarity_colors.get(item["rarity"], (200, 200, 200))
-                    arcade.draw_text(f"{slot}: {item['icon']} {item['name']}", 
-                                   panel_x - panel_width / 2 + 20, slot_y,
-                                   rarity_color, 12, anchor_y="center")
+                    draw_text(f"{slot}: {item['icon']} {item['name']}", 
+                              panel_x - panel_width / 2 + 20, slot_y,
+                              rarity_color, 12, anchor_y="center")
 
     def _draw_back_button(self):
         button_x, button_y = 70, 40
@@ -307,8 +308,8 @@ class ShopView(arcade.View):
         arcade.draw_lrbt_rectangle_outline(button_x - button_width / 2, button_x + button_width / 2,
                                            button_y - button_height / 2, button_y + button_height / 2, 
                                            (212, 175, 55), 2)
-        arcade.draw_text("🚪 VOLTAR", button_x, button_y, (255, 255, 255), 16, 
-                         anchor_x="center", anchor_y="center", bold=True)
+        draw_text("🚪 VOLTAR", button_x, button_y, (255, 255, 255), 16, 
+                  anchor_x="center", anchor_y="center", bold=True)
 
     def _draw_messages(self):
         if self.message and self.message_timer > 0:
@@ -319,8 +320,8 @@ class ShopView(arcade.View):
             arcade.draw_lrbt_rectangle_outline(width / 2 - 200, width / 2 + 200, 
                                                height / 2 - 25, height / 2 + 25,
                                                (212, 175, 55), 2)
-            arcade.draw_text(self.message, width / 2, height / 2, (255, 255, 255), 18, 
-                             anchor_x="center", anchor_y="center", bold=True)
+            draw_text(self.message, width / 2, height / 2, (255, 255, 255), 18, 
+                      anchor_x="center", anchor_y="center", bold=True)
 
     def on_mouse_press(self, x, y, button, modifiers):
         self._handle_shop_item_click(x, y)
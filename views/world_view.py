@@ -0,0 +1,166 @@
+# views/world_view.py
+
+import arcade
+
+from config import (
+    OPEN_WORLD_TEMP_MAP, WORLD_TRIGGER_CODES, WORLD_TILE_SIZE,
+    WORLD_REGION_TILES, WORLD_PREFETCH_RADIUS,
+)
+from assets.characters.character_movement import CharacterMovement
+from utils.trigger_grid import TriggerGrid
+from utils.world_streaming import RegionStreamer
+from utils.text_cache import draw_text
+
+
+class OpenWorldView(arcade.View):
+    """
+    Mundo aberto: as regiões do mapa (tiles, triggers e perguntas) são
+    carregadas em segundo plano conforme o jogador se aproxima e
+    descartadas quando ficam para trás.
+    ESC volta para a view anterior.
+    """
+
+    def __init__(self, character_data: dict, parent: arcade.View = None, question_loader=None):
+        super().__init__()
+        self.character_data = character_data
+        self.parent = parent
+
+        self.streamer = RegionStreamer(
+            OPEN_WORLD_TEMP_MAP,
+            WORLD_TRIGGER_CODES,
+            region_tiles=WORLD_REGION_TILES,
+            prefetch_radius=WORLD_PREFETCH_RADIUS,
+            question_loader=question_loader,
+        )
+        self.trigger_grid = TriggerGrid(WORLD_TILE_SIZE)
+        self.near_trigger = None
+
+        self.player_sprite = None
+        self.player_list = arcade.SpriteList()
+        self.camera = None
+        self.gui_camera = None
+        self.facing_direction = "down"
+        self.spawned = False
+
+        self.keys = {
+            arcade.key.W: False,
+            arcade.key.A: False,
+            arcade.key.S: False,
+            arcade.key.D: False,
+        }
+
+    def setup(self):
+        """Cria o jogador e as câmeras; o mapa chega pela thread de carga"""
+        try:
+            self.player_sprite = CharacterMovement.create_character_sprite(self.character_data)
+        except Exception as e:
+            print(f"❌ Erro ao carregar sprite: {e}")
+            self.player_sprite = arcade.SpriteSolidColor(40, 60, arcade.color.GREEN)
+        self.player_list.append(self.player_sprite)
+
+        self.camera = arcade.camera.Camera2D()
+        self.gui_camera = arcade.camera.Camera2D()
+
+    def on_show_view(self):
+        arcade.set_background_color(arcade.color.BLACK)
+
+    def on_update(self, delta_time: float):
+        if not self.streamer.ready.is_set() or self.streamer.error:
+            return
+
+        if not self.spawned:
+            # começa no centro do mundo
+            self.player_sprite.center_x = self.streamer.width / 2
+            self.player_sprite.center_y = self.streamer.height / 2
+            self.spawned = True
+
+        new_x, new_y, direction, _ = CharacterMovement.update_movement(
+            self.player_sprite,
+            self.keys,
+            delta_time,
+            self.streamer.width,
+            self.streamer.height
+        )
+        self.player_sprite.center_x = new_x
+        self.player_sprite.center_y = new_y
+        if direction != self.facing_direction:
+            self.facing_direction = direction
+            CharacterMovement.update_sprite_texture(self.player_sprite, direction)
+
+        added, evicted = self.streamer.update(new_x, new_y)
+        for region in added:
+            for trig in region.triggers:
+                self.trigger_grid.add(trig)
+        for region in evicted:
+            for trig in region.triggers:
+                self.trigger_grid.remove(trig)
+
+        self.near_trigger = self.trigger_grid.find_hit(self.player_sprite)
+
+    def _update_camera(self):
+        """Segue o jogador sem mostrar além das bordas do mundo"""
+        half_w = self.camera.width / 2
+        half_h = self.camera.height / 2
+        x = min(max(self.player_sprite.center_x, half_w), max(half_w, self.streamer.width - half_w))
+        y = min(max(self.player_sprite.center_y, half_h), max(half_h, self.streamer.height - half_h))
+        self.camera.position = (x, y)
+
+    def on_draw(self):
+        self.clear()
+
+        if self.streamer.ready.is_set() and not self.streamer.error and self.spawned:
+            self._update_camera()
+            self.camera.use()
+            self.streamer.draw()
+            self.player_list.draw()
+            self.gui_camera.use()
+
+        self._draw_ui()
+
+    def _draw_ui(self):
+        if self.streamer.error:
+            texto = "❌ Mundo aberto indisponível - ESC para voltar"
+        elif not self.streamer.loaded:
+            texto = "🌍 Carregando mundo..."
+        elif self.near_trigger:
+            nome = self.near_trigger.region_name.replace("_", " ").title()
+            texto = f"📍 {nome}"
+        else:
+            texto = ""
+
+        if texto:
+            draw_text(
+                texto,
+                self.window.width / 2,
+                self.window.height - 50,
+                arcade.color.YELLOW,
+                18,
+                anchor_x="center",
+                bold=True
+            )
+
+        draw_text(
+            "WASD: Mover • ESC: Voltar",
+            self.window.width / 2,
+            30,
+            arcade.color.LIGHT_GRAY,
+            14,
+            anchor_x="center"
+        )
+
+    def on_key_press(self, key: int, modifiers: int):
+        if key in self.keys:
+            self.keys[key] = True
+        elif key == arcade.key.ESCAPE:
+            self.streamer.stop()
+            if self.parent:
+                self.window.show_view(self.parent)
+
+    def on_key_release(self, key: int, modifiers: int):
+        if key in self.keys:
+            self.keys[key] = False
+
+    def on_resize(self, width: int, height: int):
+        if self.camera:
+            self.camera.match_window()
+            self.gui_camera.match_window()